@@ -0,0 +1,64 @@
+"""JSON encoding for API payloads, using the fastest installed backend.
+
+Prefers orjson, then ujson, then the stdlib json module.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "fast" extra
+    orjson = None
+
+if orjson is None:
+    try:
+        import ujson
+    except ImportError:
+        ujson = None
+else:
+    ujson = None
+
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+elif ujson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes (orjson-compatible)."""
+        return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False).encode()
+
+    loads = ujson.loads
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize to compact UTF-8 JSON bytes (orjson-compatible)."""
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    loads = json.loads
+
+
+_encode_indented = json.JSONEncoder(indent=2, default=str, ensure_ascii=False).encode
+
+if orjson is not None:
+    # Datetimes and dataclasses go through default=str, as with the stdlib encoder
+    _ORJSON_INDENT = (
+        orjson.OPT_INDENT_2
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+    def dumps_indented(obj: Any) -> str:
+        """Serialize to human-readable JSON text with two-space indentation.
+
+        Values JSON can't represent are converted with str().
+        """
+        try:
+            return orjson.dumps(obj, default=str, option=_ORJSON_INDENT).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers wider than 64 bits
+            return _encode_indented(obj)
+else:
+    dumps_indented = _encode_indented
@@ -1,12 +1,30 @@
 """Authentication and token management for Docmost CLI."""
 
+import functools
 import os
+from pathlib import Path
 
 from docmost.config import get_config_dir
 
 TOKEN_FILE = get_config_dir() / "token"
 
 
+@functools.cache
+def _token_path(config_dir: Path) -> Path:
+    """Token file location inside a config directory."""
+    return config_dir / "token"
+
+
+@functools.lru_cache(maxsize=4)
+def _read_token_file(token_file: Path) -> str | None:
+    """Read a token file once per path; cleared by save_token/delete_token."""
+    try:
+        with open(token_file, encoding="utf-8") as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
 def get_token() -> str | None:
     """Get the stored access token.
 
@@ -17,16 +35,12 @@ def get_token() -> str | None:
         return env_token
 
     # Check token file
-    token_file = get_config_dir() / "token"
-    if token_file.exists():
-        return token_file.read_text().strip()
-
-    return None
+    return _read_token_file(_token_path(get_config_dir()))
 
 
 def save_token(token: str) -> None:
     """Save access token to file with secure permissions."""
-    token_file = get_config_dir() / "token"
+    token_file = _token_path(get_config_dir())
 
     # Write token
     token_file.write_text(token)
@@ -34,12 +48,17 @@ def save_token(token: str) -> None:
     # Set permissions to user-only read/write (600)
     token_file.chmod(0o600)
 
+    _read_token_file.cache_clear()
+
 
 def delete_token() -> None:
     """Delete the stored access token."""
-    token_file = get_config_dir() / "token"
-    if token_file.exists():
-        token_file.unlink()
+    try:
+        _token_path(get_config_dir()).unlink()
+    except FileNotFoundError:
+        pass
+
+    _read_token_file.cache_clear()
 
 
 def is_authenticated() -> bool:
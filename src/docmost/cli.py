@@ -1,34 +1,127 @@
 """Main CLI entry point for Docmost."""
 
+import functools
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import click
 
 from docmost import __version__
-from docmost.commands import auth, comments, groups, pages, search, spaces, users, workspace
-from docmost.config import load_config
+from docmost.config import get_default_format, get_default_space, get_url, load_config
+
+if TYPE_CHECKING:
+    from docmost.client import DocmostClient
+
+
+class LazyGroup(click.Group):
+    """Click group that imports command modules only when a command is used.
+
+    Commands are resolved from a static table with one dict lookup; the
+    command's module is imported on first use. The table also carries each
+    command's short help, so listing commands in --help imports nothing.
+    """
+
+    # name -> (module under docmost.commands, attribute, short help)
+    COMMANDS: dict[str, tuple[str, str, str]] = {
+        "comments": ("comments", "comments", "Manage comments."),
+        "groups": ("groups", "groups", "Manage groups."),
+        "login": ("auth", "login", "Login to Docmost and store access token."),
+        "logout": ("auth", "logout", "Remove stored access token."),
+        "pages": ("pages", "pages", "Manage pages."),
+        "search": ("search", "search", "Search pages and content."),
+        "spaces": ("spaces", "spaces", "Manage spaces."),
+        "suggest": ("search", "suggest", "Get search suggestions (autocomplete)."),
+        "users": ("users", "users", "Manage users."),
+        "workspace": ("workspace", "workspace", "Manage workspace."),
+    }
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        if not self.commands:
+            return sorted(self.COMMANDS)
+        return sorted({*self.commands, *self.COMMANDS})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        target = self.COMMANDS.get(cmd_name)
+        if target is None:
+            return super().get_command(ctx, cmd_name)
+        module = importlib.import_module(f"docmost.commands.{target[0]}")
+        return getattr(module, target[1])
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        """List commands with their short help, without importing table commands."""
+        names = self.list_commands(ctx)
+        limit = formatter.width - 6 - max(map(len, names), default=0)
+        rows = []
+        for name in names:
+            target = self.COMMANDS.get(name)
+            if target is not None:
+                rows.append((name, target[2]))
+                continue
+            cmd = self.commands.get(name)
+            if cmd is not None and not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
 
 
 class Context:
-    """CLI context object for passing configuration."""
+    """CLI context object for passing configuration.
+
+    The configuration is loaded at most once per invocation; commands read
+    url, format and space from here rather than calling load_config().
+    """
 
     def __init__(
         self, url: str | None = None, fmt: str | None = None, config_file: str | None = None
     ):
-        self.config = load_config()
+        self._url = url
+        self._fmt = fmt
+
+    @functools.cached_property
+    def config(self) -> dict[str, Any]:
+        """Configuration, loaded on first access and merged with CLI options."""
+        config = load_config()
 
         # Override with CLI options
-        if url:
-            self.config["url"] = url
-        if fmt:
-            self.config["default_format"] = fmt
+        if self._url:
+            config["url"] = self._url
+        if self._fmt:
+            config["default_format"] = self._fmt
+
+        return config
+
+    @property
+    def url(self) -> str | None:
+        return get_url(self.config)
+
+    @property
+    def format(self) -> str:
+        return get_default_format(self.config)
+
+    @property
+    def space(self) -> str | None:
+        return get_default_space(self.config)
 
-        self.url = self.config.get("url")
-        self.format = self.config.get("default_format", "table")
+    @functools.cached_property
+    def client(self) -> "DocmostClient":
+        """API client shared by every request in this invocation.
+
+        The connection pool is closed when the root command finishes.
+        """
+        from docmost.client import get_client
+
+        client = get_client(url=self.url)
+        click_ctx = click.get_current_context(silent=True)
+        if click_ctx is not None:
+            click_ctx.find_root().call_on_close(client.close)
+        return client
 
 
 pass_context = click.make_pass_decorator(Context, ensure=True)
 
 
-@click.group()
+@click.group(cls=LazyGroup)
 @click.option("--url", "-u", envvar="DOCMOST_URL", help="Docmost API URL")
 @click.option(
     "--format", "-f", "fmt", type=click.Choice(["json", "table", "plain"]), help="Output format"
@@ -41,18 +134,5 @@ def cli(ctx: click.Context, url: str | None, fmt: str | None, config_file: str |
     ctx.obj = Context(url=url, fmt=fmt, config_file=config_file)
 
 
-# Register command groups
-cli.add_command(auth.login)
-cli.add_command(auth.logout)
-cli.add_command(spaces.spaces)
-cli.add_command(pages.pages)
-cli.add_command(users.users)
-cli.add_command(workspace.workspace)
-cli.add_command(groups.groups)
-cli.add_command(comments.comments)
-cli.add_command(search.search)
-cli.add_command(search.suggest)
-
-
 if __name__ == "__main__":
     cli()
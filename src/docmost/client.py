@@ -1,12 +1,27 @@
 """HTTP client for Docmost API."""
 
-from typing import Any
+import asyncio
+import atexit
+import contextlib
+import importlib.util
+import math
+import os
+import tempfile
+from collections.abc import Iterator
+from typing import IO, Any
 
 import httpx
 
+from docmost._json import dumps as _json_dumps
+from docmost._json import loads as _json_loads
 from docmost.auth import get_token
 from docmost.config import get_url
 
+# HTTP/2 multiplexing needs the optional h2 package (the "http2" extra)
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+POOL_LIMITS = httpx.Limits(max_keepalive_connections=10, max_connections=20)
+
 
 class DocmostError(Exception):
     """Base exception for Docmost API errors."""
@@ -38,21 +53,86 @@ class ValidationError(DocmostError):
 class DocmostClient:
     """HTTP client for the Docmost API."""
 
-    def __init__(self, url: str | None = None, token: str | None = None, timeout: float = 30.0):
+    def __init__(
+        self,
+        url: str | None = None,
+        token: str | None = None,
+        timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+    ):
         """Initialize the client.
 
         Args:
             url: Base URL for the API. If not provided, loads from config.
             token: Access token. If not provided, loads from auth storage.
+                An empty string sends no Authorization header.
             timeout: Request timeout in seconds.
+            transport: Optional httpx transport, e.g. httpx.MockTransport in tests.
+                Also used for async requests if it supports them.
         """
         self.url = url or get_url()
-        self.token = token or get_token()
+        self.token = token if token is not None else get_token()
         self.timeout = timeout
+        self._transport = transport
+        # Endpoints seen returning the {"data", "success", "status"} envelope.
+        # Only positive results are remembered, so a miss always re-checks.
+        self._wrapped_endpoints: set[str] = set()
 
         if not self.url:
             raise DocmostError("No API URL configured. Set DOCMOST_URL or run 'docmost login'.")
 
+        # One pooled client per instance so keep-alive connections are reused
+        # across requests instead of paying a TCP/TLS handshake every call.
+        self._client = httpx.Client(
+            base_url=self.url,
+            headers=self._headers,
+            timeout=timeout,
+            limits=POOL_LIMITS,
+            http2=HTTP2_AVAILABLE,
+            transport=transport,
+        )
+
+    @property
+    def token(self) -> str | None:
+        """Access token sent as a Bearer credential."""
+        return self._token
+
+    @token.setter
+    def token(self, token: str | None) -> None:
+        # Headers are built here once rather than on every request
+        self._token = token
+        self._headers = {"Accept": "application/json"}
+        if token:
+            self._headers["Authorization"] = f"Bearer {token}"
+        self._json_headers = {**self._headers, "Content-Type": "application/json"}
+        self._form_headers = {
+            **self._headers,
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.headers = self._headers
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    @property
+    def is_closed(self) -> bool:
+        """Whether the connection pool has been closed."""
+        return self._client.is_closed
+
+    def __enter__(self) -> "DocmostClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+
     def _handle_binary_response(self, response: httpx.Response) -> bytes:
         """Handle API response that returns binary data (e.g., ZIP files).
 
@@ -61,6 +141,15 @@ class DocmostClient:
 
         Returns:
             Raw bytes from the response
+        """
+        self._check_binary_status(response)
+        return response.content
+
+    def _check_binary_status(self, response: httpx.Response) -> None:
+        """Raise for an error status on a binary response, without reading its body.
+
+        Args:
+            response: The HTTP response object
 
         Raises:
             AuthenticationError: If authentication fails
@@ -92,23 +181,23 @@ class DocmostClient:
                 status_code=response.status_code,
             )
 
-        return response.content
-
     def _get_headers(self) -> dict[str, str]:
         """Get request headers with authentication."""
-        headers = {
-            "Content-Type": "application/x-www-form-urlencoded",
-            "Accept": "application/json",
-        }
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
+        return self._form_headers
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Handle API response and raise appropriate errors."""
+    def _handle_response(
+        self, response: httpx.Response, endpoint: str | None = None
+    ) -> dict[str, Any]:
+        """Handle API response and raise appropriate errors.
+
+        Args:
+            response: The HTTP response object
+            endpoint: Endpoint the response came from, used to remember which
+                endpoints wrap their payload
+        """
         try:
-            data = response.json()
-        except Exception:
+            data = _json_loads(response.content)
+        except ValueError:
             data = {"error": response.text}
 
         if response.status_code == 401:
@@ -140,58 +229,66 @@ class DocmostClient:
             )
 
         # Unwrap response: {"data": {...}, "success": true, "status": 200} -> {...}
+        if endpoint in self._wrapped_endpoints and "data" in data:
+            return data["data"]
         if "data" in data and "success" in data and "status" in data:
+            if endpoint:
+                self._wrapped_endpoints.add(endpoint)
             return data["data"]
 
         return data
 
-    def post(self, endpoint: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a POST request to the API with JSON body.
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        json: Any = None,
+        form: dict[str, Any] | None = None,
+        files: dict[str, Any] | None = None,
+        stream: bool = False,
+    ) -> httpx.Response:
+        """Send a request through the pooled client.
+
+        JSON bodies are encoded once here; form and multipart bodies are left
+        to httpx so it can set the right Content-Type.
 
         Args:
-            endpoint: API endpoint (e.g., "/spaces/list")
-            data: Request body data
+            method: HTTP method
+            endpoint: API endpoint
+            json: JSON body (defaults to {} when no other body is given)
+            form: Form fields (urlencoded, or multipart fields alongside files)
+            files: Multipart files
+            stream: Leave the body unread; the caller must close the response
 
         Returns:
-            API response as dictionary
+            The raw HTTP response
         """
-        url = f"{self.url.rstrip('/')}{endpoint}"
-
-        headers = self._get_headers()
-        headers["Content-Type"] = "application/json"
-
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                url,
-                json=data or {},
-                headers=headers,
+        if files is not None:
+            request = self._client.build_request(method, endpoint, files=files, data=form or {})
+        elif form is not None:
+            request = self._client.build_request(
+                method, endpoint, data=form, headers=self._form_headers
             )
-            return self._handle_response(response)
+        else:
+            request = self._client.build_request(
+                method, endpoint, content=_json_dumps(json or {}), headers=self._json_headers
+            )
+        return self._client.send(request, stream=stream)
 
     def post_json(self, endpoint: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
-        """Make a POST request with JSON body.
-
-        Some endpoints may require JSON instead of urlencoded.
+        """Make a POST request to the API with JSON body.
 
         Args:
-            endpoint: API endpoint
+            endpoint: API endpoint (e.g., "/spaces/list")
             data: Request body data
 
         Returns:
             API response as dictionary
         """
-        url = f"{self.url.rstrip('/')}{endpoint}"
+        return self._handle_response(self._request("POST", endpoint, json=data), endpoint)
 
-        headers = self._get_headers()
-        headers["Content-Type"] = "application/json"
-
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                url,
-                json=data or {},
-                headers=headers,
-            )
-            return self._handle_response(response)
+    post = post_json
 
     def post_binary(self, endpoint: str, data: dict[str, Any] | None = None) -> bytes:
         """Make a POST request and return raw binary response.
@@ -205,18 +302,36 @@ class DocmostClient:
         Returns:
             Raw bytes from the response
         """
-        url = f"{self.url.rstrip('/')}{endpoint}"
+        return self._handle_binary_response(self._request("POST", endpoint, json=data))
 
-        headers = self._get_headers()
-        headers["Content-Type"] = "application/json"
+    @contextlib.contextmanager
+    def post_binary_stream(
+        self, endpoint: str, data: dict[str, Any] | None = None
+    ) -> Iterator[IO[bytes]]:
+        """Make a POST request and stream the binary response into a seekable file.
 
-        with httpx.Client(timeout=self.timeout) as client:
-            response = client.post(
-                url,
-                json=data or {},
-                headers=headers,
-            )
-            return self._handle_binary_response(response)
+        The body is copied chunk by chunk into an anonymous temporary file.
+        Unlike post_binary, no full bytes copy is held, and the file can be
+        handed straight to zipfile. (SpooledTemporaryFile is not used: before
+        Python 3.11 it has no seekable(), which zipfile requires.)
+
+        Args:
+            endpoint: API endpoint (e.g., "/pages/export")
+            data: Request body data
+
+        Yields:
+            Binary file positioned at the start of the response body
+        """
+        response = self._request("POST", endpoint, json=data, stream=True)
+        try:
+            self._check_binary_status(response)
+            with tempfile.TemporaryFile() as body:
+                for chunk in response.iter_bytes():
+                    body.write(chunk)
+                body.seek(0)
+                yield body
+        finally:
+            response.close()
 
     def upload_file(
         self, endpoint: str, file_path: str, form_data: dict[str, Any] | None = None
@@ -231,37 +346,179 @@ class DocmostClient:
         Returns:
             API response as dictionary
         """
-        import os
-
-        url = f"{self.url.rstrip('/')}{endpoint}"
-
-        # Auth header only (no Content-Type, httpx will set it for multipart)
-        headers = {}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-
+        # No Content-Type here: httpx sets the multipart boundary itself.
+        # The open file is streamed in chunks rather than read into memory, and
+        # httpx sizes it via fstat so the request keeps a Content-Length (an
+        # mmap would force chunked transfer encoding instead).
         with open(file_path, "rb") as f:
             filename = os.path.basename(file_path)
             files = {"file": (filename, f, "text/markdown")}
+            response = self._request("POST", endpoint, files=files, form=form_data)
+            return self._handle_response(response, endpoint)
+
+    def upload_bytes(
+        self,
+        endpoint: str,
+        filename: str,
+        content: bytes,
+        form_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Upload in-memory content as a multipart file, without touching disk.
 
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    url,
-                    files=files,
-                    data=form_data or {},
-                    headers=headers,
-                )
-                return self._handle_response(response)
+        Args:
+            endpoint: API endpoint (e.g., "/pages/import")
+            filename: Filename to report for the uploaded part
+            content: File content
+            form_data: Additional form fields to send
+
+        Returns:
+            API response as dictionary
+        """
+        files = {"file": (filename, content, "text/markdown")}
+        response = self._request("POST", endpoint, files=files, form=form_data)
+        return self._handle_response(response, endpoint)
+
+    async def paginate_async(
+        self,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        page_size: int = 50,
+        items_key: str = "items",
+        window: int = 4,
+    ) -> list[Any]:
+        """Fetch every page of a paginated list endpoint.
+
+        The first page is fetched on its own, so a one-page listing costs one
+        request. After that, pages are requested concurrently in batches that
+        double up to ``window`` until one reports no next page; a ``meta.total``
+        on the first page keeps batches from going past the last page.
+
+        Args:
+            endpoint: API endpoint (e.g., "/comments")
+            data: Request body without page/limit
+            page_size: Items per page
+            items_key: Key holding the items in each page response
+            window: Number of pages requested concurrently
+
+        Returns:
+            Items from all pages, in page order
+        """
+        items: list[Any] = []
+
+        async with self._async_client() as client:
+
+            async def fetch(page: int) -> dict[str, Any]:
+                body = {**(data or {}), "page": page, "limit": page_size}
+                response = await client.post(endpoint, content=_json_dumps(body))
+                return self._handle_response(response, endpoint)
+
+            first = await fetch(1)
+            last_page = _last_page(first, page_size)
+            pages = [first]
+            next_page = 2
+            batch = 1
+            while True:
+                for result in pages:
+                    page_items = result if isinstance(result, list) else result.get(items_key, [])
+                    items.extend(page_items)
+                    if not _has_next_page(result, page_items, page_size):
+                        return items
+                stop = min(next_page + batch, last_page + 1)
+                if stop <= next_page:
+                    return items
+                pages = await asyncio.gather(*(fetch(page) for page in range(next_page, stop)))
+                next_page = stop
+                batch = min(batch * 2, window)
+
+    async def post_many_async(
+        self, endpoint: str, payloads: list[dict[str, Any]], return_errors: bool = False
+    ) -> list[Any]:
+        """POST several payloads to one endpoint concurrently.
+
+        With HTTP/2 available the requests are multiplexed over a single
+        connection; otherwise they share a keep-alive pool.
+
+        Args:
+            endpoint: API endpoint (e.g., "/groups/info")
+            payloads: One request body per call
+            return_errors: Return a DocmostError in place of a failed call's
+                response instead of raising the first one
+
+        Returns:
+            API responses, in the same order as payloads
+        """
+        async with self._async_client() as client:
+
+            async def post_one(data: dict[str, Any]) -> Any:
+                response = await client.post(endpoint, content=_json_dumps(data))
+                try:
+                    return self._handle_response(response, endpoint)
+                except DocmostError as e:
+                    if return_errors:
+                        return e
+                    raise
+
+            return list(await asyncio.gather(*(post_one(data) for data in payloads)))
+
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an async client with the same settings as the pooled client."""
+        return httpx.AsyncClient(
+            base_url=self.url,
+            headers=self._json_headers,
+            timeout=self.timeout,
+            limits=POOL_LIMITS,
+            http2=HTTP2_AVAILABLE,
+            transport=(
+                self._transport if isinstance(self._transport, httpx.AsyncBaseTransport) else None
+            ),
+        )
+
+
+def _has_next_page(result: Any, page_items: list[Any], page_size: int) -> bool:
+    """Decide whether a paginated response has more pages after it."""
+    meta = result.get("meta") if isinstance(result, dict) else None
+    if isinstance(meta, dict) and "hasNextPage" in meta:
+        return bool(meta["hasNextPage"])
+    # No pagination metadata: a short page is the last one
+    return len(page_items) >= page_size > 0
+
+
+def _last_page(result: Any, page_size: int) -> int | float:
+    """Last page number implied by a response's ``meta.total``, or infinity if unknown."""
+    meta = result.get("meta") if isinstance(result, dict) else None
+    total = meta.get("total") if isinstance(meta, dict) else None
+    if not isinstance(total, int) or page_size <= 0:
+        return math.inf
+    return max(1, -(-total // page_size))
+
+
+# Pooled clients keyed by resolved (url, token); closed ones are replaced
+_clients: dict[tuple[str | None, str | None], DocmostClient] = {}
+
+
+@atexit.register
+def _close_pooled_clients() -> None:
+    """Close every pooled client's connections at interpreter exit."""
+    for client in _clients.values():
+        client.close()
+    _clients.clear()
 
 
 def get_client(url: str | None = None, token: str | None = None) -> DocmostClient:
     """Get a configured Docmost client.
 
+    Clients are cached per resolved (url, token) pair, so repeated calls within
+    a process reuse the same keep-alive connection pool.
+
     Args:
         url: Optional API URL override
-        token: Optional token override
+        token: Optional token override; "" for unauthenticated requests
 
     Returns:
         Configured DocmostClient instance
     """
-    return DocmostClient(url=url, token=token)
+    key = (url or get_url(), token if token is not None else get_token())
+    client = _clients.get(key)
+    if client is None or client.is_closed:
+        client = _clients[key] = DocmostClient(url=key[0], token=key[1])
+    return client
@@ -0,0 +1,75 @@
+"""Helpers shared by command modules."""
+
+import functools
+import re
+from collections.abc import Callable, Iterator
+from typing import IO, Any, TypeVar
+
+import click
+
+T = TypeVar("T")
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Comma separator with any surrounding whitespace
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+
+def split_csv(values: str) -> list[str]:
+    """Split a comma-separated option into trimmed, non-empty values."""
+    return [v for v in _CSV_SPLIT.split(values.strip()) if v]
+
+
+def collect_values(values: str | None, file: IO[str] | None = None) -> list[str]:
+    """Collect IDs or emails from a comma-separated option and/or a file.
+
+    Args:
+        values: Comma-separated values from the command line
+        file: Open text file with one value per line (blank lines are skipped)
+
+    Returns:
+        Values in the order given, option values first
+    """
+    collected = split_csv(values) if values else []
+    if file is not None:
+        collected.extend(line.strip() for line in file if line.strip())
+    return collected
+
+
+def compact_payload(**fields: Any) -> dict[str, Any]:
+    """Build a request body from the given fields, leaving out unset ones.
+
+    None and empty strings are dropped, matching how optional CLI options
+    that were not given (or given empty) are left out of API requests.
+    """
+    return {key: value for key, value in fields.items() if value is not None and value != ""}
+
+
+def batched(items: list[T], size: int) -> Iterator[list[T]]:
+    """Yield successive slices of at most size items (itertools.batched is 3.12+)."""
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+force_option = click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+
+_page_option = click.option("--page", "-p", type=int, default=1, help="Page number")
+
+
+@functools.cache
+def paginated(default_limit: int = 50) -> Callable[[F], F]:
+    """Decorator adding the shared --page/-p and --limit/-l options.
+
+    Args:
+        default_limit: Default for --limit
+
+    Returns:
+        A decorator, shared by every command with the same default
+    """
+    limit_option = click.option(
+        "--limit", "-l", type=int, default=default_limit, help="Items per page"
+    )
+
+    def decorator(f: F) -> F:
+        return _page_option(limit_option(f))
+
+    return decorator
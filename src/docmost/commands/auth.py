@@ -1,5 +1,10 @@
 """Authentication commands for Docmost CLI."""
 
+import functools
+import operator
+import re
+from typing import Any
+
 import click
 import httpx
 
@@ -7,6 +12,44 @@ from docmost import auth as auth_module
 from docmost.config import get_config_dir, load_config, save_config
 from docmost.output import error, success
 
+# Set-Cookie value carrying the access token, e.g. b"authToken=<jwt>; Path=/; HttpOnly"
+_AUTH_TOKEN_RE = re.compile(rb"\s*authToken=([^;]+)")
+
+
+# Where login responses may carry the token, in order of preference
+TOKEN_PATHS: tuple[tuple[str, ...], ...] = (
+    ("data", "tokens", "accessToken"),
+    ("data", "tokens", "access_token"),
+    ("token",),
+    ("accessToken",),
+    ("access_token",),
+)
+
+
+def _token_from_body(data: Any) -> str | None:
+    """Return the first non-empty token found along TOKEN_PATHS."""
+    for path in TOKEN_PATHS:
+        try:
+            token = functools.reduce(operator.getitem, path, data)
+        except (KeyError, TypeError, IndexError):
+            continue
+        if token:
+            return token
+    return None
+
+
+def _token_from_cookies(response: httpx.Response) -> str | None:
+    """Return the authToken set by a response's Set-Cookie headers, if any."""
+    for name, value in response.headers.raw:
+        if name.lower() == b"set-cookie" and (match := _AUTH_TOKEN_RE.match(value)):
+            return match.group(1).strip().decode()
+    return None
+
+
+def _make_client() -> httpx.Client:
+    """HTTP client used for the login request (replaced in tests)."""
+    return httpx.Client(timeout=30.0)
+
 
 @click.command()
 @click.option(
@@ -25,7 +68,7 @@ def login(url: str, email: str, password: str) -> None:
         api_url = f"{api_url}/api"
 
     try:
-        with httpx.Client(timeout=30.0) as client:
+        with _make_client() as client:
             response = client.post(
                 f"{api_url}/auth/login",
                 data={"email": email, "password": password},
@@ -41,21 +84,11 @@ def login(url: str, email: str, password: str) -> None:
                 raise SystemExit(1)
 
             # Token is returned in Set-Cookie header as authToken
-            token = None
-            auth_cookie = response.cookies.get("authToken")
-            if auth_cookie:
-                token = auth_cookie
+            token = _token_from_cookies(response)
 
             # Fallback: check response body (various formats)
             if not token:
-                data = response.json()
-                # Handle nested response: data.tokens.accessToken
-                if "data" in data and isinstance(data["data"], dict):
-                    tokens = data["data"].get("tokens", {})
-                    token = tokens.get("accessToken") or tokens.get("access_token")
-                # Fallback to top-level keys
-                if not token:
-                    token = data.get("token") or data.get("accessToken") or data.get("access_token")
+                token = _token_from_body(response.json())
 
             if not token:
                 error("No token received from server")
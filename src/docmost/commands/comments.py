@@ -1,9 +1,11 @@
 """Comments commands for Docmost CLI."""
 
+import asyncio
+
 import click
 
-from docmost.client import DocmostError, get_client
-from docmost.output import error, output, success
+from docmost.commands._common import compact_payload, force_option, paginated, split_csv
+from docmost.output import error, handle_docmost_errors, output, success, unwrap_list
 
 
 @click.group()
@@ -15,44 +17,64 @@ def comments() -> None:
 @comments.command("info")
 @click.argument("comment_id")
 @click.pass_context
+@handle_docmost_errors
 def comment_info(ctx: click.Context, comment_id: str) -> None:
     """Get comment information."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/comments/info", {"commentId": comment_id})
-        output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/comments/info", {"commentId": comment_id})
+    output(result, ctx.obj.format)
 
 
 @comments.command("list")
-@click.argument("page_id")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=50, help="Items per page")
+@click.argument("page_id", required=False)
+@click.option("--page-ids", help="Comma-separated page IDs to list comments for in one batch")
+@paginated()
+@click.option("--all", "all_pages", is_flag=True, help="Fetch all pages")
 @click.pass_context
-def list_comments(ctx: click.Context, page_id: str, page: int, limit: int) -> None:
+@handle_docmost_errors
+def list_comments(
+    ctx: click.Context,
+    page_id: str | None,
+    page_ids: str | None,
+    page: int,
+    limit: int,
+    all_pages: bool,
+) -> None:
     """List comments on a page."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/comments", {"pageId": page_id, "page": page, "limit": limit})
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            comments_data = result
-        else:
-            comments_data = result.get("items", result.get("comments", result))
-        if isinstance(comments_data, list):
-            output(
-                comments_data,
-                ctx.obj.format,
-                columns=["id", "content", "creatorId", "resolved", "createdAt"],
-            )
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
+    if not page_id and not page_ids:
+        error("Either PAGE_ID or --page-ids must be provided")
+        raise SystemExit(1)
+    if page_ids and all_pages:
+        error("--all cannot be combined with --page-ids")
         raise SystemExit(1)
 
+    client = ctx.obj.client
+    if page_ids:
+        payloads = [{"pageId": pid, "page": page, "limit": limit} for pid in split_csv(page_ids)]
+        responses = asyncio.run(client.post_many_async("/comments", payloads))
+        result = [
+            item
+            for response in responses
+            for item in (
+                response
+                if isinstance(response, list)
+                else response.get("items") or response.get("comments") or []
+            )
+        ]
+    elif all_pages:
+        result = asyncio.run(client.paginate_async("/comments", {"pageId": page_id}, limit))
+    else:
+        result = client.post("/comments", {"pageId": page_id, "page": page, "limit": limit})
+    comments_data = unwrap_list(result, "items", "comments")
+    if isinstance(comments_data, list):
+        output(
+            comments_data,
+            ctx.obj.format,
+            columns=["id", "content", "creatorId", "resolved", "createdAt"],
+        )
+    else:
+        output(result, ctx.obj.format)
+
 
 @comments.command("create")
 @click.argument("page_id")
@@ -60,6 +82,7 @@ def list_comments(ctx: click.Context, page_id: str, page: int, limit: int) -> No
 @click.option("--selection", "-s", help="Text selection (JSON)")
 @click.option("--parent-id", "-p", help="Parent comment ID for replies")
 @click.pass_context
+@handle_docmost_errors
 def create_comment(
     ctx: click.Context,
     page_id: str,
@@ -68,35 +91,26 @@ def create_comment(
     parent_id: str | None,
 ) -> None:
     """Create a comment on a page."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str] = {"pageId": page_id, "content": content}
-        if selection:
-            data["selection"] = selection
-        if parent_id:
-            data["parentCommentId"] = parent_id
-        result = client.post("/comments/create", data)
-        output(result, ctx.obj.format)
-        success("Comment created")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(
+        pageId=page_id, content=content, selection=selection, parentCommentId=parent_id
+    )
+    result = client.post("/comments/create", data)
+    output(result, ctx.obj.format)
+    success("Comment created")
 
 
 @comments.command("update")
 @click.argument("comment_id")
 @click.option("--content", "-c", required=True, help="New comment content")
 @click.pass_context
+@handle_docmost_errors
 def update_comment(ctx: click.Context, comment_id: str, content: str) -> None:
     """Update a comment."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/comments/update", {"id": comment_id, "content": content})
-        output(result, ctx.obj.format)
-        success("Comment updated")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/comments/update", {"id": comment_id, "content": content})
+    output(result, ctx.obj.format)
+    success("Comment updated")
 
 
 @comments.command("resolve")
@@ -105,29 +119,27 @@ def update_comment(ctx: click.Context, comment_id: str, content: str) -> None:
     "--resolved/--unresolved", "-r/-u", default=True, help="Set resolved status (default: resolved)"
 )
 @click.pass_context
+@handle_docmost_errors
 def resolve_comment(ctx: click.Context, comment_id: str, resolved: bool) -> None:
     """Resolve or unresolve a comment."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post(
-            "/comments/resolve",
-            {
-                "commentId": comment_id,
-                "resolved": str(resolved).lower(),
-            },
-        )
-        output(result, ctx.obj.format)
-        status = "resolved" if resolved else "unresolved"
-        success(f"Comment {status}")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post(
+        "/comments/resolve",
+        {
+            "commentId": comment_id,
+            "resolved": "true" if resolved else "false",
+        },
+    )
+    output(result, ctx.obj.format)
+    status = "resolved" if resolved else "unresolved"
+    success(f"Comment {status}")
 
 
 @comments.command("delete")
 @click.argument("comment_id")
-@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@force_option
 @click.pass_context
+@handle_docmost_errors
 def delete_comment(ctx: click.Context, comment_id: str, force: bool) -> None:
     """Delete a comment."""
     if not force:
@@ -135,10 +147,6 @@ def delete_comment(ctx: click.Context, comment_id: str, force: bool) -> None:
             click.echo("Cancelled")
             return
 
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/comments/delete", {"commentId": comment_id})
-        success("Comment deleted")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    client.post("/comments/delete", {"commentId": comment_id})
+    success("Comment deleted")
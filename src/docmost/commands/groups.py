@@ -1,9 +1,11 @@
 """Groups commands for Docmost CLI."""
 
+import asyncio
+
 import click
 
-from docmost.client import DocmostError, get_client
-from docmost.output import error, output, success
+from docmost.commands._common import compact_payload, force_option, paginated, split_csv
+from docmost.output import error, handle_docmost_errors, output, success, unwrap_list
 
 
 @click.group()
@@ -14,64 +16,60 @@ def groups() -> None:
 
 @groups.command("list")
 @click.option("--query", "-q", help="Search query")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=50, help="Items per page")
+@paginated()
+@click.option("--all", "all_pages", is_flag=True, help="Fetch all pages")
 @click.pass_context
-def list_groups(ctx: click.Context, query: str | None, page: int, limit: int) -> None:
+@handle_docmost_errors
+def list_groups(
+    ctx: click.Context, query: str | None, page: int, limit: int, all_pages: bool
+) -> None:
     """List all groups."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str | int] = {"page": page, "limit": limit}
-        if query:
-            data["query"] = query
-        result = client.post("/groups", data)
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            groups_data = result
-        else:
-            groups_data = result.get("items", result.get("groups", result))
-        if isinstance(groups_data, list):
-            output(
-                groups_data, ctx.obj.format, columns=["id", "name", "description", "memberCount"]
-            )
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(query=query)
+    if all_pages:
+        result = asyncio.run(client.paginate_async("/groups", data, limit))
+    else:
+        result = client.post("/groups", {**data, "page": page, "limit": limit})
+    groups_data = unwrap_list(result, "items", "groups")
+    if isinstance(groups_data, list):
+        output(groups_data, ctx.obj.format, columns=["id", "name", "description", "memberCount"])
+    else:
+        output(result, ctx.obj.format)
 
 
 @groups.command("info")
-@click.argument("group_id")
+@click.argument("group_id", required=False)
+@click.option("--ids", help="Comma-separated group IDs to fetch in one batch")
 @click.pass_context
-def group_info(ctx: click.Context, group_id: str) -> None:
+@handle_docmost_errors
+def group_info(ctx: click.Context, group_id: str | None, ids: str | None) -> None:
     """Get group information."""
-    try:
-        client = get_client(url=ctx.obj.url)
+    if not group_id and not ids:
+        error("Either GROUP_ID or --ids must be provided")
+        raise SystemExit(1)
+
+    client = ctx.obj.client
+    if ids:
+        payloads = [{"groupId": gid} for gid in split_csv(ids)]
+        results = asyncio.run(client.post_many_async("/groups/info", payloads))
+        output(results, ctx.obj.format, columns=["id", "name", "description", "memberCount"])
+    else:
         result = client.post("/groups/info", {"groupId": group_id})
         output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
 
 
 @groups.command("create")
 @click.option("--name", "-n", required=True, help="Group name")
 @click.option("--description", "-d", help="Group description")
 @click.pass_context
+@handle_docmost_errors
 def create_group(ctx: click.Context, name: str, description: str | None) -> None:
     """Create a new group."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str] = {"name": name}
-        if description:
-            data["description"] = description
-        result = client.post("/groups/create", data)
-        output(result, ctx.obj.format)
-        success(f"Group '{name}' created")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(name=name, description=description)
+    result = client.post("/groups/create", data)
+    output(result, ctx.obj.format)
+    success(f"Group '{name}' created")
 
 
 @groups.command("update")
@@ -79,29 +77,23 @@ def create_group(ctx: click.Context, name: str, description: str | None) -> None
 @click.option("--name", "-n", help="New group name")
 @click.option("--description", "-d", help="New group description")
 @click.pass_context
+@handle_docmost_errors
 def update_group(
     ctx: click.Context, group_id: str, name: str | None, description: str | None
 ) -> None:
     """Update a group."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str] = {"groupId": group_id}
-        if name:
-            data["name"] = name
-        if description:
-            data["description"] = description
-        result = client.post("/groups/update", data)
-        output(result, ctx.obj.format)
-        success(f"Group '{group_id}' updated")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(groupId=group_id, name=name, description=description)
+    result = client.post("/groups/update", data)
+    output(result, ctx.obj.format)
+    success(f"Group '{group_id}' updated")
 
 
 @groups.command("delete")
 @click.argument("group_id")
-@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@force_option
 @click.pass_context
+@handle_docmost_errors
 def delete_group(ctx: click.Context, group_id: str, force: bool) -> None:
     """Delete a group."""
     if not force:
@@ -109,72 +101,60 @@ def delete_group(ctx: click.Context, group_id: str, force: bool) -> None:
             click.echo("Cancelled")
             return
 
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/groups/delete", {"groupId": group_id})
-        success(f"Group '{group_id}' deleted")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    client.post("/groups/delete", {"groupId": group_id})
+    success(f"Group '{group_id}' deleted")
 
 
 @groups.command("members")
 @click.argument("group_id")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=50, help="Items per page")
+@paginated()
+@click.option("--all", "all_pages", is_flag=True, help="Fetch all pages")
 @click.pass_context
-def group_members(ctx: click.Context, group_id: str, page: int, limit: int) -> None:
+@handle_docmost_errors
+def group_members(
+    ctx: click.Context, group_id: str, page: int, limit: int, all_pages: bool
+) -> None:
     """List group members."""
-    try:
-        client = get_client(url=ctx.obj.url)
+    client = ctx.obj.client
+    if all_pages:
+        result = asyncio.run(client.paginate_async("/groups/members", {"groupId": group_id}, limit))
+    else:
         result = client.post("/groups/members", {"groupId": group_id, "page": page, "limit": limit})
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            members = result
-        else:
-            members = result.get("items", result.get("members", result))
-        if isinstance(members, list):
-            output(members, ctx.obj.format, columns=["id", "name", "email"])
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    members = unwrap_list(result, "items", "members")
+    if isinstance(members, list):
+        output(members, ctx.obj.format, columns=["id", "name", "email"])
+    else:
+        output(result, ctx.obj.format)
 
 
 @groups.command("members-add")
 @click.argument("group_id")
 @click.option("--user-ids", "-u", required=True, help="Comma-separated user IDs")
 @click.pass_context
+@handle_docmost_errors
 def add_members(ctx: click.Context, group_id: str, user_ids: str) -> None:
     """Add members to a group."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        ids = [uid.strip() for uid in user_ids.split(",")]
-        result = client.post(
-            "/groups/members/add",
-            {
-                "groupId": group_id,
-                "userIds": ids,
-            },
-        )
-        output(result, ctx.obj.format)
-        success(f"Added {len(ids)} member(s) to group '{group_id}'")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    ids = split_csv(user_ids)
+    result = client.post(
+        "/groups/members/add",
+        {
+            "groupId": group_id,
+            "userIds": ids,
+        },
+    )
+    output(result, ctx.obj.format)
+    success(f"Added {len(ids)} member(s) to group '{group_id}'")
 
 
 @groups.command("members-remove")
 @click.argument("group_id")
 @click.option("--user-id", "-u", required=True, help="User ID to remove")
 @click.pass_context
+@handle_docmost_errors
 def remove_member(ctx: click.Context, group_id: str, user_id: str) -> None:
     """Remove a member from a group."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/groups/members/remove", {"groupId": group_id, "userId": user_id})
-        success(f"Removed user '{user_id}' from group '{group_id}'")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    client.post("/groups/members/remove", {"groupId": group_id, "userId": user_id})
+    success(f"Removed user '{user_id}' from group '{group_id}'")
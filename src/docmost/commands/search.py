@@ -2,36 +2,26 @@
 
 import click
 
-from docmost.client import DocmostError, get_client
-from docmost.output import error, output
+from docmost.commands._common import compact_payload, paginated
+from docmost.output import handle_docmost_errors, output, output_stream, unwrap_list
 
 
 @click.command()
 @click.argument("query")
 @click.option("--space-id", "-s", help="Filter by space ID")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=20, help="Items per page")
+@paginated(20)
 @click.pass_context
+@handle_docmost_errors
 def search(ctx: click.Context, query: str, space_id: str | None, page: int, limit: int) -> None:
     """Search pages and content."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str | int] = {"query": query, "page": page, "limit": limit}
-        if space_id:
-            data["spaceId"] = space_id
-        result = client.post("/search", data)
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            results = result
-        else:
-            results = result.get("items", result.get("results", result))
-        if isinstance(results, list):
-            output(results, ctx.obj.format, columns=["id", "title", "spaceId", "highlight"])
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(query=query, page=page, limit=limit, spaceId=space_id)
+    result = client.post("/search", data)
+    results = unwrap_list(result, "items", "results")
+    if isinstance(results, list):
+        output_stream(results, ctx.obj.format, columns=["id", "title", "spaceId", "highlight"])
+    else:
+        output(result, ctx.obj.format)
 
 
 @click.command("suggest")
@@ -43,25 +33,18 @@ def search(ctx: click.Context, query: str, space_id: str | None, page: int, limi
     "--include-groups/--no-include-groups", "-g", default=False, help="Include groups in results"
 )
 @click.pass_context
+@handle_docmost_errors
 def suggest(ctx: click.Context, query: str, include_users: bool, include_groups: bool) -> None:
     """Get search suggestions (autocomplete)."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str | bool] = {"query": query}
-        if include_users:
-            data["includeUsers"] = True
-        if include_groups:
-            data["includeGroups"] = True
-        result = client.post("/search/suggest", data)
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            suggestions = result
-        else:
-            suggestions = result.get("items", result.get("suggestions", result))
-        if isinstance(suggestions, list):
-            output(suggestions, ctx.obj.format, columns=["id", "title", "type"])
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data: dict[str, str | bool] = {"query": query}
+    if include_users:
+        data["includeUsers"] = True
+    if include_groups:
+        data["includeGroups"] = True
+    result = client.post("/search/suggest", data)
+    suggestions = unwrap_list(result, "items", "suggestions")
+    if isinstance(suggestions, list):
+        output(suggestions, ctx.obj.format, columns=["id", "title", "type"])
+    else:
+        output(result, ctx.obj.format)
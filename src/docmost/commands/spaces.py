@@ -1,9 +1,20 @@
 """Spaces commands for Docmost CLI."""
 
+import asyncio
+from typing import IO
+
 import click
 
-from docmost.client import DocmostError, get_client
-from docmost.output import error, output, success
+from docmost.client import DocmostError
+from docmost.commands._common import (
+    batched,
+    collect_values,
+    compact_payload,
+    force_option,
+    paginated,
+    split_csv,
+)
+from docmost.output import error, handle_docmost_errors, output, success, unwrap_list
 
 
 @click.group()
@@ -13,40 +24,29 @@ def spaces() -> None:
 
 
 @spaces.command("list")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=50, help="Items per page")
+@paginated()
 @click.pass_context
+@handle_docmost_errors
 def list_spaces(ctx: click.Context, page: int, limit: int) -> None:
     """List all spaces."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/spaces", {"page": page, "limit": limit})
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            spaces_data = result
-        else:
-            spaces_data = result.get("items", result.get("spaces", result))
-        if isinstance(spaces_data, list):
-            output(spaces_data, ctx.obj.format, columns=["id", "name", "slug", "description"])
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/spaces", {"page": page, "limit": limit})
+    spaces_data = unwrap_list(result, "items", "spaces")
+    if isinstance(spaces_data, list):
+        output(spaces_data, ctx.obj.format, columns=["id", "name", "slug", "description"])
+    else:
+        output(result, ctx.obj.format)
 
 
 @spaces.command("info")
 @click.argument("space_id")
 @click.pass_context
+@handle_docmost_errors
 def space_info(ctx: click.Context, space_id: str) -> None:
     """Get space information."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/spaces/info", {"spaceId": space_id})
-        output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/spaces/info", {"spaceId": space_id})
+    output(result, ctx.obj.format)
 
 
 @spaces.command("create")
@@ -54,19 +54,14 @@ def space_info(ctx: click.Context, space_id: str) -> None:
 @click.option("--slug", "-s", required=True, help="Space slug (URL identifier)")
 @click.option("--description", "-d", help="Space description")
 @click.pass_context
+@handle_docmost_errors
 def create_space(ctx: click.Context, name: str, slug: str, description: str | None) -> None:
     """Create a new space."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data = {"name": name, "slug": slug}
-        if description:
-            data["description"] = description
-        result = client.post("/spaces/create", data)
-        output(result, ctx.obj.format)
-        success(f"Space '{name}' created")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(name=name, slug=slug, description=description)
+    result = client.post("/spaces/create", data)
+    output(result, ctx.obj.format)
+    success(f"Space '{name}' created")
 
 
 @spaces.command("update")
@@ -75,31 +70,23 @@ def create_space(ctx: click.Context, name: str, slug: str, description: str | No
 @click.option("--description", "-d", help="New space description")
 @click.option("--icon", help="Space icon")
 @click.pass_context
+@handle_docmost_errors
 def update_space(
     ctx: click.Context, space_id: str, name: str | None, description: str | None, icon: str | None
 ) -> None:
     """Update a space."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str] = {"spaceId": space_id}
-        if name:
-            data["name"] = name
-        if description:
-            data["description"] = description
-        if icon:
-            data["icon"] = icon
-        result = client.post("/spaces/update", data)
-        output(result, ctx.obj.format)
-        success(f"Space '{space_id}' updated")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(spaceId=space_id, name=name, description=description, icon=icon)
+    result = client.post("/spaces/update", data)
+    output(result, ctx.obj.format)
+    success(f"Space '{space_id}' updated")
 
 
 @spaces.command("delete")
 @click.argument("space_id")
-@click.option("--force", "-f", is_flag=True, help="Skip confirmation")
+@force_option
 @click.pass_context
+@handle_docmost_errors
 def delete_space(ctx: click.Context, space_id: str, force: bool) -> None:
     """Delete a space."""
     if not force:
@@ -107,76 +94,115 @@ def delete_space(ctx: click.Context, space_id: str, force: bool) -> None:
             click.echo("Cancelled")
             return
 
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/spaces/delete", {"spaceId": space_id})
-        success(f"Space '{space_id}' deleted")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    client.post("/spaces/delete", {"spaceId": space_id})
+    success(f"Space '{space_id}' deleted")
 
 
 @spaces.command("members")
 @click.argument("space_id")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=50, help="Items per page")
+@paginated()
 @click.pass_context
+@handle_docmost_errors
 def space_members(ctx: click.Context, space_id: str, page: int, limit: int) -> None:
     """List space members."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/spaces/members", {"spaceId": space_id, "page": page, "limit": limit})
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            members = result
-        else:
-            members = result.get("items", result.get("members", result))
-        if isinstance(members, list):
-            output(members, ctx.obj.format, columns=["id", "name", "email", "role"])
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/spaces/members", {"spaceId": space_id, "page": page, "limit": limit})
+    members = unwrap_list(result, "items", "members")
+    if isinstance(members, list):
+        output(members, ctx.obj.format, columns=["id", "name", "email", "role"])
+    else:
+        output(result, ctx.obj.format)
 
 
 @spaces.command("members-add")
 @click.argument("space_id")
-@click.option("--user-ids", "-u", required=True, help="Comma-separated user IDs")
+@click.option("--user-ids", "-u", help="Comma-separated user IDs")
+@click.option(
+    "--file",
+    "ids_file",
+    type=click.File("r"),
+    help="File with one user ID per line ('-' for stdin)",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help="User IDs sent per request",
+)
 @click.option("--role", "-r", default="member", help="Role for users (default: member)")
 @click.pass_context
-def add_members(ctx: click.Context, space_id: str, user_ids: str, role: str) -> None:
-    """Add members to a space."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        ids = [uid.strip() for uid in user_ids.split(",")]
-        result = client.post(
+@handle_docmost_errors
+def add_members(
+    ctx: click.Context,
+    space_id: str,
+    user_ids: str | None,
+    ids_file: IO[str] | None,
+    batch_size: int,
+    role: str,
+) -> None:
+    """Add members to a space.
+
+    Large lists are sent in batches of --batch-size over one connection.
+    """
+    ids = collect_values(user_ids, ids_file)
+    if not ids:
+        error("Either --user-ids or --file must provide at least one user ID")
+        raise SystemExit(1)
+
+    client = ctx.obj.client
+    results = [
+        client.post(
             "/spaces/members/add",
             {
                 "spaceId": space_id,
-                "userIds": ids,
+                "userIds": chunk,
                 "role": role,
             },
         )
-        output(result, ctx.obj.format)
+        for chunk in batched(ids, batch_size)
+    ]
+    output(results[0] if len(results) == 1 else results, ctx.obj.format)
+    if len(results) == 1:
         success(f"Added {len(ids)} member(s) to space '{space_id}'")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    else:
+        success(f"Added {len(ids)} member(s) to space '{space_id}' in {len(results)} batches")
 
 
 @spaces.command("members-remove")
 @click.argument("space_id")
-@click.option("--user-id", "-u", required=True, help="User ID to remove")
+@click.option("--user-id", "-u", help="User ID to remove")
+@click.option("--user-ids", "-U", help="Comma-separated user IDs to remove concurrently")
 @click.pass_context
-def remove_member(ctx: click.Context, space_id: str, user_id: str) -> None:
-    """Remove a member from a space."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/spaces/members/remove", {"spaceId": space_id, "userId": user_id})
-        success(f"Removed user '{user_id}' from space '{space_id}'")
-    except DocmostError as e:
-        error(str(e))
+@handle_docmost_errors
+def remove_member(
+    ctx: click.Context, space_id: str, user_id: str | None, user_ids: str | None
+) -> None:
+    """Remove one or more members from a space."""
+    ids = ([user_id] if user_id else []) + (split_csv(user_ids) if user_ids else [])
+    if not ids:
+        error("Either --user-id or --user-ids must be provided")
+        raise SystemExit(1)
+
+    client = ctx.obj.client
+    if len(ids) == 1:
+        client.post("/spaces/members/remove", {"spaceId": space_id, "userId": ids[0]})
+        success(f"Removed user '{ids[0]}' from space '{space_id}'")
+        return
+
+    payloads = [{"spaceId": space_id, "userId": uid} for uid in ids]
+    results = asyncio.run(
+        client.post_many_async("/spaces/members/remove", payloads, return_errors=True)
+    )
+    failed = 0
+    for uid, result in zip(ids, results):
+        if isinstance(result, DocmostError):
+            failed += 1
+            error(f"Failed to remove user '{uid}': {result}")
+        else:
+            success(f"Removed user '{uid}' from space '{space_id}'")
+    if failed:
         raise SystemExit(1)
 
 
@@ -186,6 +212,7 @@ def remove_member(ctx: click.Context, space_id: str, user_id: str) -> None:
 @click.option("--group-id", "-g", help="Group ID to change role for")
 @click.option("--role", "-r", required=True, help="New role")
 @click.pass_context
+@handle_docmost_errors
 def change_member_role(
     ctx: click.Context, space_id: str, user_id: str | None, group_id: str | None, role: str
 ) -> None:
@@ -194,17 +221,9 @@ def change_member_role(
         error("Either --user-id or --group-id must be provided")
         raise SystemExit(1)
 
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str] = {"spaceId": space_id, "role": role}
-        if user_id:
-            data["userId"] = user_id
-        if group_id:
-            data["groupId"] = group_id
-        result = client.post("/spaces/members/change-role", data)
-        output(result, ctx.obj.format)
-        target = f"user '{user_id}'" if user_id else f"group '{group_id}'"
-        success(f"Changed role for {target} in space '{space_id}' to '{role}'")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(spaceId=space_id, role=role, userId=user_id, groupId=group_id)
+    result = client.post("/spaces/members/change-role", data)
+    output(result, ctx.obj.format)
+    target = f"user '{user_id}'" if user_id else f"group '{group_id}'"
+    success(f"Changed role for {target} in space '{space_id}' to '{role}'")
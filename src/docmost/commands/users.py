@@ -2,8 +2,8 @@
 
 import click
 
-from docmost.client import DocmostError, get_client
-from docmost.output import error, output, success
+from docmost.commands._common import compact_payload
+from docmost.output import handle_docmost_errors, output, success
 
 
 @click.group()
@@ -14,15 +14,12 @@ def users() -> None:
 
 @users.command("me")
 @click.pass_context
+@handle_docmost_errors
 def current_user(ctx: click.Context) -> None:
     """Get current user information."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/users/me", {})
-        output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/users/me", {})
+    output(result, ctx.obj.format)
 
 
 @users.command("update")
@@ -31,6 +28,7 @@ def current_user(ctx: click.Context) -> None:
 @click.option("--email", "-e", help="New email address")
 @click.option("--role", "-r", help="New role")
 @click.pass_context
+@handle_docmost_errors
 def update_user(
     ctx: click.Context,
     user_id: str,
@@ -39,18 +37,8 @@ def update_user(
     role: str | None,
 ) -> None:
     """Update a user."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str] = {"id": user_id}
-        if name:
-            data["name"] = name
-        if email:
-            data["email"] = email
-        if role:
-            data["role"] = role
-        result = client.post("/users/update", data)
-        output(result, ctx.obj.format)
-        success(f"User '{user_id}' updated")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(id=user_id, name=name, email=email, role=role)
+    result = client.post("/users/update", data)
+    output(result, ctx.obj.format)
+    success(f"User '{user_id}' updated")
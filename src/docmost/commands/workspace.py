@@ -1,9 +1,12 @@
 """Workspace commands for Docmost CLI."""
 
+from typing import IO
+
 import click
 
-from docmost.client import DocmostError, get_client
-from docmost.output import error, output, success
+from docmost.client import get_client
+from docmost.commands._common import batched, collect_values, compact_payload, paginated
+from docmost.output import error, handle_docmost_errors, output, success, unwrap_list
 
 
 @click.group()
@@ -14,28 +17,22 @@ def workspace() -> None:
 
 @workspace.command("info")
 @click.pass_context
+@handle_docmost_errors
 def workspace_info(ctx: click.Context) -> None:
     """Get workspace information."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/workspace/info", {})
-        output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/workspace/info", {})
+    output(result, ctx.obj.format)
 
 
 @workspace.command("public")
 @click.pass_context
+@handle_docmost_errors
 def workspace_public(ctx: click.Context) -> None:
     """Get public workspace information."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/workspace/public", {})
-        output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/workspace/public", {})
+    output(result, ctx.obj.format)
 
 
 @workspace.command("update")
@@ -43,6 +40,7 @@ def workspace_public(ctx: click.Context) -> None:
 @click.option("--description", "-d", help="New workspace description")
 @click.option("--logo", help="Logo URL")
 @click.pass_context
+@handle_docmost_errors
 def update_workspace(
     ctx: click.Context,
     name: str | None,
@@ -50,63 +48,40 @@ def update_workspace(
     logo: str | None,
 ) -> None:
     """Update workspace settings."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str] = {}
-        if name:
-            data["name"] = name
-        if description:
-            data["description"] = description
-        if logo:
-            data["logo"] = logo
-        result = client.post("/workspace/update", data)
-        output(result, ctx.obj.format)
-        success("Workspace updated")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(name=name, description=description, logo=logo)
+    result = client.post("/workspace/update", data)
+    output(result, ctx.obj.format)
+    success("Workspace updated")
 
 
 @workspace.command("members")
 @click.option("--query", "-q", help="Search query")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=50, help="Items per page")
+@paginated()
 @click.pass_context
+@handle_docmost_errors
 def workspace_members(ctx: click.Context, query: str | None, page: int, limit: int) -> None:
     """List workspace members."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        data: dict[str, str | int] = {"page": page, "limit": limit}
-        if query:
-            data["query"] = query
-        result = client.post("/workspace/members", data)
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            members = result
-        else:
-            members = result.get("items", result.get("members", result))
-        if isinstance(members, list):
-            output(members, ctx.obj.format, columns=["id", "name", "email", "role"])
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    data = compact_payload(page=page, limit=limit, query=query)
+    result = client.post("/workspace/members", data)
+    members = unwrap_list(result, "items", "members")
+    if isinstance(members, list):
+        output(members, ctx.obj.format, columns=["id", "name", "email", "role"])
+    else:
+        output(result, ctx.obj.format)
 
 
 @workspace.command("members-change-role")
 @click.argument("user_id")
 @click.option("--role", "-r", required=True, help="New role for the user")
 @click.pass_context
+@handle_docmost_errors
 def members_change_role(ctx: click.Context, user_id: str, role: str) -> None:
     """Change a workspace member's role."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/workspace/members/change-role", {"userId": user_id, "role": role})
-        success(f"Changed role for user '{user_id}' to '{role}'")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    client.post("/workspace/members/change-role", {"userId": user_id, "role": role})
+    success(f"Changed role for user '{user_id}' to '{role}'")
 
 
 @workspace.group("invites")
@@ -116,91 +91,103 @@ def invites() -> None:
 
 
 @invites.command("list")
-@click.option("--page", "-p", type=int, default=1, help="Page number")
-@click.option("--limit", "-l", type=int, default=50, help="Items per page")
+@paginated()
 @click.pass_context
+@handle_docmost_errors
 def list_invites(ctx: click.Context, page: int, limit: int) -> None:
     """List pending invitations."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/workspace/invites", {"page": page, "limit": limit})
-        # Handle both list and dict responses
-        if isinstance(result, list):
-            invitations = result
-        else:
-            invitations = result.get("items", result.get("invitations", result))
-        if isinstance(invitations, list):
-            output(invitations, ctx.obj.format, columns=["id", "email", "role", "createdAt"])
-        else:
-            output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/workspace/invites", {"page": page, "limit": limit})
+    invitations = unwrap_list(result, "items", "invitations")
+    if isinstance(invitations, list):
+        output(invitations, ctx.obj.format, columns=["id", "email", "role", "createdAt"])
+    else:
+        output(result, ctx.obj.format)
 
 
 @invites.command("create")
-@click.option("--emails", "-e", required=True, help="Comma-separated email addresses")
+@click.option("--emails", "-e", help="Comma-separated email addresses")
+@click.option(
+    "--file",
+    "emails_file",
+    type=click.File("r"),
+    help="File with one email address per line ('-' for stdin)",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1),
+    default=100,
+    show_default=True,
+    help="Email addresses sent per request",
+)
 @click.option("--role", "-r", required=True, help="Role for invitees")
 @click.pass_context
-def create_invite(ctx: click.Context, emails: str, role: str) -> None:
-    """Create workspace invitations."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        email_list = [e.strip() for e in emails.split(",")]
-        result = client.post(
+@handle_docmost_errors
+def create_invite(
+    ctx: click.Context,
+    emails: str | None,
+    emails_file: IO[str] | None,
+    batch_size: int,
+    role: str,
+) -> None:
+    """Create workspace invitations.
+
+    Large lists are sent in batches of --batch-size over one connection.
+    """
+    email_list = collect_values(emails, emails_file)
+    if not email_list:
+        error("Either --emails or --file must provide at least one email address")
+        raise SystemExit(1)
+
+    client = ctx.obj.client
+    results = [
+        client.post(
             "/workspace/invites/create",
             {
-                "emails": email_list,
+                "emails": chunk,
                 "role": role,
             },
         )
-        output(result, ctx.obj.format)
+        for chunk in batched(email_list, batch_size)
+    ]
+    output(results[0] if len(results) == 1 else results, ctx.obj.format)
+    if len(results) == 1:
         success(f"Invited {len(email_list)} user(s)")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    else:
+        success(f"Invited {len(email_list)} user(s) in {len(results)} batches")
 
 
 @invites.command("revoke")
 @click.argument("invitation_id")
 @click.pass_context
+@handle_docmost_errors
 def revoke_invite(ctx: click.Context, invitation_id: str) -> None:
     """Revoke a pending invitation."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/workspace/invites/revoke", {"invitationId": invitation_id})
-        success(f"Invitation '{invitation_id}' revoked")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    client.post("/workspace/invites/revoke", {"invitationId": invitation_id})
+    success(f"Invitation '{invitation_id}' revoked")
 
 
 @invites.command("resend")
 @click.argument("invitation_id")
 @click.pass_context
+@handle_docmost_errors
 def resend_invite(ctx: click.Context, invitation_id: str) -> None:
     """Resend a pending invitation."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        client.post("/workspace/invites/resend", {"invitationId": invitation_id})
-        success(f"Invitation '{invitation_id}' resent")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    client.post("/workspace/invites/resend", {"invitationId": invitation_id})
+    success(f"Invitation '{invitation_id}' resent")
 
 
 @invites.command("info")
 @click.argument("invitation_id")
 @click.pass_context
+@handle_docmost_errors
 def invite_info(ctx: click.Context, invitation_id: str) -> None:
     """Get invitation details."""
-    try:
-        client = get_client(url=ctx.obj.url)
-        result = client.post("/workspace/invites/info", {"invitationId": invitation_id})
-        output(result, ctx.obj.format)
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    client = ctx.obj.client
+    result = client.post("/workspace/invites/info", {"invitationId": invitation_id})
+    output(result, ctx.obj.format)
 
 
 @invites.command("accept")
@@ -216,6 +203,7 @@ def invite_info(ctx: click.Context, invitation_id: str) -> None:
 )
 @click.option("--token", "-t", required=True, help="Invitation token from the invitation link")
 @click.pass_context
+@handle_docmost_errors
 def accept_invite(
     ctx: click.Context, invitation_id: str, name: str, password: str, token: str
 ) -> None:
@@ -224,19 +212,15 @@ def accept_invite(
     This command is for new users accepting an invitation to join a workspace.
     No authentication is required - only the invitation token.
     """
-    try:
-        # Create client without authentication (public endpoint)
-        client = get_client(url=ctx.obj.url, token="")
-        client.post(
-            "/workspace/invites/accept",
-            {
-                "invitationId": invitation_id,
-                "name": name,
-                "password": password,
-                "token": token,
-            },
-        )
-        success(f"Invitation accepted. Welcome, {name}!")
-    except DocmostError as e:
-        error(str(e))
-        raise SystemExit(1)
+    # Create client without authentication (public endpoint)
+    client = get_client(url=ctx.obj.url, token="")
+    client.post(
+        "/workspace/invites/accept",
+        {
+            "invitationId": invitation_id,
+            "name": name,
+            "password": password,
+            "token": token,
+        },
+    )
+    success(f"Invitation accepted. Welcome, {name}!")
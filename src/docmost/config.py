@@ -1,20 +1,45 @@
 """Configuration management for Docmost CLI."""
 
+import functools
 import os
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 CONFIG_DIR = Path.home() / ".config" / "docmost"
 CONFIG_FILE = CONFIG_DIR / "config.yaml"
 TOKEN_FILE = CONFIG_DIR / "token"
 
 
+@functools.cache
+def _ensure_dir(path: Path) -> Path:
+    """Create a directory once per process and return it."""
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@functools.cache
+def _yaml_safe_codec() -> tuple[type, type]:
+    """Import PyYAML on first use; prefer the LibYAML safe loader/dumper."""
+    try:
+        from yaml import CSafeDumper as SafeDumper
+        from yaml import CSafeLoader as SafeLoader
+    except ImportError:  # PyYAML built without LibYAML
+        from yaml import SafeDumper, SafeLoader
+    return SafeLoader, SafeDumper
+
+
 def get_config_dir() -> Path:
     """Get the configuration directory, creating it if needed."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-    return CONFIG_DIR
+    return _ensure_dir(CONFIG_DIR)
+
+
+@functools.lru_cache(maxsize=4)
+def _read_config_file(config_file: Path, mtime_ns: int) -> dict[str, Any]:
+    """Parse a config file once per (path, mtime); edits on disk are picked up."""
+    import yaml
+
+    with open(config_file) as f:
+        return yaml.load(f, Loader=_yaml_safe_codec()[0]) or {}
 
 
 def load_config() -> dict[str, Any]:
@@ -28,11 +53,13 @@ def load_config() -> dict[str, Any]:
         "default_space": None,
     }
 
-    # Load from config file if it exists
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            file_config = yaml.safe_load(f) or {}
-            config.update(file_config)
+    # Load from config file if it exists (parsed again only when it changes)
+    try:
+        mtime_ns = CONFIG_FILE.stat().st_mtime_ns
+    except FileNotFoundError:
+        pass
+    else:
+        config.update(_read_config_file(CONFIG_FILE, mtime_ns))
 
     # Override with environment variables
     if env_url := os.environ.get("DOCMOST_URL"):
@@ -49,9 +76,13 @@ def load_config() -> dict[str, Any]:
 
 def save_config(config: dict[str, Any]) -> None:
     """Save configuration to file."""
+    import yaml
+
     get_config_dir()
     with open(CONFIG_FILE, "w") as f:
-        yaml.safe_dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=_yaml_safe_codec()[1], default_flow_style=False)
+
+    _read_config_file.cache_clear()
 
 
 def get_url(config: dict[str, Any] | None = None) -> str | None:
@@ -1,45 +1,142 @@
 """Output formatters for Docmost CLI."""
 
+import functools
 import json
-from typing import Any
+import operator
+import sys
+import textwrap
+from collections.abc import Callable, Iterable
+from typing import Any, TypeVar
 
 import click
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
-error_console = Console(stderr=True)
+from docmost._json import dumps_indented
+from docmost.client import DocmostError
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Rich is imported and the consoles built only when something is printed
+_consoles: dict[bool, Any] = {}
+
+
+def _get_console(stderr: bool = False) -> Any:
+    """Return the shared rich Console for stdout (or stderr), creating it on first use."""
+    try:
+        return _consoles[stderr]
+    except KeyError:
+        from rich.console import Console
+
+        console = _consoles[stderr] = Console(stderr=stderr)
+        return console
+
+
+def _is_tty(stderr: bool = False) -> bool:
+    """Whether stdout (or stderr) is an interactive terminal."""
+    return (sys.stderr if stderr else sys.stdout).isatty()
+
+
+def __getattr__(name: str) -> Any:
+    # Keep `console` and `error_console` importable without eager construction
+    if name == "console":
+        return _get_console()
+    if name == "error_console":
+        return _get_console(stderr=True)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Encoders built once; json.dumps(default=...) builds a new encoder per call
+_encode_value = json.JSONEncoder(default=str).encode
+
+# Above this many rows, tables are printed as plain aligned text instead of rich
+LARGE_TABLE_ROWS = 200
 
 
 def format_json(data: Any) -> str:
     """Format data as JSON."""
-    return json.dumps(data, indent=2, default=str)
+    return dumps_indented(data)
 
 
 def format_plain(data: dict[str, Any]) -> str:
     """Format a single item as plain key: value pairs."""
-    lines = []
-    for key, value in data.items():
-        if isinstance(value, (dict, list)):
-            value = json.dumps(value, default=str)
-        lines.append(f"{key}: {value}")
-    return "\n".join(lines)
+    return "\n".join(
+        [
+            f"{key}: {_encode_value(value) if isinstance(value, (dict, list)) else value}"
+            for key, value in data.items()
+        ]
+    )
+
+
+def _format_cell(value: Any) -> str:
+    """Format one table cell: nested values as JSON, None as empty."""
+    if isinstance(value, (dict, list)):
+        return _encode_value(value)
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _row_values(
+    item: dict[str, Any], columns: list[str], getter: Callable[[dict[str, Any]], Any]
+) -> tuple[Any, ...]:
+    """Values of columns in item, with "" for missing keys.
+
+    getter is operator.itemgetter(*columns); rows that have every column take
+    that path and only incomplete rows fall back to per-key get().
+    """
+    try:
+        values = getter(item)
+    except KeyError:
+        return tuple(item.get(col, "") for col in columns)
+    return values if len(columns) > 1 else (values,)
+
+
+def _print_aligned(rows: list[list[str]], columns: list[str]) -> None:
+    """Print rows as left-aligned plain-text columns, one line at a time."""
+    widths = [len(col) for col in columns]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    # Pad every column but the last, so lines carry no trailing spaces
+    template = "  ".join([*(f"{{:<{w}}}" for w in widths[:-1]), "{}"])
+    click.echo(template.format(*columns))
+    for row in rows:
+        click.echo(template.format(*row))
 
 
 def format_table(data: list[dict[str, Any]], columns: list[str] | None = None) -> None:
     """Format data as a rich table.
 
+    Results with more than LARGE_TABLE_ROWS rows skip rich and are printed
+    as plain aligned columns, which starts output sooner and holds no
+    renderable table in memory.
+
     Args:
         data: List of dictionaries to display
         columns: Optional list of columns to show. If None, uses all keys from first item.
     """
     if not data:
-        console.print("[dim]No results[/dim]")
+        _get_console().print("[dim]No results[/dim]")
         return
 
-    # Determine columns
+    # Determine columns; interned names make the key lookups identity hits
     if columns is None:
         columns = list(data[0].keys())
+    columns = [sys.intern(col) for col in columns]
+
+    if columns:
+        getter = operator.itemgetter(*columns)
+        rows = [[_format_cell(v) for v in _row_values(item, columns, getter)] for item in data]
+    else:
+        # itemgetter needs at least one key; rows without columns have no cells
+        rows = [[] for _ in data]
+
+    if columns and len(rows) > LARGE_TABLE_ROWS:
+        _print_aligned(rows, columns)
+        return
+
+    from rich.table import Table
 
     # Create table
     table = Table(show_header=True, header_style="bold")
@@ -47,20 +144,33 @@ def format_table(data: list[dict[str, Any]], columns: list[str] | None = None) -
         table.add_column(col)
 
     # Add rows
-    for item in data:
-        row = []
-        for col in columns:
-            value = item.get(col, "")
-            if isinstance(value, (dict, list)):
-                value = json.dumps(value, default=str)
-            elif value is None:
-                value = ""
-            else:
-                value = str(value)
-            row.append(value)
+    for row in rows:
         table.add_row(*row)
 
-    console.print(table)
+    _get_console().print(table)
+
+
+def unwrap_list(result: Any, *keys: str) -> Any:
+    """Extract the item list from a list endpoint's response.
+
+    Handles both list and dict responses: a list is returned as-is, otherwise
+    the value of the first key present is returned.
+
+    Args:
+        result: API response
+        keys: Candidate keys, in order of preference (e.g. "items", "pages")
+
+    Returns:
+        The item list, or the response itself if no key matches
+    """
+    if isinstance(result, list):
+        return result
+    for key in keys:
+        try:
+            return result[key]
+        except (KeyError, TypeError):
+            pass
+    return result
 
 
 def output(data: Any, fmt: str = "table", columns: list[str] | None = None) -> None:
@@ -71,13 +181,16 @@ def output(data: Any, fmt: str = "table", columns: list[str] | None = None) -> N
         fmt: Format - "json", "table", or "plain"
         columns: Optional columns for table format
     """
+    if fmt == "table" and not _is_tty():
+        # Piped or redirected: skip rich and print plain key: value records
+        fmt = "plain"
+
     if fmt == "json":
         click.echo(format_json(data))
     elif fmt == "plain":
         if isinstance(data, list):
-            for item in data:
-                click.echo(format_plain(item))
-                click.echo()
+            # One write for the whole list: each record followed by a blank line
+            click.echo("".join([f"{format_plain(item)}\n\n" for item in data]), nl=False)
         else:
             click.echo(format_plain(data))
     elif fmt == "table":
@@ -91,21 +204,79 @@ def output(data: Any, fmt: str = "table", columns: list[str] | None = None) -> N
         click.echo(format_json(data))
 
 
+def output_stream(
+    items: Iterable[dict[str, Any]], fmt: str = "table", columns: list[str] | None = None
+) -> None:
+    """Output a list of items one at a time.
+
+    JSON and plain output are written item by item, so the whole rendered
+    document is never held in memory; the JSON matches format_json exactly.
+    Tables need every row to size their columns, so they are rendered as
+    with output().
+
+    Args:
+        items: Items to output
+        fmt: Format - "json", "table", or "plain"
+        columns: Optional columns for table format
+    """
+    if fmt == "table" and _is_tty():
+        format_table(list(items), columns)
+    elif fmt in ("table", "plain"):
+        for item in items:
+            click.echo(format_plain(item))
+            click.echo()
+    else:
+        sep = "[\n"
+        for item in items:
+            click.echo(sep + textwrap.indent(format_json(item), "  "), nl=False)
+            sep = ",\n"
+        click.echo("[]" if sep == "[\n" else "\n]")
+
+
 def success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    if _is_tty():
+        _get_console().print(f"[green]✓[/green] {message}")
+    else:
+        click.echo(f"✓ {message}")
 
 
 def error(message: str) -> None:
     """Print an error message."""
-    error_console.print(f"[red]✗[/red] {message}")
+    if _is_tty(stderr=True):
+        _get_console(stderr=True).print(f"[red]✗[/red] {message}")
+    else:
+        click.echo(f"✗ {message}", err=True)
 
 
 def warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[yellow]![/yellow] {message}")
+    if _is_tty():
+        _get_console().print(f"[yellow]![/yellow] {message}")
+    else:
+        click.echo(f"! {message}")
 
 
 def info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+    if _is_tty():
+        _get_console().print(f"[blue]ℹ[/blue] {message}")
+    else:
+        click.echo(f"ℹ {message}")
+
+
+def handle_docmost_errors(func: F) -> F:
+    """Report API errors from a command and exit with status 1.
+
+    Apply below @click.pass_context so the wrapper sees the command's arguments.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(*args, **kwargs)
+        except DocmostError as e:
+            error(str(e))
+            raise SystemExit(1)
+
+    return wrapper  # type: ignore[return-value]
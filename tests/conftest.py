@@ -1,21 +1,75 @@
 """Pytest fixtures for Docmost CLI tests."""
 
-from typing import Any, Generator
+import functools
+import importlib
+from typing import Any, Callable, Generator
 from unittest.mock import MagicMock, patch
 
+import click
+import httpx
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
 
+import docmost.auth
+import docmost.cli
+import docmost.client
+import docmost.commands.auth
+import docmost.config
 from docmost.client import DocmostClient
 
+API_URL = "https://docs.example.com/api"
 
-@pytest.fixture
+# Loaded config for CLI command tests using mock_auth
+CLI_CONFIG = {"url": API_URL, "default_format": "json"}
+
+# Modules holding a reference to load_config / get_token that mock_auth swaps
+LOAD_CONFIG_SITES = (docmost.config, docmost.cli, docmost.commands.auth)
+GET_TOKEN_SITES = (docmost.auth, docmost.client)
+
+# Pre-encoded response body, so httpx_mock does not re-serialize it per test
+EMPTY_ITEMS = b'{"items":[]}'
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports() -> None:
+    """Import the CLI and every command module once, before the first test.
+
+    LazyGroup defers these imports to first use, which would otherwise land
+    on whichever test happens to run first in a session or xdist worker.
+    """
+    from docmost.cli import LazyGroup
+
+    for module, *_ in LazyGroup.COMMANDS.values():
+        importlib.import_module(f"docmost.commands.{module}")
+
+
+@pytest.fixture(scope="session")
+def cli_app() -> click.Group:
+    """The docmost command group, imported once and shared by every test."""
+    from docmost.cli import cli
+
+    return cli
+
+
+@pytest.fixture(scope="session")
 def cli_runner() -> CliRunner:
     """Click CLI test runner."""
     return CliRunner()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def run_cli(cli_runner: CliRunner, cli_app: click.Group) -> Callable[..., Result]:
+    """Invoke the CLI for happy-path tests.
+
+    Exceptions propagate instead of being turned into an exit code, and
+    Click's standalone-mode exit handling is skipped.
+    """
+    return functools.partial(
+        cli_runner.invoke, cli_app, catch_exceptions=False, standalone_mode=False
+    )
+
+
+@pytest.fixture(scope="session")
 def mock_config() -> dict[str, Any]:
     """Mock configuration dictionary."""
     return {
@@ -25,7 +79,7 @@ def mock_config() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_token() -> str:
     """Mock authentication token."""
     return "test-token-12345"
@@ -33,8 +87,12 @@ def mock_token() -> str:
 
 @pytest.fixture
 def mock_load_config(mock_config: dict[str, Any]) -> Generator[MagicMock, None, None]:
-    """Patch load_config to return mock configuration."""
-    with patch("docmost.config.load_config", return_value=mock_config) as mock:
+    """Patch load_config to return a fresh copy of the mock configuration.
+
+    mock_config is shared by the whole session, so callers that update the
+    loaded config must not see each other's changes.
+    """
+    with patch("docmost.config.load_config", side_effect=lambda: dict(mock_config)) as mock:
         yield mock
 
 
@@ -45,10 +103,32 @@ def mock_get_token(mock_token: str) -> Generator[MagicMock, None, None]:
         yield mock
 
 
+@pytest.fixture(scope="module")
+def mock_auth() -> Generator[None, None, None]:
+    """Mock config and authentication once for every test in a module.
+
+    The functions are swapped by plain attribute assignment, in their own
+    module and in every module that imported them by name. load_config
+    hands out a copy of CLI_CONFIG because the CLI merges its options into it.
+    """
+    fakes = [
+        *((module, "load_config", lambda: dict(CLI_CONFIG)) for module in LOAD_CONFIG_SITES),
+        *((module, "get_token", lambda: "test-token") for module in GET_TOKEN_SITES),
+    ]
+    saved = [(module, name, getattr(module, name)) for module, name, _ in fakes]
+    for module, name, fake in fakes:
+        setattr(module, name, fake)
+    try:
+        yield
+    finally:
+        for module, name, original in saved:
+            setattr(module, name, original)
+
+
 @pytest.fixture
-def mock_auth(mock_load_config: MagicMock, mock_get_token: MagicMock) -> None:
-    """Combined fixture that mocks both config and authentication."""
-    pass
+def empty_items(httpx_mock) -> None:
+    """Answer the next request with an empty item list."""
+    httpx_mock.add_response(content=EMPTY_ITEMS, headers={"content-type": "application/json"})
 
 
 @pytest.fixture
@@ -67,3 +147,73 @@ def mock_docmost_client() -> Generator[MagicMock, None, None]:
         mock_instance = MagicMock(spec=DocmostClient)
         mock_cls.return_value = mock_instance
         yield mock_instance
+
+
+class RouteTable:
+    """Canned API responses keyed by (method, endpoint), for httpx.MockTransport.
+
+    Endpoints are given relative to the API base URL, as in the commands.
+    Every request served is recorded in ``requests``.
+    """
+
+    def __init__(self, prefix: str) -> None:
+        self.prefix = prefix
+        self.routes: dict[tuple[str, str], httpx.Response] = {}
+        self.requests: list[httpx.Request] = []
+
+    def add(
+        self,
+        endpoint: str,
+        json: Any = None,
+        status_code: int = 200,
+        method: str = "POST",
+    ) -> None:
+        """Register the response for an endpoint, replacing any earlier one."""
+        self.routes[method, endpoint] = httpx.Response(status_code, json=json)
+
+    def clear(self) -> None:
+        self.routes.clear()
+        self.requests.clear()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        endpoint = request.url.path.removeprefix(self.prefix)
+        response = self.routes.get((request.method, endpoint))
+        if response is None:
+            return httpx.Response(404, json={"message": f"No route for {endpoint}"})
+        return httpx.Response(
+            response.status_code, headers=response.headers, content=response.content
+        )
+
+
+class _SharedClient(DocmostClient):
+    """DocmostClient that outlives a single CLI invocation."""
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(scope="session")
+def _api_client() -> Generator[tuple[RouteTable, DocmostClient], None, None]:
+    routes = RouteTable(httpx.URL(API_URL).path)
+    client = _SharedClient(
+        url=API_URL, token="test-token", transport=httpx.MockTransport(routes.handle)
+    )
+    yield routes, client
+    DocmostClient.close(client)
+
+
+@pytest.fixture
+def api(
+    _api_client: tuple[RouteTable, DocmostClient], monkeypatch: pytest.MonkeyPatch
+) -> Generator[RouteTable, None, None]:
+    """Serve CLI requests from a route table, through one client for the session.
+
+    docmost.client.get_client is patched to return a pre-built client on a
+    MockTransport, so no HTTP client, auth headers or connection pool is built
+    per test. Register responses with ``api.add(endpoint, json=...)``.
+    """
+    routes, client = _api_client
+    monkeypatch.setattr("docmost.client.get_client", lambda url=None, token=None: client)
+    yield routes
+    routes.clear()
@@ -1,10 +1,16 @@
 """Smoke tests for Docmost CLI."""
 
+import os
+import subprocess
+import sys
+from unittest.mock import patch
+
+import click
 import pytest
 from click.testing import CliRunner
 
 from docmost import __version__
-from docmost.cli import cli
+from docmost.cli import Context, LazyGroup, cli
 
 
 class TestCliBasics:
@@ -55,6 +61,72 @@ class TestCliBasics:
         assert "--url" in result.output or "-u" in result.output
 
 
+class TestLazyLoading:
+    """Test that command modules are imported on demand."""
+
+    def test_help_does_not_import_command_modules(self) -> None:
+        """Top-level --help lists commands without importing their modules.
+
+        Runs in a fresh interpreter: this session has already imported them.
+        """
+        script = (
+            "import sys\n"
+            "from docmost.cli import cli\n"
+            "try:\n"
+            "    cli(['--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith('docmost.commands.')))\n"
+        )
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True, env=env
+        )
+        assert "pages      Manage pages." in result.stdout
+        assert result.stdout.splitlines()[-1] == "[]"
+
+    @pytest.mark.parametrize("name", sorted(LazyGroup.COMMANDS))
+    def test_table_help_matches_command(self, name: str) -> None:
+        """The short help in the command table matches the command itself."""
+        command = cli.get_command(click.Context(cli), name)
+        assert command.get_short_help_str(80) == LazyGroup.COMMANDS[name][2]
+
+    def test_unknown_command_is_rejected(self, cli_runner: CliRunner) -> None:
+        """Names outside the command table still produce a usage error."""
+        result = cli_runner.invoke(cli, ["no-such-command"])
+        assert result.exit_code != 0
+        assert "No such command" in result.output
+
+    def test_context_defers_config_loading(self) -> None:
+        """Context does not read config until a value is needed."""
+        with patch("docmost.cli.load_config", return_value={"url": "https://cfg.com/api"}) as m:
+            ctx = Context(fmt="json")
+            m.assert_not_called()
+            assert ctx.url == "https://cfg.com/api"
+            assert ctx.format == "json"
+            m.assert_called_once()
+
+    def test_context_reads_config_once(self) -> None:
+        """url, format and space all come from one load_config() call."""
+        cfg = {"url": "https://cfg.com/api", "default_format": "plain", "default_space": "s1"}
+        with patch("docmost.cli.load_config", return_value=cfg) as m:
+            ctx = Context()
+            assert (ctx.url, ctx.format, ctx.space) == ("https://cfg.com/api", "plain", "s1")
+            assert (ctx.url, ctx.format, ctx.space) == ("https://cfg.com/api", "plain", "s1")
+            m.assert_called_once()
+
+    def test_context_client_is_shared_and_closed_with_root(self) -> None:
+        """One client serves the invocation and is closed when it ends."""
+        ctx = Context(url="https://cfg.com/api")
+        with patch("docmost.cli.load_config", return_value={}):
+            with click.Context(cli, obj=ctx):
+                client = ctx.client
+                assert ctx.client is client
+                assert client.url == "https://cfg.com/api"
+                assert not client.is_closed
+        assert client.is_closed
+
+
 class TestSubcommandHelp:
     """Test that subcommands provide help."""
 
@@ -1,5 +1,10 @@
 """Tests for DocmostClient and HTTP error handling."""
 
+import asyncio
+import io
+import json
+import zipfile
+from collections.abc import Iterator
 from unittest.mock import patch
 
 import httpx
@@ -11,8 +16,10 @@ from docmost.client import (
     DocmostError,
     NotFoundError,
     ValidationError,
+    _close_pooled_clients,
     get_client,
 )
+from docmost.commands.pages import extract_content_from_zip
 
 
 class TestDocmostClientInit:
@@ -27,9 +34,7 @@ class TestDocmostClientInit:
 
     def test_init_with_custom_timeout(self) -> None:
         """Client accepts custom timeout."""
-        client = DocmostClient(
-            url="https://docs.example.com/api", token="test-token", timeout=60.0
-        )
+        client = DocmostClient(url="https://docs.example.com/api", token="test-token", timeout=60.0)
         assert client.timeout == 60.0
 
     def test_init_without_url_raises_error(self) -> None:
@@ -73,20 +78,39 @@ class TestDocmostClientHeaders:
             headers = client._get_headers()
             assert "Authorization" not in headers
 
+    def test_headers_are_built_once(self) -> None:
+        """Repeated calls return the same prebuilt dict."""
+        client = DocmostClient(url="https://example.com/api", token="my-token")
+        assert client._get_headers() is client._get_headers()
+
+    def test_setting_token_rebuilds_headers(self, httpx_mock) -> None:
+        """A new token is used by later requests."""
+        httpx_mock.add_response(json={})
+        client = DocmostClient(url="https://example.com/api", token="old-token")
+        client.token = "new-token"
+        assert client._get_headers()["Authorization"] == "Bearer new-token"
+        client.post("/pages/info", {"pageId": "p1"})
+        assert httpx_mock.get_request().headers["Authorization"] == "Bearer new-token"
+
+
+@pytest.fixture(scope="module")
+def client() -> Iterator[DocmostClient]:
+    """Client shared by tests that only exercise response handling."""
+    with DocmostClient(url="https://example.com/api", token="token") as client:
+        yield client
+
 
 class TestDocmostClientHandleResponse:
     """Tests for response handling and error mapping."""
 
-    def test_handle_response_success(self) -> None:
+    def test_handle_response_success(self, client: DocmostClient) -> None:
         """Successful response returns JSON data."""
-        client = DocmostClient(url="https://example.com/api", token="token")
         response = httpx.Response(200, json={"id": "123", "name": "Test"})
         result = client._handle_response(response)
         assert result == {"id": "123", "name": "Test"}
 
-    def test_handle_response_unwraps_data_wrapper(self) -> None:
+    def test_handle_response_unwraps_data_wrapper(self, client: DocmostClient) -> None:
         """Response with data/success/status wrapper gets unwrapped."""
-        client = DocmostClient(url="https://example.com/api", token="token")
         response = httpx.Response(
             200,
             json={
@@ -101,120 +125,295 @@ class TestDocmostClientHandleResponse:
         assert "success" not in result
         assert "status" not in result
 
-    def test_handle_response_preserves_unwrapped_response(self) -> None:
+    def test_handle_response_preserves_unwrapped_response(self, client: DocmostClient) -> None:
         """Response without data/success/status wrapper is returned as-is."""
-        client = DocmostClient(url="https://example.com/api", token="token")
         response = httpx.Response(200, json={"items": [{"id": "1"}]})
         result = client._handle_response(response)
         assert result == {"items": [{"id": "1"}]}
 
-    def test_handle_response_401_raises_authentication_error(self) -> None:
-        """401 response raises AuthenticationError."""
-        client = DocmostClient(url="https://example.com/api", token="token")
-        response = httpx.Response(401, json={"message": "Invalid token"})
-        with pytest.raises(AuthenticationError) as exc_info:
-            client._handle_response(response)
-        assert exc_info.value.status_code == 401
-        assert "Authentication failed" in str(exc_info.value)
-
-    def test_handle_response_404_raises_not_found_error(self) -> None:
-        """404 response raises NotFoundError."""
-        client = DocmostClient(url="https://example.com/api", token="token")
-        response = httpx.Response(404, json={"message": "Page not found"})
-        with pytest.raises(NotFoundError) as exc_info:
-            client._handle_response(response)
-        assert exc_info.value.status_code == 404
-        assert "Page not found" in str(exc_info.value)
-
-    def test_handle_response_400_raises_validation_error(self) -> None:
-        """400 response raises ValidationError."""
-        client = DocmostClient(url="https://example.com/api", token="token")
-        response = httpx.Response(400, json={"message": "Invalid input"})
-        with pytest.raises(ValidationError) as exc_info:
-            client._handle_response(response)
-        assert exc_info.value.status_code == 400
-        assert "Invalid input" in str(exc_info.value)
-
-    def test_handle_response_500_raises_docmost_error(self) -> None:
-        """500 response raises generic DocmostError."""
-        client = DocmostClient(url="https://example.com/api", token="token")
-        response = httpx.Response(500, json={"message": "Internal error"})
-        with pytest.raises(DocmostError) as exc_info:
-            client._handle_response(response)
-        assert exc_info.value.status_code == 500
-        assert "Internal error" in str(exc_info.value)
+    def test_handle_response_remembers_wrapped_endpoint(self, client: DocmostClient) -> None:
+        """An endpoint seen with the envelope is unwrapped on later responses."""
+        wrapped = {"data": {"id": "1"}, "success": True, "status": 200}
+        endpoint = "/remember-wrapped"
+
+        assert client._handle_response(httpx.Response(200, json=wrapped), endpoint) == {"id": "1"}
+        assert endpoint in client._wrapped_endpoints
+        # A plain response on the same endpoint is still returned untouched
+        plain = httpx.Response(200, json={"id": "2"})
+        assert client._handle_response(plain, endpoint) == {"id": "2"}
+
+    def test_wrapped_endpoints_are_per_client(self, client: DocmostClient) -> None:
+        """One client's remembered envelopes do not leak into another's."""
+        wrapped = {"data": {"id": "1"}, "success": True, "status": 200}
+        client._handle_response(httpx.Response(200, json=wrapped), "/per-client")
+
+        other = DocmostClient(url="https://other.example.com/api", token="token")
+        assert "/per-client" not in other._wrapped_endpoints
+
+    def test_handle_response_does_not_remember_plain_endpoint(self, client: DocmostClient) -> None:
+        """Endpoints are only remembered once they return the envelope."""
+        endpoint = "/remember-plain"
+
+        client._handle_response(httpx.Response(200, json={"id": "1"}), endpoint)
+        assert endpoint not in client._wrapped_endpoints
+        wrapped = {"data": {"id": "2"}, "success": True, "status": 200}
+        assert client._handle_response(httpx.Response(200, json=wrapped), endpoint) == {"id": "2"}
 
-    def test_handle_response_invalid_json(self) -> None:
+    def test_handle_response_invalid_json(self, client: DocmostClient) -> None:
         """Non-JSON response falls back to text."""
-        client = DocmostClient(url="https://example.com/api", token="token")
         response = httpx.Response(200, content=b"plain text")
         result = client._handle_response(response)
         assert result == {"error": "plain text"}
 
-    def test_handle_response_error_without_message(self) -> None:
-        """Error response without message uses default."""
-        client = DocmostClient(url="https://example.com/api", token="token")
-        response = httpx.Response(403, json={})
-        with pytest.raises(DocmostError) as exc_info:
-            client._handle_response(response)
-        assert "API error: 403" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        ("status", "body", "exc", "fragment"),
+        [
+            (401, {"message": "Invalid token"}, AuthenticationError, "Authentication failed"),
+            (404, {"message": "Page not found"}, NotFoundError, "Page not found"),
+            (400, {"message": "Invalid input"}, ValidationError, "Invalid input"),
+            (500, {"message": "Internal error"}, DocmostError, "Internal error"),
+            (403, {}, DocmostError, "API error: 403"),
+        ],
+    )
+    def test_handle_response_error_status(
+        self, client: DocmostClient, status: int, body: dict, exc: type, fragment: str
+    ) -> None:
+        """Error statuses raise the matching exception with a useful message."""
+        with pytest.raises(exc) as exc_info:
+            client._handle_response(httpx.Response(status, json=body))
+        assert type(exc_info.value) is exc
+        assert exc_info.value.status_code == status
+        assert fragment in str(exc_info.value)
+
+
+@pytest.fixture
+def mock_transport_client():
+    """Build clients whose requests are answered in-process by httpx.MockTransport.
+
+    Returns a factory taking the JSON body to reply with (and optionally the
+    base URL); it returns the client and the list of requests it sends.
+    """
+
+    def make(
+        body: object, url: str = "https://example.com/api"
+    ) -> tuple[DocmostClient, list[httpx.Request]]:
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json=body)
+
+        client = DocmostClient(url=url, token="token", transport=httpx.MockTransport(handler))
+        return client, sent
+
+    return make
 
 
 class TestDocmostClientPost:
     """Tests for POST requests."""
 
-    def test_post_sends_json_data(self, httpx_mock) -> None:
+    def test_post_sends_json_data(self, mock_transport_client) -> None:
         """POST request sends data as JSON."""
-        httpx_mock.add_response(json={"result": "success"})
-        client = DocmostClient(url="https://example.com/api", token="token")
+        client, sent = mock_transport_client({"result": "success"})
         result = client.post("/test", {"key": "value"})
         assert result == {"result": "success"}
 
-        request = httpx_mock.get_request()
+        (request,) = sent
         assert request.url == "https://example.com/api/test"
         assert request.method == "POST"
         assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.content) == {"key": "value"}
 
-    def test_post_handles_trailing_slash(self, httpx_mock) -> None:
+    def test_post_handles_trailing_slash(self, mock_transport_client) -> None:
         """URL trailing slash is handled correctly."""
-        httpx_mock.add_response(json={"ok": True})
-        client = DocmostClient(url="https://example.com/api/", token="token")
+        client, sent = mock_transport_client({"ok": True}, url="https://example.com/api/")
         client.post("/endpoint", {})
 
-        request = httpx_mock.get_request()
-        assert request.url == "https://example.com/api/endpoint"
+        assert sent[0].url == "https://example.com/api/endpoint"
 
-    def test_post_with_empty_data(self, httpx_mock) -> None:
+    def test_post_with_empty_data(self, mock_transport_client) -> None:
         """POST with None data sends empty dict."""
-        httpx_mock.add_response(json={"result": "ok"})
-        client = DocmostClient(url="https://example.com/api", token="token")
+        client, sent = mock_transport_client({"result": "ok"})
         client.post("/test", None)
 
-        request = httpx_mock.get_request()
-        assert request.method == "POST"
+        assert sent[0].method == "POST"
+        assert json.loads(sent[0].content) == {}
 
 
 class TestDocmostClientPostJson:
     """Tests for POST JSON requests."""
 
-    def test_post_json_sends_json_content(self, httpx_mock) -> None:
+    def test_post_json_sends_json_content(self, mock_transport_client) -> None:
         """POST JSON request sends JSON data."""
-        httpx_mock.add_response(json={"result": "success"})
-        client = DocmostClient(url="https://example.com/api", token="token")
+        client, sent = mock_transport_client({"result": "success"})
         result = client.post_json("/test", {"key": "value"})
         assert result == {"result": "success"}
 
-        request = httpx_mock.get_request()
-        assert request.headers["Content-Type"] == "application/json"
+        assert sent[0].headers["Content-Type"] == "application/json"
 
-    def test_post_json_with_empty_data(self, httpx_mock) -> None:
+    def test_post_json_with_empty_data(self, mock_transport_client) -> None:
         """POST JSON with None data sends empty dict."""
-        httpx_mock.add_response(json={"result": "ok"})
-        client = DocmostClient(url="https://example.com/api", token="token")
+        client, sent = mock_transport_client({"result": "ok"})
         client.post_json("/test", None)
 
+        assert sent[0].method == "POST"
+
+    def test_async_requests_use_the_transport(self, mock_transport_client) -> None:
+        """post_many_async goes through the same mock transport."""
+        client, sent = mock_transport_client({"ok": True})
+        results = asyncio.run(client.post_many_async("/test", [{"n": 1}, {"n": 2}]))
+        assert results == [{"ok": True}, {"ok": True}]
+        assert len(sent) == 2
+
+
+class TestDocmostClientPooling:
+    """Tests for the persistent connection pool."""
+
+    def test_requests_share_one_http_client(self, httpx_mock) -> None:
+        """Consecutive requests go through the same pooled httpx.Client."""
+        httpx_mock.add_response(json={"ok": True})
+        httpx_mock.add_response(json={"ok": True})
+        client = DocmostClient(url="https://example.com/api", token="token")
+        pool = client._client
+        client.post("/one", {})
+        client.post("/two", {})
+        assert client._client is pool
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_context_manager_closes_pool(self) -> None:
+        """Leaving the context manager closes the connection pool."""
+        with DocmostClient(url="https://example.com/api", token="token") as client:
+            assert not client._client.is_closed
+        assert client._client.is_closed
+
+
+class TestDocmostClientUploadFile:
+    """Tests for multipart file uploads."""
+
+    def test_upload_file_streams_file_with_length(self, httpx_mock, tmp_path) -> None:
+        """Upload sends the file as multipart with a Content-Length."""
+        httpx_mock.add_response(json={"id": "page-1"})
+        file_path = tmp_path / "page.md"
+        file_path.write_text("# Title\n\nBody")
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        result = client.upload_file("/pages/import", str(file_path), {"spaceId": "space-1"})
+
+        assert result == {"id": "page-1"}
         request = httpx_mock.get_request()
-        assert request.method == "POST"
+        assert request.url == "https://example.com/api/pages/import"
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert int(request.headers["Content-Length"]) == len(request.content)
+        assert b'filename="page.md"' in request.content
+        assert b"# Title" in request.content
+        assert b"space-1" in request.content
+
+    def test_upload_file_sends_auth_header(self, httpx_mock, tmp_path) -> None:
+        """Upload carries the bearer token from the pooled client."""
+        httpx_mock.add_response(json={"id": "page-1"})
+        file_path = tmp_path / "page.md"
+        file_path.write_text("content")
+        client = DocmostClient(url="https://example.com/api", token="secret")
+
+        client.upload_file("/pages/import", str(file_path))
+
+        assert httpx_mock.get_request().headers["Authorization"] == "Bearer secret"
+
+    def test_upload_bytes_sends_in_memory_content(self, httpx_mock) -> None:
+        """upload_bytes sends the given bytes as a named multipart file."""
+        httpx_mock.add_response(json={"id": "page-1"})
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        result = client.upload_bytes(
+            "/pages/import", "page.md", b"# Title\n\nBody", {"spaceId": "space-1"}
+        )
+
+        assert result == {"id": "page-1"}
+        request = httpx_mock.get_request()
+        assert request.headers["Content-Type"].startswith("multipart/form-data")
+        assert b'filename="page.md"' in request.content
+        assert b"# Title\n\nBody" in request.content
+        assert b"space-1" in request.content
+
+
+class TestDocmostClientPaginate:
+    """Tests for fetching every page of a list endpoint."""
+
+    def test_paginate_follows_has_next_page(self, httpx_mock) -> None:
+        """Pages are fetched until meta.hasNextPage is false, in order."""
+        for page, has_next in ((1, True), (2, True), (3, False)):
+            httpx_mock.add_response(
+                match_json={"pageId": "p", "page": page, "limit": 2},
+                json={"items": [{"id": f"{page}a"}], "meta": {"hasNextPage": has_next}},
+            )
+        httpx_mock.add_response(
+            json={"items": [], "meta": {"hasNextPage": False}}, is_reusable=True
+        )
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        items = asyncio.run(client.paginate_async("/comments", {"pageId": "p"}, page_size=2))
+
+        assert [item["id"] for item in items] == ["1a", "2a", "3a"]
+
+    def test_paginate_stops_on_short_page_without_meta(self, httpx_mock) -> None:
+        """Without pagination metadata a short page ends the listing."""
+        httpx_mock.add_response(json={"items": [{"id": "1"}]})
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        items = asyncio.run(client.paginate_async("/groups", page_size=50))
+
+        assert items == [{"id": "1"}]
+        request = httpx_mock.get_request()
+        assert json.loads(request.content) == {"page": 1, "limit": 50}
+
+    def test_paginate_single_page_sends_one_request(self, httpx_mock) -> None:
+        """A listing that fits on the first page is not over-fetched."""
+        httpx_mock.add_response(json={"items": [{"id": "1"}], "meta": {"hasNextPage": False}})
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        items = asyncio.run(client.paginate_async("/groups", page_size=50, window=4))
+
+        assert items == [{"id": "1"}]
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_paginate_stops_at_meta_total(self, httpx_mock) -> None:
+        """Batches never request pages past the one meta.total implies."""
+        for page in (1, 2):
+            httpx_mock.add_response(
+                match_json={"page": page, "limit": 2},
+                json={"items": [{"id": str(page)}] * 2, "meta": {"hasNextPage": True, "total": 4}},
+            )
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        items = asyncio.run(client.paginate_async("/groups", page_size=2, window=4))
+
+        assert len(items) == 4
+        pages = [json.loads(request.content)["page"] for request in httpx_mock.get_requests()]
+        assert pages == [1, 2]
+
+
+class TestDocmostClientPostMany:
+    """Tests for concurrent multi-payload POSTs."""
+
+    def test_post_many_returns_results_in_payload_order(self, httpx_mock) -> None:
+        """Responses line up with their payloads."""
+        for gid in ("g1", "g2", "g3"):
+            httpx_mock.add_response(match_json={"groupId": gid}, json={"id": gid})
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        results = asyncio.run(
+            client.post_many_async("/groups/info", [{"groupId": g} for g in ("g1", "g2", "g3")])
+        )
+
+        assert [r["id"] for r in results] == ["g1", "g2", "g3"]
+
+    def test_post_many_raises_api_errors(self, httpx_mock) -> None:
+        """An error response surfaces as the usual DocmostError subclass."""
+        httpx_mock.add_response(status_code=404, json={"message": "Group not found"})
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        with pytest.raises(NotFoundError):
+            asyncio.run(client.post_many_async("/groups/info", [{"groupId": "missing"}]))
 
 
 class TestGetClient:
@@ -235,6 +434,55 @@ class TestGetClient:
                 assert client.url == "https://default.com/api"
                 assert client.token == "default-token"
 
+    def test_get_client_empty_token_sends_no_authorization(self) -> None:
+        """An explicit empty token is kept rather than replaced by the stored one."""
+        with patch("docmost.client.get_token", return_value="stored"):
+            client = get_client(url="https://public.com/api", token="")
+        assert client.token == ""
+        assert "Authorization" not in client._headers
+
+    def test_get_client_reuses_client_for_same_credentials(self) -> None:
+        """get_client returns the same pooled client for the same url/token."""
+        first = get_client(url="https://reuse.com/api", token="reuse-token")
+        second = get_client(url="https://reuse.com/api", token="reuse-token")
+        other = get_client(url="https://reuse.com/api", token="other-token")
+        assert first is second
+        assert other is not first
+
+    def test_pooled_clients_are_closed_at_exit(self) -> None:
+        """The atexit hook closes and forgets every pooled client."""
+        client = get_client(url="https://atexit.com/api", token="tok")
+        _close_pooled_clients()
+        assert client.is_closed
+        assert get_client(url="https://atexit.com/api", token="tok") is not client
+
+    def test_get_client_replaces_closed_client(self) -> None:
+        """A closed pooled client is never handed out again."""
+        first = get_client(url="https://closed.com/api", token="tok")
+        first.close()
+        second = get_client(url="https://closed.com/api", token="tok")
+        assert second is not first
+        assert not second.is_closed
+
+
+class TestDocmostClientRequest:
+    """Tests for the shared request path."""
+
+    def test_post_is_post_json(self) -> None:
+        """post and post_json are the same method."""
+        assert DocmostClient.post is DocmostClient.post_json
+
+    def test_request_sends_form_body(self, httpx_mock) -> None:
+        """Form bodies are urlencoded with the form Content-Type."""
+        httpx_mock.add_response(json={"ok": True})
+        client = DocmostClient(url="https://example.com/api", token="token")
+
+        client._request("POST", "/form", form={"email": "a@b.c"})
+
+        request = httpx_mock.get_request()
+        assert request.headers["Content-Type"] == "application/x-www-form-urlencoded"
+        assert request.content == b"email=a%40b.c"
+
 
 class TestDocmostClientPostBinary:
     """Tests for POST binary requests."""
@@ -279,6 +527,37 @@ class TestDocmostClientPostBinary:
         with pytest.raises(DocmostError):
             client.post_binary("/test", {})
 
+    def test_post_binary_stream_yields_seekable_body(self, httpx_mock) -> None:
+        """POST binary stream yields the body as a seekable binary file."""
+        httpx_mock.add_response(content=b"PK\x03\x04binary content")
+        client = DocmostClient(url="https://example.com/api", token="token")
+        with client.post_binary_stream("/test", {"key": "value"}) as body:
+            assert body.read(2) == b"PK"
+            body.seek(0)
+            assert body.read() == b"PK\x03\x04binary content"
+
+        request = httpx_mock.get_request()
+        assert request.content == b'{"key":"value"}'
+
+    def test_post_binary_stream_body_opens_as_zip(self, httpx_mock) -> None:
+        """A streamed ZIP export is seekable and readable by the page exporter."""
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("export.md", "# Exported\n")
+        httpx_mock.add_response(content=archive.getvalue())
+        client = DocmostClient(url="https://example.com/api", token="token")
+        with client.post_binary_stream("/pages/export", {"pageId": "p1"}) as body:
+            assert body.seekable()
+            assert extract_content_from_zip(body) == b"# Exported\n"
+
+    def test_post_binary_stream_handles_not_found(self, httpx_mock) -> None:
+        """POST binary stream raises NotFoundError on 404."""
+        httpx_mock.add_response(status_code=404)
+        client = DocmostClient(url="https://example.com/api", token="token")
+        with pytest.raises(NotFoundError):
+            with client.post_binary_stream("/test", {}):
+                pass
+
 
 class TestDocmostErrorAttributes:
     """Tests for DocmostError exception attributes."""
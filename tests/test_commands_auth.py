@@ -1,5 +1,6 @@
 """Tests for authentication commands."""
 
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -7,92 +8,88 @@ import pytest
 from click.testing import CliRunner
 
 from docmost.cli import cli
-from docmost.commands.auth import login, logout
+from docmost.commands.auth import _token_from_body, login, logout
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def runner() -> CliRunner:
-    """CLI test runner."""
+    """CLI test runner, shared by every test (it holds no per-run state)."""
     return CliRunner()
 
 
+@pytest.fixture
+def cli_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the config file and token storage at a temporary directory."""
+    config_dir = tmp_path / ".config" / "docmost"
+    config_dir.mkdir(parents=True)
+    monkeypatch.setattr("docmost.config.CONFIG_DIR", config_dir)
+    monkeypatch.setattr("docmost.config.CONFIG_FILE", config_dir / "config.yaml")
+    monkeypatch.setattr("docmost.auth.get_config_dir", lambda: config_dir)
+    return config_dir
+
+
 class TestLoginCommand:
     """Tests for the login command."""
 
-    def test_login_success(self, runner: CliRunner, httpx_mock, tmp_path) -> None:
+    def test_login_success(self, runner: CliRunner, httpx_mock, cli_config) -> None:
         """Successful login stores token and config."""
         httpx_mock.add_response(
             url="https://docs.example.com/api/auth/login",
             json={"token": "test-token-123"},
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.config.CONFIG_FILE", config_dir / "config.yaml"):
-                with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                    config_dir.mkdir(parents=True, exist_ok=True)
-                    result = runner.invoke(
-                        cli,
-                        ["login"],
-                        input="https://docs.example.com\nuser@example.com\npassword123\n",
-                    )
+        result = runner.invoke(
+            cli,
+            ["login"],
+            input="https://docs.example.com\nuser@example.com\npassword123\n",
+            standalone_mode=False,
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 0
         assert "Logged in successfully" in result.output
 
-    def test_login_with_explicit_args(
-        self, runner: CliRunner, httpx_mock, tmp_path
-    ) -> None:
+    def test_login_with_explicit_args(self, runner: CliRunner, httpx_mock, cli_config) -> None:
         """Login with command-line arguments."""
         httpx_mock.add_response(
             url="https://docs.example.com/api/auth/login",
             json={"accessToken": "explicit-token"},
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.config.CONFIG_FILE", config_dir / "config.yaml"):
-                with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                    config_dir.mkdir(parents=True, exist_ok=True)
-                    result = runner.invoke(
-                        cli,
-                        [
-                            "login",
-                            "--url",
-                            "https://docs.example.com",
-                            "--email",
-                            "user@example.com",
-                            "--password",
-                            "pass",
-                        ],
-                    )
+        result = runner.invoke(
+            cli,
+            [
+                "login",
+                "--url",
+                "https://docs.example.com",
+                "--email",
+                "user@example.com",
+                "--password",
+                "pass",
+            ],
+            standalone_mode=False,
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 0
 
-    def test_login_adds_api_suffix(
-        self, runner: CliRunner, httpx_mock, tmp_path
-    ) -> None:
+    def test_login_adds_api_suffix(self, runner: CliRunner, httpx_mock, cli_config) -> None:
         """Login adds /api suffix if not present."""
         httpx_mock.add_response(
             url="https://docs.example.com/api/auth/login",
             json={"token": "token"},
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.config.CONFIG_FILE", config_dir / "config.yaml"):
-                with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                    config_dir.mkdir(parents=True, exist_ok=True)
-                    result = runner.invoke(
-                        cli,
-                        ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                    )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+            standalone_mode=False,
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 0
 
-    def test_login_invalid_credentials(
-        self, runner: CliRunner, httpx_mock, tmp_path
-    ) -> None:
+    def test_login_invalid_credentials(self, runner: CliRunner, httpx_mock, cli_config) -> None:
         """Login fails with invalid credentials."""
         httpx_mock.add_response(
             url="https://docs.example.com/api/auth/login",
@@ -100,19 +97,15 @@ class TestLoginCommand:
             json={"error": "Invalid credentials"},
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                config_dir.mkdir(parents=True, exist_ok=True)
-                result = runner.invoke(
-                    cli,
-                    ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+        )
 
         assert result.exit_code == 1
         assert "Invalid email or password" in result.output
 
-    def test_login_server_error(self, runner: CliRunner, httpx_mock, tmp_path) -> None:
+    def test_login_server_error(self, runner: CliRunner, httpx_mock, cli_config) -> None:
         """Login fails on server error."""
         httpx_mock.add_response(
             url="https://docs.example.com/api/auth/login",
@@ -120,59 +113,49 @@ class TestLoginCommand:
             text="Internal Server Error",
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                config_dir.mkdir(parents=True, exist_ok=True)
-                result = runner.invoke(
-                    cli,
-                    ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+        )
 
         assert result.exit_code == 1
         assert "Login failed" in result.output
 
-    def test_login_no_token_in_response(
-        self, runner: CliRunner, httpx_mock, tmp_path
-    ) -> None:
+    def test_login_no_token_in_response(self, runner: CliRunner, httpx_mock, cli_config) -> None:
         """Login fails when no token in response."""
         httpx_mock.add_response(
             url="https://docs.example.com/api/auth/login",
             json={"message": "success but no token"},
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                config_dir.mkdir(parents=True, exist_ok=True)
-                result = runner.invoke(
-                    cli,
-                    ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+        )
 
         assert result.exit_code == 1
         assert "No token received" in result.output
 
-    def test_login_connection_error(self, runner: CliRunner, tmp_path) -> None:
+    def test_login_connection_error(self, runner: CliRunner, cli_config, monkeypatch) -> None:
         """Login fails on connection error."""
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                config_dir.mkdir(parents=True, exist_ok=True)
-                with patch("httpx.Client") as mock_client:
-                    mock_client.return_value.__enter__.return_value.post.side_effect = (
-                        httpx.RequestError("Connection refused")
-                    )
-                    result = runner.invoke(
-                        cli,
-                        ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                    )
+
+        def refuse(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused", request=request)
+
+        monkeypatch.setattr(
+            "docmost.commands.auth._make_client",
+            lambda: httpx.Client(transport=httpx.MockTransport(refuse)),
+        )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+        )
 
         assert result.exit_code == 1
         assert "Connection error" in result.output
 
     def test_login_handles_access_token_key(
-        self, runner: CliRunner, httpx_mock, tmp_path
+        self, runner: CliRunner, httpx_mock, cli_config
     ) -> None:
         """Login accepts 'access_token' key in response."""
         httpx_mock.add_response(
@@ -180,20 +163,17 @@ class TestLoginCommand:
             json={"access_token": "snake-case-token"},
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.config.CONFIG_FILE", config_dir / "config.yaml"):
-                with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                    config_dir.mkdir(parents=True, exist_ok=True)
-                    result = runner.invoke(
-                        cli,
-                        ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                    )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+            standalone_mode=False,
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 0
 
     def test_login_extracts_token_from_cookie(
-        self, runner: CliRunner, httpx_mock, tmp_path
+        self, runner: CliRunner, httpx_mock, cli_config
     ) -> None:
         """Login extracts authToken from Set-Cookie header (live server behavior)."""
         httpx_mock.add_response(
@@ -202,54 +182,86 @@ class TestLoginCommand:
             headers={"Set-Cookie": "authToken=jwt-token-from-cookie; Path=/; HttpOnly"},
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.config.CONFIG_FILE", config_dir / "config.yaml"):
-                with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                    config_dir.mkdir(parents=True, exist_ok=True)
-                    result = runner.invoke(
-                        cli,
-                        ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                    )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+            standalone_mode=False,
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 0
         assert "Logged in successfully" in result.output
         # Verify token was saved
-        token_file = config_dir / "token"
+        token_file = cli_config / "token"
         assert token_file.exists()
         assert token_file.read_text() == "jwt-token-from-cookie"
 
+    def test_login_finds_token_among_several_cookies(
+        self, runner: CliRunner, httpx_mock, cli_config
+    ) -> None:
+        """The authToken cookie is found when other cookies are set first."""
+        httpx_mock.add_response(
+            url="https://docs.example.com/api/auth/login",
+            json={"success": True},
+            headers=[
+                ("Set-Cookie", "session=abc; Path=/"),
+                ("Set-Cookie", "authToken=second-cookie-token; Path=/; HttpOnly"),
+            ],
+        )
+
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+            standalone_mode=False,
+            catch_exceptions=False,
+        )
+
+        assert result.exit_code == 0
+        assert (cli_config / "token").read_text() == "second-cookie-token"
+
     def test_login_extracts_token_from_nested_response(
-        self, runner: CliRunner, httpx_mock, tmp_path
+        self, runner: CliRunner, httpx_mock, cli_config
     ) -> None:
         """Login extracts token from data.tokens.accessToken (Postman spec format)."""
         httpx_mock.add_response(
             url="https://docs.example.com/api/auth/login",
             json={
-                "data": {
-                    "tokens": {
-                        "accessToken": "nested-jwt-token"
-                    }
-                },
+                "data": {"tokens": {"accessToken": "nested-jwt-token"}},
                 "success": True,
-                "status": 200
+                "status": 200,
             },
         )
 
-        config_dir = tmp_path / ".config" / "docmost"
-        with patch("docmost.config.CONFIG_DIR", config_dir):
-            with patch("docmost.config.CONFIG_FILE", config_dir / "config.yaml"):
-                with patch("docmost.auth.get_config_dir", return_value=config_dir):
-                    config_dir.mkdir(parents=True, exist_ok=True)
-                    result = runner.invoke(
-                        cli,
-                        ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
-                    )
+        result = runner.invoke(
+            cli,
+            ["login", "-u", "https://docs.example.com", "-e", "u@e.com", "-p", "p"],
+            standalone_mode=False,
+            catch_exceptions=False,
+        )
 
         assert result.exit_code == 0
         assert "Logged in successfully" in result.output
 
 
+class TestTokenFromBody:
+    """Tests for locating the token in a login response body."""
+
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            ({"data": {"tokens": {"accessToken": "nested"}}, "token": "top"}, "nested"),
+            ({"data": {"tokens": {"access_token": "nested-snake"}}}, "nested-snake"),
+            ({"data": "not-a-dict", "accessToken": "camel"}, "camel"),
+            ({"token": "", "access_token": "snake"}, "snake"),
+            ({"message": "no token"}, None),
+            ([], None),
+        ],
+    )
+    def test_token_paths(self, body, expected) -> None:
+        """Paths are tried in order, skipping missing, empty and mistyped values."""
+        assert _token_from_body(body) == expected
+
+
 class TestLogoutCommand:
     """Tests for the logout command."""
 
@@ -261,7 +273,9 @@ class TestLogoutCommand:
         with patch("docmost.auth.get_config_dir", return_value=tmp_path):
             with patch("docmost.commands.auth.auth_module.is_authenticated", return_value=True):
                 with patch("docmost.commands.auth.auth_module.delete_token") as mock_delete:
-                    result = runner.invoke(cli, ["logout"])
+                    result = runner.invoke(
+                        cli, ["logout"], standalone_mode=False, catch_exceptions=False
+                    )
 
         assert result.exit_code == 0
         assert "Logged out successfully" in result.output
@@ -271,7 +285,9 @@ class TestLogoutCommand:
         """Logout shows message when not authenticated."""
         with patch("docmost.auth.get_config_dir", return_value=tmp_path):
             with patch("docmost.commands.auth.auth_module.is_authenticated", return_value=False):
-                result = runner.invoke(cli, ["logout"])
+                result = runner.invoke(
+                    cli, ["logout"], standalone_mode=False, catch_exceptions=False
+                )
 
         assert result.exit_code == 0
         assert "Not currently logged in" in result.output
@@ -1,48 +1,31 @@
 """Tests for comments commands."""
 
-from unittest.mock import patch
+import json
 
 import pytest
 from click.testing import CliRunner
 
-from docmost.cli import cli
-
-
-@pytest.fixture
-def runner() -> CliRunner:
-    """CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def mock_auth(tmp_path):
-    """Mock authentication for tests."""
-    config = {"url": "https://docs.example.com/api", "default_format": "json"}
-    with patch("docmost.config.load_config", return_value=config):
-        with patch("docmost.auth.get_token", return_value="test-token"):
-            yield
+pytestmark = [pytest.mark.xdist_group("cli_stateless"), pytest.mark.usefixtures("mock_auth")]
 
 
 class TestCommentsInfoCommand:
     """Tests for comments info command."""
 
-    def test_comment_info(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_comment_info(self, run_cli, httpx_mock, mock_auth) -> None:
         """Get comment info."""
-        httpx_mock.add_response(
-            json={"id": "c-123", "content": "A comment", "creatorId": "u-1"}
-        )
+        httpx_mock.add_response(json={"id": "c-123", "content": "A comment", "creatorId": "u-1"})
 
-        result = runner.invoke(cli, ["comments", "info", "c-123"])
+        result = run_cli(["comments", "info", "c-123"])
         assert result.exit_code == 0
         assert "A comment" in result.output
 
     def test_comment_info_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, httpx_mock, mock_auth
     ) -> None:
         """Comment info handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "Comment not found"})
 
-        result = runner.invoke(cli, ["comments", "info", "nonexistent"])
+        result = cli_runner.invoke(cli_app, ["comments", "info", "nonexistent"])
         assert result.exit_code == 1
         assert "Comment not found" in result.output
 
@@ -50,50 +33,83 @@ class TestCommentsInfoCommand:
 class TestCommentsListCommand:
     """Tests for comments list command."""
 
-    def test_list_comments(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """List comments on a page."""
+    @pytest.mark.parametrize(
+        ("payload", "args", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "c1", "content": "Great page!", "creatorId": "u1"},
+                        {"id": "c2", "content": "Needs revision", "creatorId": "u2"},
+                    ]
+                },
+                [],
+                "Great page!",
+            ),
+            ({"items": []}, ["-p", "2", "-l", "10"], None),
+            ({"comments": [{"id": "c1", "content": "A comment"}]}, [], "A comment"),
+        ],
+        ids=["items", "pagination", "comments-key"],
+    )
+    def test_list_comments(self, run_cli, httpx_mock, mock_auth, payload, args, expected) -> None:
+        """List comments on a page, with pagination and either list key."""
+        page, limit = (2, 10) if args else (1, 50)
         httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "c1", "content": "Great page!", "creatorId": "u1"},
-                    {"id": "c2", "content": "Needs revision", "creatorId": "u2"},
-                ]
-            }
+            match_json={"pageId": "page-123", "page": page, "limit": limit}, json=payload
         )
 
-        result = runner.invoke(cli, ["comments", "list", "page-123"])
+        result = run_cli(["comments", "list", "page-123", *args])
         assert result.exit_code == 0
-        assert "Great page!" in result.output
-
-    def test_list_comments_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """List comments with pagination."""
-        httpx_mock.add_response(json={"items": []})
+        if expected:
+            assert expected in result.output
 
-        result = runner.invoke(
-            cli, ["comments", "list", "page-123", "-p", "2", "-l", "10"]
+    def test_list_comments_all_pages(self, run_cli, httpx_mock, mock_auth) -> None:
+        """List comments with --all collects every page."""
+        httpx_mock.add_response(
+            match_json={"pageId": "page-123", "page": 1, "limit": 50},
+            json={"items": [{"id": "c1", "content": "First"}], "meta": {"hasNextPage": True}},
+        )
+        httpx_mock.add_response(
+            match_json={"pageId": "page-123", "page": 2, "limit": 50},
+            json={"items": [{"id": "c2", "content": "Second"}], "meta": {"hasNextPage": False}},
         )
+
+        result = run_cli(["comments", "list", "page-123", "--all"])
         assert result.exit_code == 0
+        assert "First" in result.output
+        assert "Second" in result.output
 
-    def test_list_comments_handles_comments_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """List handles 'comments' key."""
+    def test_list_comments_multiple_pages_ids(self, run_cli, httpx_mock, mock_auth) -> None:
+        """List comments with --page-ids merges comments from every page."""
+        httpx_mock.add_response(
+            match_json={"pageId": "p-1", "page": 1, "limit": 50},
+            json={"items": [{"id": "c1", "content": "On first page"}]},
+        )
         httpx_mock.add_response(
-            json={"comments": [{"id": "c1", "content": "A comment"}]}
+            match_json={"pageId": "p-2", "page": 1, "limit": 50},
+            json={"comments": [{"id": "c2", "content": "On second page"}]},
         )
 
-        result = runner.invoke(cli, ["comments", "list", "page-123"])
+        result = run_cli(["comments", "list", "--page-ids", "p-1,p-2"])
         assert result.exit_code == 0
+        assert "On first page" in result.output
+        assert "On second page" in result.output
+
+    def test_list_comments_page_ids_with_all_rejected(
+        self, cli_runner: CliRunner, cli_app, mock_auth
+    ) -> None:
+        """--page-ids and --all are mutually exclusive."""
+        result = cli_runner.invoke(cli_app, ["comments", "list", "--page-ids", "p-1", "--all"])
+        assert result.exit_code == 1
+        assert "--all cannot be combined with --page-ids" in result.output
 
     def test_list_comments_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, httpx_mock, mock_auth
     ) -> None:
         """List comments handles error."""
         httpx_mock.add_response(status_code=404, json={"message": "Page not found"})
 
-        result = runner.invoke(cli, ["comments", "list", "nonexistent"])
+        result = cli_runner.invoke(cli_app, ["comments", "list", "nonexistent"])
         assert result.exit_code == 1
         assert "Page not found" in result.output
 
@@ -101,24 +117,19 @@ class TestCommentsListCommand:
 class TestCommentsCreateCommand:
     """Tests for comments create command."""
 
-    def test_create_comment(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_create_comment(self, run_cli, httpx_mock, mock_auth) -> None:
         """Create a comment."""
         httpx_mock.add_response(json={"id": "new-comment", "content": "My comment"})
 
-        result = runner.invoke(
-            cli, ["comments", "create", "page-123", "--content", "My comment"]
-        )
+        result = run_cli(["comments", "create", "page-123", "--content", "My comment"])
         assert result.exit_code == 0
         assert "Comment created" in result.output
 
-    def test_create_comment_with_selection(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_create_comment_with_selection(self, run_cli, httpx_mock, mock_auth) -> None:
         """Create comment with selection."""
         httpx_mock.add_response(json={"id": "c1"})
 
-        result = runner.invoke(
-            cli,
+        result = run_cli(
             [
                 "comments",
                 "create",
@@ -131,14 +142,11 @@ class TestCommentsCreateCommand:
         )
         assert result.exit_code == 0
 
-    def test_create_comment_reply(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_create_comment_reply(self, run_cli, httpx_mock, mock_auth) -> None:
         """Create a reply to a comment."""
         httpx_mock.add_response(json={"id": "reply-1"})
 
-        result = runner.invoke(
-            cli,
+        result = run_cli(
             [
                 "comments",
                 "create",
@@ -151,43 +159,37 @@ class TestCommentsCreateCommand:
         )
         assert result.exit_code == 0
 
-        request = httpx_mock.get_request()
-        assert b'"parentCommentId":"parent-comment-id"' in request.content
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["parentCommentId"] == "parent-comment-id"
 
     def test_create_comment_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, httpx_mock, mock_auth
     ) -> None:
         """Create comment handles error."""
         httpx_mock.add_response(status_code=400, json={"message": "Content required"})
 
-        result = runner.invoke(
-            cli, ["comments", "create", "page-123", "-c", ""]
-        )
+        result = cli_runner.invoke(cli_app, ["comments", "create", "page-123", "-c", ""])
         assert result.exit_code == 1
 
 
 class TestCommentsUpdateCommand:
     """Tests for comments update command."""
 
-    def test_update_comment(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_update_comment(self, run_cli, httpx_mock, mock_auth) -> None:
         """Update a comment."""
         httpx_mock.add_response(json={"id": "c-1", "content": "Updated content"})
 
-        result = runner.invoke(
-            cli, ["comments", "update", "c-1", "--content", "Updated content"]
-        )
+        result = run_cli(["comments", "update", "c-1", "--content", "Updated content"])
         assert result.exit_code == 0
         assert "Comment updated" in result.output
 
     def test_update_comment_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, httpx_mock, mock_auth
     ) -> None:
         """Update comment handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "Comment not found"})
 
-        result = runner.invoke(
-            cli, ["comments", "update", "nonexistent", "-c", "content"]
-        )
+        result = cli_runner.invoke(cli_app, ["comments", "update", "nonexistent", "-c", "content"])
         assert result.exit_code == 1
         assert "Comment not found" in result.output
 
@@ -195,76 +197,54 @@ class TestCommentsUpdateCommand:
 class TestCommentsResolveCommand:
     """Tests for comments resolve command."""
 
-    def test_resolve_comment(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Resolve a comment."""
-        httpx_mock.add_response(json={"id": "c-1", "resolved": True})
-
-        result = runner.invoke(cli, ["comments", "resolve", "c-1"])
+    @pytest.mark.parametrize(
+        ("flags", "resolved", "message"),
+        [
+            ([], True, "Comment resolved"),
+            (["-r"], True, "Comment resolved"),
+            (["--unresolved"], False, "Comment unresolved"),
+            (["-u"], False, "Comment unresolved"),
+        ],
+    )
+    def test_resolve_comment(self, run_cli, api, mock_auth, flags, resolved, message) -> None:
+        """Resolve or unresolve a comment with the long or short flag."""
+        api.add("/comments/resolve", json={"id": "c-1", "resolved": resolved})
+
+        result = run_cli(["comments", "resolve", "c-1", *flags])
         assert result.exit_code == 0
-        assert "Comment resolved" in result.output
-
-    def test_unresolve_comment(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Unresolve a comment."""
-        httpx_mock.add_response(json={"id": "c-1", "resolved": False})
-
-        result = runner.invoke(cli, ["comments", "resolve", "c-1", "--unresolved"])
-        assert result.exit_code == 0
-        assert "Comment unresolved" in result.output
-
-    def test_resolve_with_short_flag(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Resolve with -r flag."""
-        httpx_mock.add_response(json={"id": "c-1"})
-
-        result = runner.invoke(cli, ["comments", "resolve", "c-1", "-r"])
-        assert result.exit_code == 0
-
-    def test_unresolve_with_short_flag(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Unresolve with -u flag."""
-        httpx_mock.add_response(json={"id": "c-1"})
-
-        result = runner.invoke(cli, ["comments", "resolve", "c-1", "-u"])
-        assert result.exit_code == 0
-        assert "Comment unresolved" in result.output
+        assert message in result.output
 
 
 class TestCommentsDeleteCommand:
     """Tests for comments delete command."""
 
-    def test_delete_comment_with_force(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_delete_comment_with_force(self, run_cli, api, mock_auth) -> None:
         """Delete comment with --force flag."""
-        httpx_mock.add_response(json={})
+        api.add("/comments/delete", json={})
 
-        result = runner.invoke(cli, ["comments", "delete", "c-1", "--force"])
+        result = run_cli(["comments", "delete", "c-1", "--force"])
         assert result.exit_code == 0
         assert "Comment deleted" in result.output
 
     def test_delete_comment_with_confirmation(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, api, mock_auth
     ) -> None:
         """Delete comment with confirmation."""
-        httpx_mock.add_response(json={})
+        api.add("/comments/delete", json={})
 
-        result = runner.invoke(cli, ["comments", "delete", "c-1"], input="y\n")
+        result = cli_runner.invoke(cli_app, ["comments", "delete", "c-1"], input="y\n")
         assert result.exit_code == 0
 
-    def test_delete_comment_cancelled(self, runner: CliRunner, mock_auth) -> None:
+    def test_delete_comment_cancelled(self, cli_runner: CliRunner, cli_app, mock_auth) -> None:
         """Delete comment cancelled by user."""
-        result = runner.invoke(cli, ["comments", "delete", "c-1"], input="n\n")
+        result = cli_runner.invoke(cli_app, ["comments", "delete", "c-1"], input="n\n")
         assert result.exit_code == 0
         assert "Cancelled" in result.output
 
-    def test_delete_comment_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_delete_comment_not_found(self, cli_runner: CliRunner, cli_app, api, mock_auth) -> None:
         """Delete comment handles not found."""
-        httpx_mock.add_response(status_code=404, json={"message": "Comment not found"})
+        api.add("/comments/delete", status_code=404, json={"message": "Comment not found"})
 
-        result = runner.invoke(cli, ["comments", "delete", "c-1", "-f"])
+        result = cli_runner.invoke(cli_app, ["comments", "delete", "c-1", "-f"])
         assert result.exit_code == 1
         assert "Comment not found" in result.output
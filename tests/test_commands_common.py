@@ -0,0 +1,95 @@
+"""Tests for helpers shared by command modules."""
+
+import io
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from docmost.commands._common import (
+    batched,
+    collect_values,
+    compact_payload,
+    paginated,
+    split_csv,
+)
+
+
+class TestSplitCsv:
+    """Tests for split_csv."""
+
+    @pytest.mark.parametrize(
+        ("values", "expected"),
+        [
+            ("a,b,c", ["a", "b", "c"]),
+            (" a , b,\tc ", ["a", "b", "c"]),
+            ("a,,b,", ["a", "b"]),
+            ("single", ["single"]),
+            ("  ", []),
+        ],
+    )
+    def test_splits_and_trims(self, values: str, expected: list[str]) -> None:
+        """Whitespace around commas and empty entries are dropped."""
+        assert split_csv(values) == expected
+
+
+class TestCollectValues:
+    """Tests for collect_values."""
+
+    def test_combines_option_and_file(self) -> None:
+        """Option values come first, then non-blank file lines."""
+        file = io.StringIO("c\n\n  d  \n")
+        assert collect_values("a, b", file) == ["a", "b", "c", "d"]
+
+    def test_empty_without_sources(self) -> None:
+        """No option and no file yields no values."""
+        assert collect_values(None) == []
+
+
+class TestBatched:
+    """Tests for batched."""
+
+    def test_slices_into_chunks(self) -> None:
+        """The last chunk holds the remainder."""
+        assert list(batched([1, 2, 3, 4, 5], 2)) == [[1, 2], [3, 4], [5]]
+
+    def test_empty_input(self) -> None:
+        """An empty list yields no chunks."""
+        assert list(batched([], 3)) == []
+
+
+class TestPaginated:
+    """Tests for the shared --page/--limit options."""
+
+    def test_adds_page_and_limit(self) -> None:
+        """Options are added in order with the given limit default."""
+
+        @click.command()
+        @paginated(20)
+        def cmd(page: int, limit: int) -> None:
+            click.echo(f"{page} {limit}")
+
+        assert [p.name for p in cmd.params] == ["page", "limit"]
+        assert CliRunner().invoke(cmd, []).output == "1 20\n"
+        assert CliRunner().invoke(cmd, ["-p", "3", "-l", "5"]).output == "3 5\n"
+
+    def test_decorator_is_shared(self) -> None:
+        """Commands with the same default reuse one decorator."""
+        assert paginated(50) is paginated(50)
+        assert paginated(20) is not paginated(50)
+
+
+class TestCompactPayload:
+    """Tests for compact_payload."""
+
+    def test_drops_unset_fields(self) -> None:
+        """None and empty strings are left out; other falsy values are kept."""
+        assert compact_payload(spaceId="s1", name=None, icon="", page=0, flag=False) == {
+            "spaceId": "s1",
+            "page": 0,
+            "flag": False,
+        }
+
+    def test_keeps_argument_order(self) -> None:
+        """Keys appear in the order given."""
+        assert list(compact_payload(b="1", a="2")) == ["b", "a"]
@@ -1,135 +1,137 @@
 """Tests for groups commands."""
 
-from unittest.mock import patch
+import json
 
 import pytest
 from click.testing import CliRunner
 
-from docmost.cli import cli
+pytestmark = [pytest.mark.xdist_group("cli_stateless"), pytest.mark.usefixtures("mock_auth")]
 
-
-@pytest.fixture
-def runner() -> CliRunner:
-    """CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def mock_auth(tmp_path):
-    """Mock authentication for tests."""
-    config = {"url": "https://docs.example.com/api", "default_format": "json"}
-    with patch("docmost.config.load_config", return_value=config):
-        with patch("docmost.auth.get_token", return_value="test-token"):
-            yield
+# Pre-encoded response bodies, so httpx_mock does not re-serialize them per test
+JSON_HEADERS = {"content-type": "application/json"}
+EMPTY_OBJECT = b"{}"
+EMPTY_ITEMS = b'{"items":[]}'
 
 
 class TestGroupsListCommand:
     """Tests for groups list command."""
 
-    def test_list_groups(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """List all groups."""
-        httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "g1", "name": "Engineering", "memberCount": 10},
-                    {"id": "g2", "name": "Marketing", "memberCount": 5},
-                ]
-            }
-        )
-
-        result = runner.invoke(cli, ["groups", "list"])
+    @pytest.mark.parametrize(
+        ("payload", "args", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "g1", "name": "Engineering", "memberCount": 10},
+                        {"id": "g2", "name": "Marketing", "memberCount": 5},
+                    ]
+                },
+                [],
+                "Engineering",
+            ),
+            ({"items": []}, ["-p", "2", "-l", "25"], None),
+            ({"groups": [{"id": "g1", "name": "Group 1"}]}, [], "Group 1"),
+        ],
+        ids=["items", "pagination", "groups-key"],
+    )
+    def test_list_groups(self, run_cli, httpx_mock, mock_auth, payload, args, expected) -> None:
+        """List groups, with pagination and either list key."""
+        page, limit = (2, 25) if args else (1, 50)
+        httpx_mock.add_response(match_json={"page": page, "limit": limit}, json=payload)
+
+        result = run_cli(["groups", "list", *args])
         assert result.exit_code == 0
-        assert "Engineering" in result.output
+        if expected:
+            assert expected in result.output
 
-    def test_list_groups_with_query(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_list_groups_with_query(self, run_cli, httpx_mock, mock_auth) -> None:
         """Search groups."""
-        httpx_mock.add_response(json={"items": []})
+        httpx_mock.add_response(content=EMPTY_ITEMS, headers=JSON_HEADERS)
 
-        result = runner.invoke(cli, ["groups", "list", "-q", "eng"])
+        result = run_cli(["groups", "list", "-q", "eng"])
         assert result.exit_code == 0
 
-        request = httpx_mock.get_request()
-        assert b'"query":"eng"' in request.content
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["query"] == "eng"
 
-    def test_list_groups_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """List groups with pagination."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["groups", "list", "-p", "2", "-l", "25"])
-        assert result.exit_code == 0
-
-    def test_list_groups_handles_groups_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """List handles 'groups' key."""
+    def test_list_groups_all_pages(self, run_cli, httpx_mock, mock_auth) -> None:
+        """List groups with --all keeps the query on every page."""
         httpx_mock.add_response(
-            json={"groups": [{"id": "g1", "name": "Group 1"}]}
+            match_json={"query": "eng", "page": 1, "limit": 50},
+            json={"items": [{"id": "g1", "name": "Engineering"}], "meta": {"hasNextPage": False}},
         )
 
-        result = runner.invoke(cli, ["groups", "list"])
+        result = run_cli(["groups", "list", "-q", "eng", "--all"])
         assert result.exit_code == 0
+        assert "Engineering" in result.output
 
 
 class TestGroupsInfoCommand:
     """Tests for groups info command."""
 
-    def test_group_info(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_group_info(self, run_cli, api, mock_auth) -> None:
         """Get group info."""
-        httpx_mock.add_response(
-            json={"id": "g-123", "name": "Engineering", "description": "Dev team"}
+        api.add(
+            "/groups/info", json={"id": "g-123", "name": "Engineering", "description": "Dev team"}
         )
 
-        result = runner.invoke(cli, ["groups", "info", "g-123"])
+        result = run_cli(["groups", "info", "g-123"])
         assert result.exit_code == 0
         assert "Engineering" in result.output
 
-    def test_group_info_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_group_info_not_found(self, cli_runner: CliRunner, cli_app, api, mock_auth) -> None:
         """Group info handles not found."""
-        httpx_mock.add_response(status_code=404, json={"message": "Group not found"})
+        api.add("/groups/info", status_code=404, json={"message": "Group not found"})
 
-        result = runner.invoke(cli, ["groups", "info", "nonexistent"])
+        result = cli_runner.invoke(cli_app, ["groups", "info", "nonexistent"])
         assert result.exit_code == 1
         assert "Group not found" in result.output
 
+    def test_group_info_multiple_ids(self, run_cli, httpx_mock, mock_auth) -> None:
+        """Group info with --ids fetches every group."""
+        httpx_mock.add_response(match_json={"groupId": "g-1"}, json={"id": "g-1", "name": "One"})
+        httpx_mock.add_response(match_json={"groupId": "g-2"}, json={"id": "g-2", "name": "Two"})
+
+        result = run_cli(["groups", "info", "--ids", "g-1, g-2"])
+        assert result.exit_code == 0
+        assert "One" in result.output
+        assert "Two" in result.output
+
+    def test_group_info_requires_id(self, cli_runner: CliRunner, cli_app, mock_auth) -> None:
+        """Group info without GROUP_ID or --ids fails."""
+        result = cli_runner.invoke(cli_app, ["groups", "info"])
+        assert result.exit_code == 1
+        assert "Either GROUP_ID or --ids must be provided" in result.output
+
 
 class TestGroupsCreateCommand:
     """Tests for groups create command."""
 
-    def test_create_group(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_create_group(self, run_cli, api, mock_auth) -> None:
         """Create a new group."""
-        httpx_mock.add_response(json={"id": "new-group", "name": "New Group"})
+        api.add("/groups/create", json={"id": "new-group", "name": "New Group"})
 
-        result = runner.invoke(cli, ["groups", "create", "--name", "New Group"])
+        result = run_cli(["groups", "create", "--name", "New Group"])
         assert result.exit_code == 0
         assert "Group 'New Group' created" in result.output
 
-    def test_create_group_with_description(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_create_group_with_description(self, run_cli, httpx_mock, mock_auth) -> None:
         """Create group with description."""
         httpx_mock.add_response(json={"id": "g1", "name": "G1"})
 
-        result = runner.invoke(
-            cli, ["groups", "create", "-n", "G1", "-d", "Group description"]
-        )
+        result = run_cli(["groups", "create", "-n", "G1", "-d", "Group description"])
         assert result.exit_code == 0
 
-        request = httpx_mock.get_request()
-        assert b'"description":"Group description"' in request.content
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["description"] == "Group description"
 
     def test_create_group_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, httpx_mock, mock_auth
     ) -> None:
         """Create group handles error."""
         httpx_mock.add_response(status_code=400, json={"message": "Name already exists"})
 
-        result = runner.invoke(cli, ["groups", "create", "-n", "Existing"])
+        result = cli_runner.invoke(cli_app, ["groups", "create", "-n", "Existing"])
         assert result.exit_code == 1
         assert "Name already exists" in result.output
 
@@ -137,55 +139,45 @@ class TestGroupsCreateCommand:
 class TestGroupsUpdateCommand:
     """Tests for groups update command."""
 
-    def test_update_group_name(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_group_name(self, run_cli, api, mock_auth) -> None:
         """Update group name."""
-        httpx_mock.add_response(json={"id": "g-1", "name": "Updated Name"})
+        api.add("/groups/update", json={"id": "g-1", "name": "Updated Name"})
 
-        result = runner.invoke(
-            cli, ["groups", "update", "g-1", "--name", "Updated Name"]
-        )
+        result = run_cli(["groups", "update", "g-1", "--name", "Updated Name"])
         assert result.exit_code == 0
         assert "Group 'g-1' updated" in result.output
 
-    def test_update_group_description(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_group_description(self, run_cli, api, mock_auth) -> None:
         """Update group description."""
-        httpx_mock.add_response(json={"id": "g-1"})
+        api.add("/groups/update", json={"id": "g-1"})
 
-        result = runner.invoke(
-            cli, ["groups", "update", "g-1", "-d", "New description"]
-        )
+        result = run_cli(["groups", "update", "g-1", "-d", "New description"])
         assert result.exit_code == 0
 
 
 class TestGroupsDeleteCommand:
     """Tests for groups delete command."""
 
-    def test_delete_group_with_force(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_delete_group_with_force(self, run_cli, api, mock_auth) -> None:
         """Delete group with --force flag."""
-        httpx_mock.add_response(json={})
+        api.add("/groups/delete", json={})
 
-        result = runner.invoke(cli, ["groups", "delete", "g-1", "--force"])
+        result = run_cli(["groups", "delete", "g-1", "--force"])
         assert result.exit_code == 0
         assert "Group 'g-1' deleted" in result.output
 
     def test_delete_group_with_confirmation(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, httpx_mock, mock_auth
     ) -> None:
         """Delete group with confirmation."""
-        httpx_mock.add_response(json={})
+        httpx_mock.add_response(content=EMPTY_OBJECT, headers=JSON_HEADERS)
 
-        result = runner.invoke(cli, ["groups", "delete", "g-1"], input="y\n")
+        result = cli_runner.invoke(cli_app, ["groups", "delete", "g-1"], input="y\n")
         assert result.exit_code == 0
 
-    def test_delete_group_cancelled(self, runner: CliRunner, mock_auth) -> None:
+    def test_delete_group_cancelled(self, cli_runner: CliRunner, cli_app, mock_auth) -> None:
         """Delete group cancelled by user."""
-        result = runner.invoke(cli, ["groups", "delete", "g-1"], input="n\n")
+        result = cli_runner.invoke(cli_app, ["groups", "delete", "g-1"], input="n\n")
         assert result.exit_code == 0
         assert "Cancelled" in result.output
 
@@ -193,66 +185,69 @@ class TestGroupsDeleteCommand:
 class TestGroupsMembersCommand:
     """Tests for groups members command."""
 
+    @pytest.mark.parametrize(
+        ("payload", "args", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "u1", "name": "Alice", "email": "alice@example.com"},
+                        {"id": "u2", "name": "Bob", "email": "bob@example.com"},
+                    ]
+                },
+                [],
+                "Alice",
+            ),
+            ({"items": []}, ["-p", "2", "-l", "25"], None),
+            ({"members": [{"id": "u1", "name": "User 1"}]}, [], "User 1"),
+        ],
+        ids=["items", "pagination", "members-key"],
+    )
     def test_list_group_members(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, run_cli, httpx_mock, mock_auth, payload, args, expected
     ) -> None:
-        """List group members."""
+        """List group members, with pagination and either list key."""
+        page, limit = (2, 25) if args else (1, 50)
         httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "u1", "name": "Alice", "email": "alice@example.com"},
-                    {"id": "u2", "name": "Bob", "email": "bob@example.com"},
-                ]
-            }
+            match_json={"groupId": "g-1", "page": page, "limit": limit}, json=payload
         )
 
-        result = runner.invoke(cli, ["groups", "members", "g-1"])
-        assert result.exit_code == 0
-        assert "Alice" in result.output
-
-    def test_list_group_members_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """List members with pagination."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["groups", "members", "g-1", "-p", "2", "-l", "25"])
+        result = run_cli(["groups", "members", "g-1", *args])
         assert result.exit_code == 0
+        if expected:
+            assert expected in result.output
 
-    def test_list_group_members_handles_members_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """List members handles 'members' key."""
+    def test_list_group_members_all_pages(self, run_cli, httpx_mock, mock_auth) -> None:
+        """List members with --all stops after the last short page."""
         httpx_mock.add_response(
-            json={"members": [{"id": "u1", "name": "User 1"}]}
+            json={"items": [{"id": "u1", "name": "Alice", "email": "alice@example.com"}]}
         )
 
-        result = runner.invoke(cli, ["groups", "members", "g-1"])
+        result = run_cli(["groups", "members", "g-1", "--all"])
         assert result.exit_code == 0
+        assert "Alice" in result.output
 
 
 class TestGroupsMembersAddCommand:
     """Tests for groups members-add command."""
 
-    def test_add_members_to_group(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_add_members_to_group(self, run_cli, api, mock_auth) -> None:
         """Add members to group."""
-        httpx_mock.add_response(json={"success": True})
+        api.add("/groups/members/add", json={"success": True})
 
-        result = runner.invoke(
-            cli, ["groups", "members-add", "g-1", "--user-ids", "u1,u2,u3"]
-        )
+        result = run_cli(["groups", "members-add", "g-1", "--user-ids", "u1,u2,u3"])
         assert result.exit_code == 0
         assert "Added 3 member(s)" in result.output
 
-    def test_add_single_member(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+        (request,) = api.requests
+        assert request.url.path == "/api/groups/members/add"
+        assert json.loads(request.content)["userIds"] == ["u1", "u2", "u3"]
+
+    def test_add_single_member(self, run_cli, api, mock_auth) -> None:
         """Add single member."""
-        httpx_mock.add_response(json={"success": True})
+        api.add("/groups/members/add", json={"success": True})
 
-        result = runner.invoke(cli, ["groups", "members-add", "g-1", "-u", "u1"])
+        result = run_cli(["groups", "members-add", "g-1", "-u", "u1"])
         assert result.exit_code == 0
         assert "Added 1 member(s)" in result.output
 
@@ -260,26 +255,22 @@ class TestGroupsMembersAddCommand:
 class TestGroupsMembersRemoveCommand:
     """Tests for groups members-remove command."""
 
-    def test_remove_member_from_group(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_remove_member_from_group(self, run_cli, api, mock_auth) -> None:
         """Remove member from group."""
-        httpx_mock.add_response(json={})
+        api.add("/groups/members/remove", json={})
 
-        result = runner.invoke(
-            cli, ["groups", "members-remove", "g-1", "--user-id", "u1"]
-        )
+        result = run_cli(["groups", "members-remove", "g-1", "--user-id", "u1"])
         assert result.exit_code == 0
         assert "Removed user 'u1'" in result.output
 
     def test_remove_member_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
+        self, cli_runner: CliRunner, cli_app, httpx_mock, mock_auth
     ) -> None:
         """Remove member handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "User not in group"})
 
-        result = runner.invoke(
-            cli, ["groups", "members-remove", "g-1", "-u", "nonexistent"]
+        result = cli_runner.invoke(
+            cli_app, ["groups", "members-remove", "g-1", "-u", "nonexistent"]
         )
         assert result.exit_code == 1
         assert "User not in group" in result.output
@@ -1,44 +1,42 @@
 """Tests for pages commands."""
 
+import json
 from unittest.mock import patch
 
 import pytest
 from click.testing import CliRunner
 
-from docmost.cli import cli
+from docmost.commands.pages import _starts_with_hash, generate_position
+
+pytestmark = [pytest.mark.xdist_group("cli_pages"), pytest.mark.usefixtures("mock_auth")]
 
 
 @pytest.fixture
-def runner() -> CliRunner:
-    """CLI test runner."""
-    return CliRunner()
+def page_routes(api):
+    """Route table answering page create, update and move with a bare page."""
+    for endpoint in ("/pages/create", "/pages/update", "/pages/move"):
+        api.add(endpoint, json={"id": "page-1"})
+    return api
 
 
 @pytest.fixture
-def mock_auth(tmp_path):
-    """Mock authentication for tests."""
-    config = {"url": "https://docs.example.com/api", "default_format": "json"}
-    with patch("docmost.config.load_config", return_value=config):
-        with patch("docmost.auth.get_token", return_value="test-token"):
-            yield
+def empty_response(httpx_mock) -> None:
+    """Answer the next request with an empty object."""
+    httpx_mock.add_response(json={})
 
 
 class TestPagesCreateCommand:
     """Tests for pages create command."""
 
-    def test_create_page(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_create_page(self, run_cli, httpx_mock) -> None:
         """Create a new page."""
         httpx_mock.add_response(json={"id": "page-123", "title": "My Page"})
 
-        result = runner.invoke(
-            cli, ["pages", "create", "--space-id", "space-1", "--title", "My Page"]
-        )
+        result = run_cli(["pages", "create", "--space-id", "space-1", "--title", "My Page"])
         assert result.exit_code == 0
-        assert "Page 'My Page' created" in result.output
+        assert b"Page 'My Page' created" in result.stdout_bytes
 
-    def test_create_page_with_content(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_create_page_with_content(self, run_cli, httpx_mock) -> None:
         """Create page with content uses import endpoint."""
         # Mock the import endpoint response
         httpx_mock.add_response(
@@ -47,15 +45,14 @@ class TestPagesCreateCommand:
                     "id": "page-1",
                     "title": "Test",
                     "slugId": "test123",
-                    "spaceId": "space-1"
+                    "spaceId": "space-1",
                 },
                 "success": True,
-                "status": 200
+                "status": 200,
             }
         )
 
-        result = runner.invoke(
-            cli,
+        result = run_cli(
             [
                 "pages",
                 "create",
@@ -68,90 +65,64 @@ class TestPagesCreateCommand:
             ],
         )
         assert result.exit_code == 0
-        assert "created with content" in result.output
+        assert b"created with content" in result.stdout_bytes
 
-    def test_create_page_with_parent(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Create page with parent page ID."""
-        httpx_mock.add_response(json={"id": "page-1"})
+    def test_create_page_content_gets_title_heading(self, run_cli, httpx_mock) -> None:
+        """Content without a heading is uploaded with the title as H1."""
+        httpx_mock.add_response(json={"id": "page-1", "title": "Test"})
+
+        result = run_cli(["pages", "create", "-s", "space-1", "-t", "Test", "-c", "Body text"])
+        assert result.exit_code == 0
+        assert b"# Test\n\nBody text" in httpx_mock.get_request().content
 
-        result = runner.invoke(
-            cli,
+    def test_create_page_with_parent(self, run_cli, page_routes) -> None:
+        """Create page with parent page ID."""
+        result = run_cli(
             ["pages", "create", "-s", "space-1", "-t", "Child", "-p", "parent-123"],
         )
         assert result.exit_code == 0
 
-        request = httpx_mock.get_request()
-        assert b'"parentPageId":"parent-123"' in request.content
-
-    def test_create_page_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Create page handles error."""
-        httpx_mock.add_response(status_code=400, json={"message": "Invalid space"})
-
-        result = runner.invoke(
-            cli, ["pages", "create", "-s", "invalid", "-t", "Test"]
-        )
-        assert result.exit_code == 1
-        assert "Invalid space" in result.output
+        (request,) = page_routes.requests
+        assert json.loads(request.content)["parentPageId"] == "parent-123"
 
 
 class TestPagesInfoCommand:
     """Tests for pages info command."""
 
-    def test_page_info(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_page_info(self, run_cli, httpx_mock) -> None:
         """Get page info."""
-        httpx_mock.add_response(
-            json={"id": "page-123", "title": "My Page", "content": "# Content"}
-        )
+        httpx_mock.add_response(json={"id": "page-123", "title": "My Page", "content": "# Content"})
 
-        result = runner.invoke(cli, ["pages", "info", "page-123"])
+        result = run_cli(["pages", "info", "page-123"])
         assert result.exit_code == 0
-        assert "My Page" in result.output
-
-    def test_page_info_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Page info handles not found."""
-        httpx_mock.add_response(status_code=404, json={"message": "Page not found"})
-
-        result = runner.invoke(cli, ["pages", "info", "nonexistent"])
-        assert result.exit_code == 1
-        assert "Page not found" in result.output
+        assert b"My Page" in result.stdout_bytes
 
 
 class TestPagesUpdateCommand:
     """Tests for pages update command."""
 
-    def test_update_page_title(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Update page title."""
-        httpx_mock.add_response(json={"id": "page-1", "title": "New Title"})
-
-        result = runner.invoke(
-            cli, ["pages", "update", "page-1", "--title", "New Title"]
-        )
+    @pytest.mark.parametrize(
+        ("flag", "value"),
+        [
+            ("--title", "New Title"),
+            ("--icon", "star"),
+            ("--cover-photo", "https://example.com/img.png"),
+        ],
+        ids=["title", "icon", "cover-photo"],
+    )
+    @pytest.mark.usefixtures("page_routes")
+    def test_update_page_metadata(self, run_cli, flag, value) -> None:
+        """Update a page's title, icon or cover photo."""
+        result = run_cli(["pages", "update", "page-1", flag, value])
         assert result.exit_code == 0
-        assert "Page 'page-1' updated" in result.output
+        assert b"Page 'page-1' updated" in result.stdout_bytes
 
-    def test_update_page_content(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Update page content uses delete+import."""
+    def test_update_page_content(self, cli_runner: CliRunner, cli_app, httpx_mock) -> None:
+        """Update page content uses import+delete."""
         # Mock page info response (needed to get spaceId)
         httpx_mock.add_response(
-            json={
-                "id": "page-1",
-                "title": "Old Title",
-                "spaceId": "space-1",
-                "slugId": "old123"
-            }
+            json={"id": "page-1", "title": "Old Title", "spaceId": "space-1", "slugId": "old123"}
         )
-        # Mock delete response
-        httpx_mock.add_response(json={})
         # Mock import response
         httpx_mock.add_response(
             json={
@@ -159,165 +130,212 @@ class TestPagesUpdateCommand:
                     "id": "page-2",
                     "title": "Updated content",
                     "slugId": "new456",
-                    "spaceId": "space-1"
+                    "spaceId": "space-1",
                 },
                 "success": True,
-                "status": 200
+                "status": 200,
             }
         )
+        # Mock delete response
+        httpx_mock.add_response(json={})
 
-        result = runner.invoke(
-            cli, ["pages", "update", "page-1", "-c", "# Updated content"],
-            input="y\n"  # Confirm the delete+import
+        result = cli_runner.invoke(
+            cli_app,
+            ["pages", "update", "page-1", "-c", "# Updated content"],
+            input="y\n",  # Confirm the delete+import
         )
         assert result.exit_code == 0
         assert "updated with new content" in result.output
 
-    def test_update_page_icon(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Update page icon."""
-        httpx_mock.add_response(json={"id": "page-1"})
+        paths = [request.url.path for request in httpx_mock.get_requests()]
+        assert paths == ["/api/pages/info", "/api/pages/import", "/api/pages/delete"]
 
-        result = runner.invoke(cli, ["pages", "update", "page-1", "--icon", "star"])
-        assert result.exit_code == 0
+    def test_update_page_content_failed_import_keeps_page(
+        self, cli_runner: CliRunner, cli_app, httpx_mock
+    ) -> None:
+        """A failed import never deletes the original page."""
+        httpx_mock.add_response(json={"id": "page-1", "title": "Old", "spaceId": "space-1"})
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
+
+        result = cli_runner.invoke(
+            cli_app, ["pages", "update", "page-1", "-c", "# New"], input="y\n"
+        )
+        assert result.exit_code == 1
+        paths = [request.url.path for request in httpx_mock.get_requests()]
+        assert "/api/pages/delete" not in paths
 
-    def test_update_page_cover_photo(
-        self, runner: CliRunner, httpx_mock, mock_auth
+    def test_update_page_content_failed_delete_reports_new_page(
+        self, cli_runner: CliRunner, cli_app, httpx_mock
     ) -> None:
-        """Update page cover photo."""
-        httpx_mock.add_response(json={"id": "page-1"})
+        """A failed delete names the new page and warns that the old one remains."""
+        httpx_mock.add_response(json={"id": "page-1", "title": "Old", "spaceId": "space-1"})
+        httpx_mock.add_response(
+            json={
+                "data": {"id": "page-2", "title": "New", "slugId": "new456"},
+                "success": True,
+                "status": 200,
+            }
+        )
+        httpx_mock.add_response(status_code=500, json={"message": "boom"})
 
-        result = runner.invoke(
-            cli, ["pages", "update", "page-1", "--cover-photo", "https://example.com/img.png"]
+        result = cli_runner.invoke(
+            cli_app, ["pages", "update", "page-1", "-c", "# New"], input="y\n"
         )
-        assert result.exit_code == 0
+        assert result.exit_code == 1
+        assert "page-2" in result.stderr
+        assert "new456" in result.stderr
+        assert "old page 'page-1' still exists" in result.output
+        paths = [request.url.path for request in httpx_mock.get_requests()]
+        assert paths == ["/api/pages/info", "/api/pages/import", "/api/pages/delete"]
 
 
 class TestPagesDeleteCommand:
     """Tests for pages delete command."""
 
-    def test_delete_page_with_force(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_delete_page_with_force(self, run_cli, empty_response) -> None:
         """Delete page with --force flag."""
-        httpx_mock.add_response(json={})
-
-        result = runner.invoke(cli, ["pages", "delete", "page-1", "--force"])
+        result = run_cli(["pages", "delete", "page-1", "--force"])
         assert result.exit_code == 0
-        assert "Page 'page-1' deleted" in result.output
+        assert b"Page 'page-1' deleted" in result.stdout_bytes
 
-    def test_delete_page_with_confirmation(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Delete page with confirmation."""
-        httpx_mock.add_response(json={})
+    def test_delete_page_with_confirmation(self, run_cli, empty_response, monkeypatch) -> None:
+        """Delete page after the user confirms."""
+        monkeypatch.setattr("click.confirm", lambda *args, **kwargs: True)
 
-        result = runner.invoke(cli, ["pages", "delete", "page-1"], input="y\n")
+        result = run_cli(["pages", "delete", "page-1"])
         assert result.exit_code == 0
+        assert b"Page 'page-1' deleted" in result.stdout_bytes
 
-    def test_delete_page_cancelled(self, runner: CliRunner, mock_auth) -> None:
+    def test_delete_page_cancelled(self, run_cli, monkeypatch) -> None:
         """Delete page cancelled by user."""
-        result = runner.invoke(cli, ["pages", "delete", "page-1"], input="n\n")
+        monkeypatch.setattr("click.confirm", lambda *args, **kwargs: False)
+
+        result = run_cli(["pages", "delete", "page-1"])
         assert result.exit_code == 0
-        assert "Cancelled" in result.output
+        assert b"Cancelled" in result.stdout_bytes
 
 
+@pytest.mark.usefixtures("page_routes")
 class TestPagesMoveCommand:
     """Tests for pages move command."""
 
-    def test_move_page_to_parent(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Move page to new parent."""
-        httpx_mock.add_response(json={"id": "page-1"})
-
-        result = runner.invoke(
-            cli, ["pages", "move", "page-1", "--parent-id", "new-parent"]
-        )
-        assert result.exit_code == 0
-        assert "Page 'page-1' moved" in result.output
-
-    def test_move_page_after(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Move page after another page."""
-        httpx_mock.add_response(json={"id": "page-1"})
-
-        result = runner.invoke(cli, ["pages", "move", "page-1", "--after", "page-2"])
-        assert result.exit_code == 0
-
-    def test_move_page_before(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Move page before another page."""
-        httpx_mock.add_response(json={"id": "page-1"})
-
-        result = runner.invoke(cli, ["pages", "move", "page-1", "--before", "page-2"])
+    @pytest.mark.parametrize(
+        ("flag", "value"),
+        [("--parent-id", "new-parent"), ("--after", "page-2"), ("--before", "page-2")],
+        ids=["parent", "after", "before"],
+    )
+    def test_move_page(self, run_cli, flag, value) -> None:
+        """Move a page under a parent, or after or before a sibling."""
+        result = run_cli(["pages", "move", "page-1", flag, value])
         assert result.exit_code == 0
+        assert b"Page 'page-1' moved" in result.stdout_bytes
+
+
+class TestStartsWithHash:
+    """Tests for _starts_with_hash."""
+
+    @pytest.mark.parametrize(
+        ("content", "expected"),
+        [
+            ("# Title", True),
+            ("  \n\t# Title", True),
+            ("Body # not a heading", False),
+            ("   ", False),
+            ("", False),
+        ],
+    )
+    def test_detects_leading_heading(self, content: str, expected: bool) -> None:
+        """Leading whitespace is skipped before checking for '#'."""
+        assert _starts_with_hash(content) is expected
+
+
+class TestGeneratePosition:
+    """Tests for generate_position."""
+
+    def test_position_is_valid_base62(self) -> None:
+        """Positions are 6-12 base62 chars prefixed with 'a'."""
+        for _ in range(100):
+            pos = generate_position()
+            assert 6 <= len(pos) <= 12
+            assert pos[0] == "a"
+            assert pos.isalnum() and pos.isascii()
+
+    def test_positions_are_unique(self) -> None:
+        """Consecutive calls do not collide."""
+        assert len({generate_position() for _ in range(100)}) == 100
+
+    def test_small_value_is_zero_padded(self) -> None:
+        """Short encodings are padded to five digits."""
+        with patch("docmost.commands.pages.os.urandom", return_value=bytes(6)):
+            assert generate_position(61) == "a0000z"
+
+    def test_long_value_is_not_padded(self) -> None:
+        """Encodings longer than five digits are kept whole."""
+        value = (62**5).to_bytes(6, "big")
+        with patch("docmost.commands.pages.os.urandom", return_value=value):
+            assert generate_position() == "a100000"
 
 
 class TestPagesTreeCommand:
     """Tests for pages tree command."""
 
-    def test_page_tree(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Get page tree for a space."""
-        httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "p1", "title": "Page 1", "parentPageId": None},
-                    {"id": "p2", "title": "Page 2", "parentPageId": "p1"},
-                ]
-            }
-        )
-
-        result = runner.invoke(cli, ["pages", "tree", "space-1"])
-        assert result.exit_code == 0
-        assert "Page 1" in result.output
-
-    def test_page_tree_handles_pages_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Page tree handles 'pages' key in response."""
-        httpx_mock.add_response(
-            json={"pages": [{"id": "p1", "title": "Root"}]}
-        )
-
-        result = runner.invoke(cli, ["pages", "tree", "space-1"])
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "p1", "title": "Page 1", "parentPageId": None},
+                        {"id": "p2", "title": "Page 2", "parentPageId": "p1"},
+                    ]
+                },
+                "Page 1",
+            ),
+            ({"pages": [{"id": "p1", "title": "Root"}]}, "Root"),
+        ],
+        ids=["items", "pages-key"],
+    )
+    def test_page_tree(self, run_cli, httpx_mock, payload, expected) -> None:
+        """Get page tree for a space, with either list key."""
+        httpx_mock.add_response(json=payload)
+
+        result = run_cli(["pages", "tree", "space-1"])
         assert result.exit_code == 0
+        assert expected in result.output
 
 
 class TestPagesRecentCommand:
     """Tests for pages recent command."""
 
-    def test_recent_pages(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Get recent pages."""
-        httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "p1", "title": "Recent 1", "updatedAt": "2024-01-15"},
-                ]
-            }
-        )
-
-        result = runner.invoke(cli, ["pages", "recent"])
+    @pytest.mark.parametrize(
+        ("payload", "args", "expected"),
+        [
+            (
+                {"items": [{"id": "p1", "title": "Recent 1", "updatedAt": "2024-01-15"}]},
+                [],
+                "Recent 1",
+            ),
+            ({"items": []}, ["-p", "2", "-l", "10"], None),
+        ],
+        ids=["items", "pagination"],
+    )
+    def test_recent_pages(self, run_cli, httpx_mock, payload, args, expected) -> None:
+        """Get recent pages, with pagination."""
+        page, limit = (2, 10) if args else (1, 20)
+        httpx_mock.add_response(match_json={"page": page, "limit": limit}, json=payload)
+
+        result = run_cli(["pages", "recent", *args])
         assert result.exit_code == 0
-        assert "Recent 1" in result.output
+        if expected:
+            assert expected in result.output
 
-    def test_recent_pages_filter_by_space(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_recent_pages_filter_by_space(self, run_cli, httpx_mock, empty_items) -> None:
         """Filter recent pages by space."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["pages", "recent", "--space-id", "space-1"])
+        result = run_cli(["pages", "recent", "--space-id", "space-1"])
         assert result.exit_code == 0
 
-        request = httpx_mock.get_request()
-        assert b'"spaceId":"space-1"' in request.content
-
-    def test_recent_pages_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Recent pages with pagination."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["pages", "recent", "-p", "2", "-l", "10"])
-        assert result.exit_code == 0
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["spaceId"] == "space-1"
 
 
 class TestPagesExportCommand:
@@ -334,63 +352,67 @@ class TestPagesExportCommand:
             zf.writestr(filename, content)
         return zip_buffer.getvalue()
 
-    def test_export_page_to_stdout(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_export_page_to_stdout(self, run_cli, httpx_mock) -> None:
         """Export page to stdout (ZIP response)."""
         zip_content = self._create_zip_with_content("# My Page\n\nContent here")
         httpx_mock.add_response(content=zip_content)
 
-        result = runner.invoke(cli, ["pages", "export", "page-1"])
+        result = run_cli(["pages", "export", "page-1"])
         assert result.exit_code == 0
-        assert "# My Page" in result.output
+        assert b"# My Page" in result.stdout_bytes
 
-    def test_export_page_as_html(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_export_page_as_html(self, run_cli, httpx_mock) -> None:
         """Export page as HTML (ZIP response)."""
-        zip_content = self._create_zip_with_content(
-            "<h1>My Page</h1>", filename="export.html"
-        )
+        zip_content = self._create_zip_with_content("<h1>My Page</h1>", filename="export.html")
         httpx_mock.add_response(content=zip_content)
 
-        result = runner.invoke(cli, ["pages", "export", "page-1", "-f", "html"])
+        result = run_cli(["pages", "export", "page-1", "-f", "html"])
         assert result.exit_code == 0
-        assert "<h1>My Page</h1>" in result.output
+        assert b"<h1>My Page</h1>" in result.stdout_bytes
 
-    def test_export_page_to_file(
-        self, runner: CliRunner, httpx_mock, mock_auth, tmp_path
-    ) -> None:
+    def test_export_page_to_file(self, run_cli, httpx_mock, tmp_path) -> None:
         """Export page to file (ZIP response)."""
         zip_content = self._create_zip_with_content("# Exported content")
         httpx_mock.add_response(content=zip_content)
         output_file = tmp_path / "exported.md"
 
-        result = runner.invoke(
-            cli, ["pages", "export", "page-1", "-o", str(output_file)]
-        )
+        result = run_cli(["pages", "export", "page-1", "-o", str(output_file)])
         assert result.exit_code == 0
-        assert "Exported to" in result.output
+        assert b"Exported to" in result.stdout_bytes
         assert output_file.read_text() == "# Exported content"
 
-    def test_export_page_plain_text_fallback(
-        self, runner: CliRunner, httpx_mock, mock_auth
+    def test_export_page_rejects_directory_output(
+        self, cli_runner: CliRunner, cli_app, httpx_mock, tmp_path
     ) -> None:
+        """A directory passed to --output fails before any request is made."""
+        result = cli_runner.invoke(cli_app, ["pages", "export", "page-1", "-o", str(tmp_path)])
+        assert result.exit_code == 2
+        assert "is a directory" in result.output
+        assert httpx_mock.get_requests() == []
+
+    def test_export_page_to_file_keeps_utf8_bytes(self, run_cli, httpx_mock, tmp_path) -> None:
+        """Exported files hold the ZIP entry's UTF-8 bytes unchanged."""
+        httpx_mock.add_response(content=self._create_zip_with_content("# Café ☕\n"))
+        output_file = tmp_path / "exported.md"
+
+        result = run_cli(["pages", "export", "page-1", "-o", str(output_file)])
+        assert result.exit_code == 0
+        assert output_file.read_bytes() == "# Café ☕\n".encode()
+
+    def test_export_page_plain_text_fallback(self, run_cli, httpx_mock) -> None:
         """Export handles plain text response (non-ZIP fallback)."""
         # If the API ever returns plain text instead of ZIP
         httpx_mock.add_response(content=b"# Plain text content")
 
-        result = runner.invoke(cli, ["pages", "export", "page-1"])
+        result = run_cli(["pages", "export", "page-1"])
         assert result.exit_code == 0
-        assert "# Plain text content" in result.output
+        assert b"# Plain text content" in result.stdout_bytes
 
-    def test_export_page_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_export_page_not_found(self, cli_runner: CliRunner, cli_app, httpx_mock) -> None:
         """Export handles page not found error."""
         httpx_mock.add_response(status_code=404)
 
-        result = runner.invoke(cli, ["pages", "export", "nonexistent"])
+        result = cli_runner.invoke(cli_app, ["pages", "export", "nonexistent"])
         assert result.exit_code == 1
         assert "not found" in result.output.lower()
 
@@ -398,100 +420,71 @@ class TestPagesExportCommand:
 class TestPagesHistoryCommand:
     """Tests for pages history command."""
 
-    def test_page_history(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Get page revision history."""
-        httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "rev-1", "version": 1, "createdAt": "2024-01-01"},
-                    {"id": "rev-2", "version": 2, "createdAt": "2024-01-02"},
-                ]
-            }
-        )
-
-        result = runner.invoke(cli, ["pages", "history", "page-1"])
-        assert result.exit_code == 0
-        assert "rev-1" in result.output
-
-    def test_page_history_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Page history with pagination."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["pages", "history", "page-1", "-p", "2", "-l", "5"])
-        assert result.exit_code == 0
-
-    def test_page_history_handles_history_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Page history handles 'history' key."""
+    @pytest.mark.parametrize(
+        ("payload", "args", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "rev-1", "version": 1, "createdAt": "2024-01-01"},
+                        {"id": "rev-2", "version": 2, "createdAt": "2024-01-02"},
+                    ]
+                },
+                [],
+                "rev-1",
+            ),
+            ({"items": []}, ["-p", "2", "-l", "5"], None),
+            ({"history": [{"id": "rev-1", "version": 1}]}, [], "rev-1"),
+        ],
+        ids=["items", "pagination", "history-key"],
+    )
+    def test_page_history(self, run_cli, httpx_mock, payload, args, expected) -> None:
+        """Get page revision history, with pagination and either list key."""
+        page, limit = (2, 5) if args else (1, 20)
         httpx_mock.add_response(
-            json={"history": [{"id": "rev-1", "version": 1}]}
+            match_json={"pageId": "page-1", "page": page, "limit": limit}, json=payload
         )
 
-        result = runner.invoke(cli, ["pages", "history", "page-1"])
+        result = run_cli(["pages", "history", "page-1", *args])
         assert result.exit_code == 0
+        if expected:
+            assert expected in result.output
 
 
 class TestPagesBreadcrumbsCommand:
     """Tests for pages breadcrumbs command."""
 
-    def test_page_breadcrumbs(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Get breadcrumb path for a page."""
-        httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "root-1", "title": "Root", "icon": "home"},
-                    {"id": "parent-1", "title": "Parent", "icon": "folder"},
-                    {"id": "page-1", "title": "Current Page", "icon": "file"},
-                ]
-            }
-        )
-
-        result = runner.invoke(cli, ["pages", "breadcrumbs", "page-1"])
-        assert result.exit_code == 0
-        assert "Root" in result.output
-        assert "Parent" in result.output
-        assert "Current Page" in result.output
-
-    def test_page_breadcrumbs_handles_breadcrumbs_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Breadcrumbs handles 'breadcrumbs' key in response."""
-        httpx_mock.add_response(
-            json={"breadcrumbs": [{"id": "p1", "title": "Root"}]}
-        )
-
-        result = runner.invoke(cli, ["pages", "breadcrumbs", "page-1"])
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "root-1", "title": "Root", "icon": "home"},
+                        {"id": "parent-1", "title": "Parent", "icon": "folder"},
+                        {"id": "page-1", "title": "Current Page", "icon": "file"},
+                    ]
+                },
+                ["Root", "Parent", "Current Page"],
+            ),
+            ({"breadcrumbs": [{"id": "p1", "title": "Root"}]}, ["Root"]),
+        ],
+        ids=["items", "breadcrumbs-key"],
+    )
+    def test_page_breadcrumbs(self, run_cli, httpx_mock, payload, expected) -> None:
+        """Get breadcrumb path for a page, with either list key."""
+        httpx_mock.add_response(json=payload)
+
+        result = run_cli(["pages", "breadcrumbs", "page-1"])
         assert result.exit_code == 0
-        assert "Root" in result.output
-
-    def test_page_breadcrumbs_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Breadcrumbs handles page not found."""
-        httpx_mock.add_response(status_code=404, json={"message": "Page not found"})
-
-        result = runner.invoke(cli, ["pages", "breadcrumbs", "nonexistent"])
-        assert result.exit_code == 1
-        assert "Page not found" in result.output
-
-    def test_page_breadcrumbs_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Breadcrumbs handles API error."""
-        httpx_mock.add_response(status_code=500, json={"message": "Internal error"})
-
-        result = runner.invoke(cli, ["pages", "breadcrumbs", "page-1"])
-        assert result.exit_code == 1
-        assert "Internal error" in result.output
+        for title in expected:
+            assert title in result.output
 
 
 class TestPagesHistoryInfoCommand:
     """Tests for pages history-info command."""
 
-    def test_history_info(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+    def test_history_info(self, run_cli, httpx_mock) -> None:
         """Get details of a specific history entry."""
         httpx_mock.add_response(
             json={
@@ -504,29 +497,44 @@ class TestPagesHistoryInfoCommand:
             }
         )
 
-        result = runner.invoke(cli, ["pages", "history-info", "hist-123"])
+        result = run_cli(["pages", "history-info", "hist-123"])
         assert result.exit_code == 0
-        assert "hist-123" in result.output
+        assert b"hist-123" in result.stdout_bytes
         assert "version" in result.output.lower() or "5" in result.output
 
-    def test_history_info_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """History info handles not found."""
-        httpx_mock.add_response(
-            status_code=404, json={"message": "History entry not found"}
-        )
-
-        result = runner.invoke(cli, ["pages", "history-info", "nonexistent"])
-        assert result.exit_code == 1
-        assert "History entry not found" in result.output
 
-    def test_history_info_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
+# (argv, status code, API error message) for commands that surface API errors
+API_ERRORS = [
+    (["pages", "create", "-s", "invalid", "-t", "Test"], 400, "Invalid space"),
+    (["pages", "info", "nonexistent"], 404, "Page not found"),
+    (["pages", "breadcrumbs", "nonexistent"], 404, "Page not found"),
+    (["pages", "breadcrumbs", "page-1"], 500, "Internal error"),
+    (["pages", "history-info", "nonexistent"], 404, "History entry not found"),
+    (["pages", "history-info", "hist-123"], 500, "Server error"),
+]
+
+
+class TestPagesApiErrors:
+    """Tests for API errors across pages commands."""
+
+    @pytest.mark.parametrize(
+        ("argv", "status_code", "message"),
+        API_ERRORS,
+        ids=[
+            "create-400",
+            "info-404",
+            "breadcrumbs-404",
+            "breadcrumbs-500",
+            "history-info-404",
+            "history-info-500",
+        ],
+    )
+    def test_api_error(
+        self, cli_runner: CliRunner, cli_app, httpx_mock, argv, status_code, message
     ) -> None:
-        """History info handles API error."""
-        httpx_mock.add_response(status_code=500, json={"message": "Server error"})
+        """The API's error message is shown and the command exits 1."""
+        httpx_mock.add_response(status_code=status_code, json={"message": message})
 
-        result = runner.invoke(cli, ["pages", "history-info", "hist-123"])
+        result = cli_runner.invoke(cli_app, argv)
         assert result.exit_code == 1
-        assert "Server error" in result.output
+        assert message in result.output
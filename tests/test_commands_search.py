@@ -1,176 +1,123 @@
 """Tests for search commands."""
 
-from unittest.mock import patch
+import json
 
 import pytest
 from click.testing import CliRunner
 
-from docmost.cli import cli
-
-
-@pytest.fixture
-def runner() -> CliRunner:
-    """CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def mock_auth(tmp_path):
-    """Mock authentication for tests."""
-    config = {"url": "https://docs.example.com/api", "default_format": "json"}
-    with patch("docmost.config.load_config", return_value=config):
-        with patch("docmost.auth.get_token", return_value="test-token"):
-            yield
+pytestmark = [pytest.mark.xdist_group("cli_search"), pytest.mark.usefixtures("mock_auth")]
 
 
 class TestSearchCommand:
     """Tests for search command."""
 
-    def test_search_pages(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Search pages and content."""
+    @pytest.mark.parametrize(
+        ("payload", "args", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "p1", "title": "Getting Started", "highlight": "...matched..."},
+                        {"id": "p2", "title": "API Reference", "highlight": "...API docs..."},
+                    ]
+                },
+                [],
+                "Getting Started",
+            ),
+            ({"items": []}, ["-p", "2", "-l", "10"], None),
+            ({"results": [{"id": "p1", "title": "Result 1"}]}, [], "Result 1"),
+            ({"items": []}, [], None),
+        ],
+        ids=["items", "pagination", "results-key", "no-results"],
+    )
+    def test_search(self, run_cli, httpx_mock, payload, args, expected) -> None:
+        """Search pages, with pagination and either list key."""
+        page, limit = (2, 10) if args else (1, 20)
         httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "p1", "title": "Getting Started", "highlight": "...matched text..."},
-                    {"id": "p2", "title": "API Reference", "highlight": "...API docs..."},
-                ]
-            }
+            match_json={"query": "query", "page": page, "limit": limit}, json=payload
         )
 
-        result = runner.invoke(cli, ["search", "getting started"])
-        assert result.exit_code == 0
-        assert "Getting Started" in result.output
-
-    def test_search_with_space_filter(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Search with space filter."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["search", "test query", "--space-id", "space-1"])
+        result = run_cli(["search", "query", *args])
         assert result.exit_code == 0
+        if expected:
+            assert expected in result.output
 
-        request = httpx_mock.get_request()
-        assert b'"spaceId":"space-1"' in request.content
+    def test_search_uses_cli_config_format(self, run_cli, httpx_mock) -> None:
+        """Without --format, output follows the mocked config's default_format."""
+        httpx_mock.add_response(json={"items": [{"id": "p1", "title": "Result 1"}]})
 
-    def test_search_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Search with pagination."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["search", "query", "-p", "2", "-l", "10"])
+        result = run_cli(["search", "query"])
         assert result.exit_code == 0
+        assert json.loads(result.output) == [{"id": "p1", "title": "Result 1"}]
 
-        request = httpx_mock.get_request()
-        assert b'"page":2' in request.content
-        assert b'"limit":10' in request.content
-
-    def test_search_handles_results_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Search handles 'results' key."""
-        httpx_mock.add_response(
-            json={"results": [{"id": "p1", "title": "Result 1"}]}
-        )
-
-        result = runner.invoke(cli, ["search", "test"])
-        assert result.exit_code == 0
-
-    def test_search_no_results(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Search with no results."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["search", "nonexistent query"])
+    def test_search_with_space_filter(self, run_cli, httpx_mock, empty_items) -> None:
+        """Search with space filter."""
+        result = run_cli(["search", "test query", "--space-id", "space-1"])
         assert result.exit_code == 0
 
-    def test_search_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Search handles error."""
-        httpx_mock.add_response(status_code=500, json={"message": "Search unavailable"})
-
-        result = runner.invoke(cli, ["search", "test"])
-        assert result.exit_code == 1
-        assert "Search unavailable" in result.output
+        body = json.loads(httpx_mock.get_request().content)
+        assert body["spaceId"] == "space-1"
 
 
 class TestSuggestCommand:
     """Tests for suggest (autocomplete) command."""
 
-    def test_suggest_basic(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Get search suggestions."""
-        httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "p1", "title": "Getting Started", "type": "page"},
-                    {"id": "p2", "title": "Get API Key", "type": "page"},
-                ]
-            }
-        )
-
-        result = runner.invoke(cli, ["suggest", "get"])
+    @pytest.mark.parametrize(
+        ("payload", "expected"),
+        [
+            (
+                {
+                    "items": [
+                        {"id": "p1", "title": "Getting Started", "type": "page"},
+                        {"id": "p2", "title": "Get API Key", "type": "page"},
+                    ]
+                },
+                "Getting Started",
+            ),
+            (
+                {"suggestions": [{"id": "p1", "title": "Suggestion 1", "type": "page"}]},
+                "Suggestion 1",
+            ),
+        ],
+        ids=["items", "suggestions-key"],
+    )
+    def test_suggest(self, run_cli, httpx_mock, payload, expected) -> None:
+        """Get search suggestions, with either list key."""
+        httpx_mock.add_response(json=payload)
+
+        result = run_cli(["suggest", "get"])
         assert result.exit_code == 0
-        assert "Getting Started" in result.output
-
-    def test_suggest_include_users(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Suggest with users included."""
-        httpx_mock.add_response(
-            json={
-                "items": [
-                    {"id": "u1", "title": "John Doe", "type": "user"},
-                ]
-            }
-        )
-
-        result = runner.invoke(cli, ["suggest", "john", "--include-users"])
+        assert expected in result.output
+
+    @pytest.mark.parametrize(
+        ("args", "included"),
+        [
+            (["--include-users"], {"includeUsers": True}),
+            (["--include-groups"], {"includeGroups": True}),
+            (["-u", "-g"], {"includeUsers": True, "includeGroups": True}),
+        ],
+        ids=["users", "groups", "both"],
+    )
+    def test_suggest_include(self, run_cli, httpx_mock, args, included) -> None:
+        """Suggest sends the include flags that were given."""
+        httpx_mock.add_response(match_json={"query": "test", **included}, json={"items": []})
+
+        result = run_cli(["suggest", "test", *args])
         assert result.exit_code == 0
 
-        request = httpx_mock.get_request()
-        assert b'"includeUsers":true' in request.content
-
-    def test_suggest_include_groups(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Suggest with groups included."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["suggest", "eng", "--include-groups"])
-        assert result.exit_code == 0
 
-        request = httpx_mock.get_request()
-        assert b'"includeGroups":true' in request.content
-
-    def test_suggest_include_both(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Suggest with both users and groups."""
-        httpx_mock.add_response(json={"items": []})
-
-        result = runner.invoke(cli, ["suggest", "test", "-u", "-g"])
-        assert result.exit_code == 0
-
-        request = httpx_mock.get_request()
-        assert b'"includeUsers":true' in request.content
-        assert b'"includeGroups":true' in request.content
-
-    def test_suggest_handles_suggestions_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Suggest handles 'suggestions' key."""
-        httpx_mock.add_response(
-            json={"suggestions": [{"id": "p1", "title": "Suggestion 1", "type": "page"}]}
-        )
-
-        result = runner.invoke(cli, ["suggest", "test"])
-        assert result.exit_code == 0
+class TestSearchApiErrors:
+    """Tests for API errors in search and suggest."""
 
-    def test_suggest_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
-        """Suggest handles error."""
-        httpx_mock.add_response(status_code=500, json={"message": "Service unavailable"})
+    @pytest.mark.parametrize(
+        ("argv", "message"),
+        [(["search", "test"], "Search unavailable"), (["suggest", "test"], "Service unavailable")],
+        ids=["search", "suggest"],
+    )
+    def test_api_error(self, cli_runner: CliRunner, cli_app, httpx_mock, argv, message) -> None:
+        """The API's error message is shown and the command exits 1."""
+        httpx_mock.add_response(status_code=500, json={"message": message})
 
-        result = runner.invoke(cli, ["suggest", "test"])
+        result = cli_runner.invoke(cli_app, argv)
         assert result.exit_code == 1
-        assert "Service unavailable" in result.output
+        assert message in result.output
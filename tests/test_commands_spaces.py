@@ -1,5 +1,6 @@
 """Tests for spaces commands."""
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -16,7 +17,7 @@ def runner() -> CliRunner:
 
 
 @pytest.fixture
-def mock_auth(tmp_path):
+def mock_auth():
     """Mock authentication for tests."""
     config = {"url": "https://docs.example.com/api", "default_format": "json"}
     with patch("docmost.config.load_config", return_value=config):
@@ -43,9 +44,7 @@ class TestSpacesListCommand:
         assert "space-1" in result.output
         assert "Engineering" in result.output
 
-    def test_list_spaces_with_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_list_spaces_with_pagination(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """List spaces with page and limit options."""
         httpx_mock.add_response(json={"items": []})
 
@@ -56,13 +55,9 @@ class TestSpacesListCommand:
         assert b'"page":2' in request.content
         assert b'"limit":10' in request.content
 
-    def test_list_spaces_handles_spaces_key(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_list_spaces_handles_spaces_key(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """List handles response with 'spaces' key."""
-        httpx_mock.add_response(
-            json={"spaces": [{"id": "s1", "name": "Space One", "slug": "s1"}]}
-        )
+        httpx_mock.add_response(json={"spaces": [{"id": "s1", "name": "Space One", "slug": "s1"}]})
 
         result = runner.invoke(cli, ["spaces", "list"])
         assert result.exit_code == 0
@@ -82,17 +77,13 @@ class TestSpacesInfoCommand:
 
     def test_space_info(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Get space info."""
-        httpx_mock.add_response(
-            json={"id": "space-123", "name": "My Space", "description": "Test"}
-        )
+        httpx_mock.add_response(json={"id": "space-123", "name": "My Space", "description": "Test"})
 
         result = runner.invoke(cli, ["spaces", "info", "space-123"])
         assert result.exit_code == 0
         assert "My Space" in result.output
 
-    def test_space_info_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_space_info_not_found(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Space info handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "Space not found"})
 
@@ -114,9 +105,7 @@ class TestSpacesCreateCommand:
         assert result.exit_code == 0
         assert "Space 'New Space' created" in result.output
 
-    def test_create_space_with_description(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_create_space_with_description(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Create space with description."""
         httpx_mock.add_response(json={"id": "s1", "name": "S1"})
 
@@ -138,15 +127,11 @@ class TestSpacesCreateCommand:
         request = httpx_mock.get_request()
         assert b'"description":"A test space"' in request.content
 
-    def test_create_space_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_create_space_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Create space handles error."""
         httpx_mock.add_response(status_code=400, json={"message": "Slug already exists"})
 
-        result = runner.invoke(
-            cli, ["spaces", "create", "-n", "Test", "-s", "existing"]
-        )
+        result = runner.invoke(cli, ["spaces", "create", "-n", "Test", "-s", "existing"])
         assert result.exit_code == 1
         assert "Slug already exists" in result.output
 
@@ -158,21 +143,15 @@ class TestSpacesUpdateCommand:
         """Update space name."""
         httpx_mock.add_response(json={"id": "space-1", "name": "Updated Name"})
 
-        result = runner.invoke(
-            cli, ["spaces", "update", "space-1", "--name", "Updated Name"]
-        )
+        result = runner.invoke(cli, ["spaces", "update", "space-1", "--name", "Updated Name"])
         assert result.exit_code == 0
         assert "Space 'space-1' updated" in result.output
 
-    def test_update_space_description(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_space_description(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Update space description."""
         httpx_mock.add_response(json={"id": "space-1"})
 
-        result = runner.invoke(
-            cli, ["spaces", "update", "space-1", "-d", "New description"]
-        )
+        result = runner.invoke(cli, ["spaces", "update", "space-1", "-d", "New description"])
         assert result.exit_code == 0
 
     def test_update_space_icon(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
@@ -186,9 +165,7 @@ class TestSpacesUpdateCommand:
 class TestSpacesDeleteCommand:
     """Tests for spaces delete command."""
 
-    def test_delete_space_with_force(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_delete_space_with_force(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Delete space with --force flag."""
         httpx_mock.add_response(json={})
 
@@ -196,9 +173,7 @@ class TestSpacesDeleteCommand:
         assert result.exit_code == 0
         assert "Space 'space-1' deleted" in result.output
 
-    def test_delete_space_with_confirmation(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_delete_space_with_confirmation(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Delete space with confirmation prompt."""
         httpx_mock.add_response(json={})
 
@@ -206,9 +181,7 @@ class TestSpacesDeleteCommand:
         assert result.exit_code == 0
         assert "Space 'space-1' deleted" in result.output
 
-    def test_delete_space_cancelled(
-        self, runner: CliRunner, mock_auth
-    ) -> None:
+    def test_delete_space_cancelled(self, runner: CliRunner, mock_auth) -> None:
         """Delete space cancelled by user."""
         result = runner.invoke(cli, ["spaces", "delete", "space-1"], input="n\n")
         assert result.exit_code == 0
@@ -218,9 +191,7 @@ class TestSpacesDeleteCommand:
 class TestSpacesMembersCommand:
     """Tests for spaces members command."""
 
-    def test_list_space_members(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_list_space_members(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """List space members."""
         httpx_mock.add_response(
             json={
@@ -241,18 +212,14 @@ class TestSpacesMembersCommand:
         """List members with pagination."""
         httpx_mock.add_response(json={"items": []})
 
-        result = runner.invoke(
-            cli, ["spaces", "members", "space-1", "-p", "2", "-l", "25"]
-        )
+        result = runner.invoke(cli, ["spaces", "members", "space-1", "-p", "2", "-l", "25"])
         assert result.exit_code == 0
 
 
 class TestSpacesMembersAddCommand:
     """Tests for spaces members-add command."""
 
-    def test_add_members_to_space(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_add_members_to_space(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Add members to space."""
         httpx_mock.add_response(json={"success": True})
 
@@ -262,9 +229,7 @@ class TestSpacesMembersAddCommand:
         assert result.exit_code == 0
         assert "Added 2 member(s)" in result.output
 
-    def test_add_members_with_role(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_add_members_with_role(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Add members with specific role."""
         httpx_mock.add_response(json={"success": True})
 
@@ -274,41 +239,95 @@ class TestSpacesMembersAddCommand:
         )
         assert result.exit_code == 0
 
+    def test_add_members_from_file_in_batches(
+        self, runner: CliRunner, httpx_mock, mock_auth
+    ) -> None:
+        """IDs from --file are combined with --user-ids and sent in batches."""
+        httpx_mock.add_response(json={"success": True}, is_reusable=True)
+
+        result = runner.invoke(
+            cli,
+            [
+                "spaces",
+                "members-add",
+                "space-1",
+                "-u",
+                "user-0",
+                "--file",
+                "-",
+                "--batch-size",
+                "2",
+            ],
+            input="user-1\n\nuser-2\nuser-3\n",
+        )
+        assert result.exit_code == 0
+        assert "Added 4 member(s) to space 'space-1' in 2 batches" in result.output
+        bodies = [json.loads(request.content) for request in httpx_mock.get_requests()]
+        assert [body["userIds"] for body in bodies] == [["user-0", "user-1"], ["user-2", "user-3"]]
+
+    def test_add_members_requires_ids(self, runner: CliRunner, mock_auth) -> None:
+        """Without --user-ids or --file the command fails before any request."""
+        result = runner.invoke(cli, ["spaces", "members-add", "space-1"])
+        assert result.exit_code == 1
+        assert "--user-ids or --file" in result.output
+
 
 class TestSpacesMembersRemoveCommand:
     """Tests for spaces members-remove command."""
 
-    def test_remove_member_from_space(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_remove_member_from_space(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Remove member from space."""
         httpx_mock.add_response(json={})
 
-        result = runner.invoke(
-            cli, ["spaces", "members-remove", "space-1", "--user-id", "user-1"]
-        )
+        result = runner.invoke(cli, ["spaces", "members-remove", "space-1", "--user-id", "user-1"])
         assert result.exit_code == 0
         assert "Removed user 'user-1'" in result.output
 
-    def test_remove_member_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_remove_member_not_found(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Remove member handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "User not in space"})
 
-        result = runner.invoke(
-            cli, ["spaces", "members-remove", "space-1", "-u", "nonexistent"]
-        )
+        result = runner.invoke(cli, ["spaces", "members-remove", "space-1", "-u", "nonexistent"])
         assert result.exit_code == 1
         assert "User not in space" in result.output
 
+    def test_remove_many_members(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+        """--user-ids removes every user and reports each one."""
+        for uid in ("u1", "u2", "u3"):
+            httpx_mock.add_response(match_json={"spaceId": "space-1", "userId": uid}, json={})
 
-class TestSpacesMembersChangeRoleCommand:
-    """Tests for spaces members-change-role command."""
+        result = runner.invoke(cli, ["spaces", "members-remove", "space-1", "-U", "u1, u2,u3"])
+        assert result.exit_code == 0
+        for uid in ("u1", "u2", "u3"):
+            assert f"Removed user '{uid}'" in result.output
 
-    def test_change_role_for_user(
+    def test_remove_many_members_reports_failures(
         self, runner: CliRunner, httpx_mock, mock_auth
     ) -> None:
+        """A failed removal is reported without stopping the others."""
+        httpx_mock.add_response(match_json={"spaceId": "space-1", "userId": "u1"}, json={})
+        httpx_mock.add_response(
+            match_json={"spaceId": "space-1", "userId": "u2"},
+            status_code=404,
+            json={"message": "User not in space"},
+        )
+
+        result = runner.invoke(cli, ["spaces", "members-remove", "space-1", "-U", "u1,u2"])
+        assert result.exit_code == 1
+        assert "Removed user 'u1'" in result.output
+        assert "Failed to remove user 'u2': User not in space" in result.output
+
+    def test_remove_member_requires_user(self, runner: CliRunner, mock_auth) -> None:
+        """One of --user-id or --user-ids is required."""
+        result = runner.invoke(cli, ["spaces", "members-remove", "space-1"])
+        assert result.exit_code == 1
+        assert "--user-id or --user-ids" in result.output
+
+
+class TestSpacesMembersChangeRoleCommand:
+    """Tests for spaces members-change-role command."""
+
+    def test_change_role_for_user(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Change role for a user."""
         httpx_mock.add_response(json={"success": True})
 
@@ -320,9 +339,7 @@ class TestSpacesMembersChangeRoleCommand:
         assert "Changed role for user 'user-1'" in result.output
         assert "to 'admin'" in result.output
 
-    def test_change_role_for_group(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_change_role_for_group(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Change role for a group."""
         httpx_mock.add_response(json={"success": True})
 
@@ -334,13 +351,9 @@ class TestSpacesMembersChangeRoleCommand:
         assert "Changed role for group 'group-1'" in result.output
         assert "to 'editor'" in result.output
 
-    def test_change_role_requires_user_or_group(
-        self, runner: CliRunner, mock_auth
-    ) -> None:
+    def test_change_role_requires_user_or_group(self, runner: CliRunner, mock_auth) -> None:
         """Change role requires --user-id or --group-id."""
-        result = runner.invoke(
-            cli, ["spaces", "members-change-role", "space-1", "--role", "admin"]
-        )
+        result = runner.invoke(cli, ["spaces", "members-change-role", "space-1", "--role", "admin"])
         assert result.exit_code == 1
         assert "Either --user-id or --group-id must be provided" in result.output
 
@@ -352,9 +365,7 @@ class TestSpacesMembersChangeRoleCommand:
         assert result.exit_code == 2
         assert "Missing option" in result.output or "--role" in result.output
 
-    def test_change_role_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_change_role_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Change role handles API error."""
         httpx_mock.add_response(status_code=400, json={"message": "Invalid role"})
 
@@ -15,7 +15,7 @@ def runner() -> CliRunner:
 
 
 @pytest.fixture
-def mock_auth(tmp_path):
+def mock_auth():
     """Mock authentication for tests."""
     config = {"url": "https://docs.example.com/api", "default_format": "json"}
     with patch("docmost.config.load_config", return_value=config):
@@ -42,9 +42,7 @@ class TestUsersMeCommand:
         assert "Test User" in result.output
         assert "test@example.com" in result.output
 
-    def test_current_user_auth_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_current_user_auth_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Current user handles auth error."""
         httpx_mock.add_response(status_code=401, json={"message": "Invalid token"})
 
@@ -60,9 +58,7 @@ class TestUsersUpdateCommand:
         """Update user name."""
         httpx_mock.add_response(json={"id": "user-1", "name": "New Name"})
 
-        result = runner.invoke(
-            cli, ["users", "update", "user-1", "--name", "New Name"]
-        )
+        result = runner.invoke(cli, ["users", "update", "user-1", "--name", "New Name"])
         assert result.exit_code == 0
         assert "User 'user-1' updated" in result.output
 
@@ -70,9 +66,7 @@ class TestUsersUpdateCommand:
         """Update user email."""
         httpx_mock.add_response(json={"id": "user-1"})
 
-        result = runner.invoke(
-            cli, ["users", "update", "user-1", "-e", "newemail@example.com"]
-        )
+        result = runner.invoke(cli, ["users", "update", "user-1", "-e", "newemail@example.com"])
         assert result.exit_code == 0
 
         request = httpx_mock.get_request()
@@ -85,9 +79,7 @@ class TestUsersUpdateCommand:
         result = runner.invoke(cli, ["users", "update", "user-1", "-r", "member"])
         assert result.exit_code == 0
 
-    def test_update_user_multiple_fields(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_user_multiple_fields(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Update multiple user fields."""
         httpx_mock.add_response(json={"id": "user-1"})
 
@@ -107,9 +99,7 @@ class TestUsersUpdateCommand:
         )
         assert result.exit_code == 0
 
-    def test_update_user_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_user_not_found(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Update user handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "User not found"})
 
@@ -117,9 +107,7 @@ class TestUsersUpdateCommand:
         assert result.exit_code == 1
         assert "User not found" in result.output
 
-    def test_update_user_permission_denied(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_user_permission_denied(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Update user handles permission denied."""
         httpx_mock.add_response(status_code=403, json={"message": "Permission denied"})
 
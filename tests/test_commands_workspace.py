@@ -1,5 +1,6 @@
 """Tests for workspace commands."""
 
+import json
 from unittest.mock import patch
 
 import pytest
@@ -15,7 +16,7 @@ def runner() -> CliRunner:
 
 
 @pytest.fixture
-def mock_auth(tmp_path):
+def mock_auth():
     """Mock authentication for tests."""
     config = {"url": "https://docs.example.com/api", "default_format": "json"}
     with patch("docmost.config.load_config", return_value=config):
@@ -40,9 +41,7 @@ class TestWorkspaceInfoCommand:
         assert result.exit_code == 0
         assert "My Workspace" in result.output
 
-    def test_workspace_info_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_workspace_info_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Workspace info handles error."""
         httpx_mock.add_response(status_code=500, json={"message": "Server error"})
 
@@ -67,9 +66,7 @@ class TestWorkspacePublicCommand:
         assert result.exit_code == 0
         assert "Public Workspace" in result.output
 
-    def test_workspace_public_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_workspace_public_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Workspace public handles error."""
         httpx_mock.add_response(status_code=500, json={"message": "Server error"})
 
@@ -80,30 +77,24 @@ class TestWorkspacePublicCommand:
 class TestWorkspaceUpdateCommand:
     """Tests for workspace update command."""
 
-    def test_update_workspace_name(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
-        """Update workspace name."""
-        httpx_mock.add_response(json={"id": "ws-1", "name": "New Name"})
+    def test_update_workspace_name(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
+        """Update workspace name; options that were not given are left out."""
+        httpx_mock.add_response(
+            match_json={"name": "New Name"}, json={"id": "ws-1", "name": "New Name"}
+        )
 
         result = runner.invoke(cli, ["workspace", "update", "--name", "New Name"])
         assert result.exit_code == 0
         assert "Workspace updated" in result.output
 
-    def test_update_workspace_description(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_workspace_description(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Update workspace description."""
         httpx_mock.add_response(json={"id": "ws-1"})
 
-        result = runner.invoke(
-            cli, ["workspace", "update", "-d", "New description"]
-        )
+        result = runner.invoke(cli, ["workspace", "update", "-d", "New description"])
         assert result.exit_code == 0
 
-    def test_update_workspace_logo(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_update_workspace_logo(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Update workspace logo."""
         httpx_mock.add_response(json={"id": "ws-1"})
 
@@ -116,9 +107,7 @@ class TestWorkspaceUpdateCommand:
 class TestWorkspaceMembersCommand:
     """Tests for workspace members command."""
 
-    def test_list_workspace_members(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_list_workspace_members(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """List workspace members."""
         httpx_mock.add_response(
             json={
@@ -158,9 +147,7 @@ class TestWorkspaceMembersCommand:
         self, runner: CliRunner, httpx_mock, mock_auth
     ) -> None:
         """List members handles 'members' key."""
-        httpx_mock.add_response(
-            json={"members": [{"id": "u1", "name": "User 1"}]}
-        )
+        httpx_mock.add_response(json={"members": [{"id": "u1", "name": "User 1"}]})
 
         result = runner.invoke(cli, ["workspace", "members"])
         assert result.exit_code == 0
@@ -169,9 +156,7 @@ class TestWorkspaceMembersCommand:
 class TestWorkspaceMembersChangeRoleCommand:
     """Tests for workspace members-change-role command."""
 
-    def test_change_member_role(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_change_member_role(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Change member role."""
         httpx_mock.add_response(json={})
 
@@ -193,9 +178,7 @@ class TestWorkspaceMembersChangeRoleCommand:
         assert result.exit_code == 0
         assert "Changed role for user 'user-456' to 'member'" in result.output
 
-    def test_change_member_role_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_change_member_role_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Change member role handles error."""
         httpx_mock.add_response(status_code=404, json={"message": "User not found"})
 
@@ -205,9 +188,7 @@ class TestWorkspaceMembersChangeRoleCommand:
         assert result.exit_code == 1
         assert "User not found" in result.output
 
-    def test_change_member_role_missing_role(
-        self, runner: CliRunner, mock_auth
-    ) -> None:
+    def test_change_member_role_missing_role(self, runner: CliRunner, mock_auth) -> None:
         """Change member role requires --role option."""
         result = runner.invoke(cli, ["workspace", "members-change-role", "user-123"])
         assert result.exit_code == 2
@@ -231,15 +212,11 @@ class TestWorkspaceInvitesListCommand:
         assert result.exit_code == 0
         assert "new@example.com" in result.output
 
-    def test_list_invites_pagination(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_list_invites_pagination(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """List invites with pagination."""
         httpx_mock.add_response(json={"items": []})
 
-        result = runner.invoke(
-            cli, ["workspace", "invites", "list", "-p", "2", "-l", "10"]
-        )
+        result = runner.invoke(cli, ["workspace", "invites", "list", "-p", "2", "-l", "10"])
         assert result.exit_code == 0
 
     def test_list_invites_handles_invitations_key(
@@ -276,9 +253,7 @@ class TestWorkspaceInvitesCreateCommand:
         assert result.exit_code == 0
         assert "Invited 2 user(s)" in result.output
 
-    def test_create_invite_single_email(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_create_invite_single_email(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Create invitation for single email."""
         httpx_mock.add_response(json={"success": True})
 
@@ -289,9 +264,37 @@ class TestWorkspaceInvitesCreateCommand:
         assert result.exit_code == 0
         assert "Invited 1 user(s)" in result.output
 
-    def test_create_invite_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
+    def test_create_invite_from_file_in_batches(
+        self, runner: CliRunner, httpx_mock, mock_auth, tmp_path
     ) -> None:
+        """Emails from --file are sent in --batch-size chunks."""
+        httpx_mock.add_response(json={"success": True}, is_reusable=True)
+        emails_file = tmp_path / "emails.txt"
+        emails_file.write_text("a@example.com\nb@example.com\nc@example.com\n")
+
+        result = runner.invoke(
+            cli,
+            [
+                "workspace",
+                "invites",
+                "create",
+                "--file",
+                str(emails_file),
+                "--batch-size",
+                "2",
+                "-r",
+                "member",
+            ],
+        )
+        assert result.exit_code == 0
+        assert "Invited 3 user(s) in 2 batches" in result.output
+        bodies = [json.loads(request.content) for request in httpx_mock.get_requests()]
+        assert [body["emails"] for body in bodies] == [
+            ["a@example.com", "b@example.com"],
+            ["c@example.com"],
+        ]
+
+    def test_create_invite_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Create invite handles error."""
         httpx_mock.add_response(status_code=400, json={"message": "Invalid email"})
 
@@ -313,9 +316,7 @@ class TestWorkspaceInvitesRevokeCommand:
         assert result.exit_code == 0
         assert "Invitation 'inv-123' revoked" in result.output
 
-    def test_revoke_invite_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_revoke_invite_not_found(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Revoke invite handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "Invitation not found"})
 
@@ -335,9 +336,7 @@ class TestWorkspaceInvitesResendCommand:
         assert result.exit_code == 0
         assert "Invitation 'inv-123' resent" in result.output
 
-    def test_resend_invite_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_resend_invite_not_found(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Resend invite handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "Invitation not found"})
 
@@ -345,9 +344,7 @@ class TestWorkspaceInvitesResendCommand:
         assert result.exit_code == 1
         assert "Invitation not found" in result.output
 
-    def test_resend_invite_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_resend_invite_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Resend invite handles server error."""
         httpx_mock.add_response(status_code=500, json={"message": "Server error"})
 
@@ -374,9 +371,7 @@ class TestWorkspaceInvitesInfoCommand:
         assert result.exit_code == 0
         assert "user@example.com" in result.output
 
-    def test_invite_info_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_invite_info_not_found(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Get invite info handles not found."""
         httpx_mock.add_response(status_code=404, json={"message": "Invitation not found"})
 
@@ -384,9 +379,7 @@ class TestWorkspaceInvitesInfoCommand:
         assert result.exit_code == 1
         assert "Invitation not found" in result.output
 
-    def test_invite_info_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_invite_info_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Get invite info handles server error."""
         httpx_mock.add_response(status_code=500, json={"message": "Server error"})
 
@@ -419,6 +412,20 @@ class TestWorkspaceInvitesAcceptCommand:
         assert "Invitation accepted" in result.output
         assert "John Doe" in result.output
 
+    def test_accept_invite_sends_no_authorization(
+        self, runner: CliRunner, httpx_mock, mock_auth
+    ) -> None:
+        """Accepting an invitation never sends the stored access token."""
+        httpx_mock.add_response(json={"success": True})
+
+        with patch("docmost.client.get_token", return_value="stored"):
+            result = runner.invoke(
+                cli,
+                ["workspace", "invites", "accept", "inv-123", "-n", "Jo", "-p", "pw", "-t", "abc"],
+            )
+        assert result.exit_code == 0
+        assert "Authorization" not in httpx_mock.get_request().headers
+
     def test_accept_invite_with_password_option(
         self, runner: CliRunner, httpx_mock, mock_auth
     ) -> None:
@@ -443,9 +450,7 @@ class TestWorkspaceInvitesAcceptCommand:
         assert result.exit_code == 0
         assert "Invitation accepted" in result.output
 
-    def test_accept_invite_short_options(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_accept_invite_short_options(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Accept invitation with short options."""
         httpx_mock.add_response(json={"success": True})
 
@@ -496,9 +501,7 @@ class TestWorkspaceInvitesAcceptCommand:
         assert b'"password":"testpass"' in request.content
         assert b'"token":"invtoken"' in request.content
 
-    def test_accept_invite_no_auth_header(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_accept_invite_no_auth_header(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Accept invitation does not send auth header."""
         httpx_mock.add_response(json={"success": True})
 
@@ -558,13 +561,9 @@ class TestWorkspaceInvitesAcceptCommand:
         assert result.exit_code == 2
         assert "Missing option" in result.output or "--token" in result.output
 
-    def test_accept_invite_invalid_token(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_accept_invite_invalid_token(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Accept invitation handles invalid token error."""
-        httpx_mock.add_response(
-            status_code=400, json={"message": "Invalid invitation token"}
-        )
+        httpx_mock.add_response(status_code=400, json={"message": "Invalid invitation token"})
 
         result = runner.invoke(
             cli,
@@ -584,13 +583,9 @@ class TestWorkspaceInvitesAcceptCommand:
         assert result.exit_code == 1
         assert "Invalid invitation token" in result.output
 
-    def test_accept_invite_not_found(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_accept_invite_not_found(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Accept invitation handles not found."""
-        httpx_mock.add_response(
-            status_code=404, json={"message": "Invitation not found"}
-        )
+        httpx_mock.add_response(status_code=404, json={"message": "Invitation not found"})
 
         result = runner.invoke(
             cli,
@@ -610,9 +605,7 @@ class TestWorkspaceInvitesAcceptCommand:
         assert result.exit_code == 1
         assert "Invitation not found" in result.output
 
-    def test_accept_invite_server_error(
-        self, runner: CliRunner, httpx_mock, mock_auth
-    ) -> None:
+    def test_accept_invite_server_error(self, runner: CliRunner, httpx_mock, mock_auth) -> None:
         """Accept invitation handles server error."""
         httpx_mock.add_response(status_code=500, json={"message": "Server error"})
 
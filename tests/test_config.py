@@ -5,6 +5,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import yaml
 
 from docmost.config import (
     CONFIG_DIR,
@@ -36,6 +37,15 @@ class TestGetConfigDir:
             assert test_dir.exists()
             assert result.exists()
 
+    def test_creates_directory_once(self, tmp_path) -> None:
+        """Repeated calls do not touch the filesystem again."""
+        test_dir = tmp_path / "cached"
+        with patch("docmost.config.CONFIG_DIR", test_dir):
+            get_config_dir()
+            with patch.object(Path, "mkdir") as mock_mkdir:
+                assert get_config_dir() == test_dir
+                mock_mkdir.assert_not_called()
+
 
 class TestLoadConfig:
     """Tests for load_config."""
@@ -100,6 +110,34 @@ default_space: space-123
             assert config["url"] is None
             assert config["default_format"] == "table"
 
+    def test_parses_config_file_once(self, tmp_path) -> None:
+        """Repeated loads of an unchanged file reuse the parsed result."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("url: https://first.com/api\n")
+        with patch("docmost.config.CONFIG_FILE", config_file):
+            with patch("yaml.load", wraps=yaml.load) as mock_load:
+                assert load_config()["url"] == "https://first.com/api"
+                assert load_config()["url"] == "https://first.com/api"
+                mock_load.assert_called_once()
+
+    def test_reloads_when_file_changes(self, tmp_path) -> None:
+        """An edit on disk (new mtime) is picked up by the next load."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("url: https://first.com/api\n")
+        with patch("docmost.config.CONFIG_FILE", config_file):
+            assert load_config()["url"] == "https://first.com/api"
+            config_file.write_text("url: https://second.com/api\n")
+            os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+            assert load_config()["url"] == "https://second.com/api"
+
+    def test_returned_config_is_independent_copy(self, tmp_path) -> None:
+        """Mutating a loaded config does not leak into later loads."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("url: https://file.com/api\n")
+        with patch("docmost.config.CONFIG_FILE", config_file):
+            load_config()["url"] = "https://mutated.com/api"
+            assert load_config()["url"] == "https://file.com/api"
+
 
 class TestSaveConfig:
     """Tests for save_config."""
@@ -122,6 +160,17 @@ class TestSaveConfig:
                 assert "https://test.com/api" in content
                 assert "plain" in content
 
+    def test_save_invalidates_cached_config(self, tmp_path) -> None:
+        """load_config sees values written by save_config."""
+        config_dir = tmp_path / ".config" / "docmost"
+        config_file = config_dir / "config.yaml"
+        with patch("docmost.config.CONFIG_DIR", config_dir):
+            with patch("docmost.config.CONFIG_FILE", config_file):
+                save_config({"url": "https://old.com/api"})
+                assert load_config()["url"] == "https://old.com/api"
+                save_config({"url": "https://new.com/api"})
+                assert load_config()["url"] == "https://new.com/api"
+
     def test_creates_config_dir_if_missing(self, tmp_path) -> None:
         """Creates config directory if it doesn't exist."""
         config_dir = tmp_path / "new_dir" / "docmost"
@@ -0,0 +1,71 @@
+"""Tests for the JSON codec shim."""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+from docmost import _json
+
+
+@pytest.fixture
+def stdlib_json(monkeypatch):
+    """Reload the shim with orjson and ujson unavailable."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "ujson", None)
+    yield importlib.reload(_json)
+    monkeypatch.undo()
+    importlib.reload(_json)
+
+
+class TestJsonCodec:
+    """Tests for dumps/loads."""
+
+    def test_dumps_returns_compact_bytes(self) -> None:
+        """dumps produces compact UTF-8 bytes."""
+        assert _json.dumps({"a": [1, 2]}) == b'{"a":[1,2]}'
+
+    def test_dumps_keeps_non_ascii(self) -> None:
+        """Non-ASCII text is encoded as UTF-8, not escaped."""
+        assert _json.dumps({"title": "Café"}) == '{"title":"Café"}'.encode()
+
+    def test_round_trip(self) -> None:
+        """loads accepts bytes and inverts dumps."""
+        data = {"items": [{"id": "1", "ok": True, "n": None}]}
+        assert _json.loads(_json.dumps(data)) == data
+        assert json.loads(_json.dumps(data)) == data
+
+    def test_stdlib_fallback_matches(self, stdlib_json) -> None:
+        """Without optional backends, output is the same compact UTF-8 bytes."""
+        assert stdlib_json.orjson is None and stdlib_json.ujson is None
+        assert stdlib_json.dumps({"title": "Café", "a": [1]}) == '{"title":"Café","a":[1]}'.encode()
+        assert stdlib_json.loads(b'{"a":1}') == {"a": 1}
+
+
+class TestDumpsIndented:
+    """Tests for dumps_indented."""
+
+    DATA = {"items": [{"id": "1", "tags": [], "meta": {}}, {"n": 1.5, "ok": None}], "empty": []}
+
+    def test_matches_stdlib_layout(self) -> None:
+        """Indentation and separators match json.dumps(indent=2)."""
+        expected = json.dumps(self.DATA, indent=2)
+        assert _json.dumps_indented(self.DATA) == expected
+
+    def test_non_serializable_uses_str(self) -> None:
+        """Datetimes and other objects are rendered with str()."""
+        from datetime import datetime
+
+        when = datetime(2024, 1, 2, 3, 4, 5)
+        assert _json.dumps_indented({"at": when}) == '{\n  "at": "2024-01-02 03:04:05"\n}'
+
+    def test_wide_integers(self) -> None:
+        """Integers beyond 64 bits fall back to the stdlib encoder."""
+        assert _json.dumps_indented([2**70]) == f"[\n  {2**70}\n]"
+
+    def test_stdlib_fallback_matches(self, stdlib_json) -> None:
+        """Without orjson, output is identical and keeps non-ASCII text."""
+        data = {**self.DATA, "title": "Café"}
+        assert stdlib_json.orjson is None
+        assert stdlib_json.dumps_indented(data) == json.dumps(data, indent=2, ensure_ascii=False)
@@ -8,20 +8,32 @@ import click
 import pytest
 from click.testing import CliRunner
 
+from docmost.client import DocmostError
 from docmost.output import (
+    LARGE_TABLE_ROWS,
     console,
     error,
     error_console,
     format_json,
     format_plain,
     format_table,
+    handle_docmost_errors,
     info,
     output,
+    output_stream,
     success,
+    unwrap_list,
     warning,
 )
 
 
+@pytest.fixture
+def tty():
+    """Pretend stdout and stderr are interactive terminals."""
+    with patch("docmost.output._is_tty", return_value=True):
+        yield
+
+
 class TestFormatJson:
     """Tests for JSON formatter."""
 
@@ -112,6 +124,28 @@ class TestFormatTable:
         with patch.object(console, "print"):
             format_table(data, columns=["id", "name"])
 
+    def test_row_cells_follow_columns(self) -> None:
+        """Cells follow column order, with blanks for missing keys."""
+        data = [{"name": "A", "id": "1"}, {"id": "2"}] * (LARGE_TABLE_ROWS // 2 + 1)
+        with patch("docmost.output._print_aligned") as mock_aligned:
+            format_table(data, columns=["id", "name"])
+            format_table(data, columns=["id"])
+        assert mock_aligned.call_args_list[0].args[0][:2] == [["1", "A"], ["2", ""]]
+        assert mock_aligned.call_args_list[1].args[0][:2] == [["1"], ["2"]]
+
+    @pytest.mark.parametrize(
+        ("data", "columns"),
+        [([{}], None), ([{"id": "1"}], [])],
+        ids=["row-without-keys", "explicit-empty-columns"],
+    )
+    def test_table_without_columns_prints_empty_table(self, data, columns) -> None:
+        """A table with no columns still prints, with one empty row per item."""
+        with patch.object(console, "print") as mock_print:
+            format_table(data, columns=columns)
+        table = mock_print.call_args.args[0]
+        assert table.columns == []
+        assert table.row_count == 1
+
     def test_formats_nested_values_as_json(self) -> None:
         """Nested values in table cells are JSON formatted."""
         data = [{"id": "1", "meta": {"key": "value"}}]
@@ -124,6 +158,19 @@ class TestFormatTable:
         with patch.object(console, "print"):
             format_table(data, columns=["id", "value"])
 
+    def test_large_table_prints_aligned_columns(self) -> None:
+        """Tables above LARGE_TABLE_ROWS bypass rich and align plain columns."""
+        data = [{"id": str(i), "name": "x" * (i % 3)} for i in range(LARGE_TABLE_ROWS + 1)]
+        data[0]["meta"] = {"k": 1}
+        with patch.object(console, "print") as mock_print, patch("click.echo") as mock_echo:
+            format_table(data, columns=["id", "meta", "name"])
+        mock_print.assert_not_called()
+        lines = [call.args[0] for call in mock_echo.call_args_list]
+        assert len(lines) == LARGE_TABLE_ROWS + 2
+        assert lines[0] == "id   meta      name"
+        assert lines[1] == '0    {"k": 1}  '
+        assert lines[2] == "1" + " " * 14 + "x"
+
 
 class TestOutput:
     """Tests for the main output function."""
@@ -132,9 +179,7 @@ class TestOutput:
         """Output with json format calls format_json."""
         runner = CliRunner()
         with runner.isolated_filesystem():
-            result = runner.invoke(
-                click.command()(lambda: output({"key": "value"}, fmt="json"))
-            )
+            result = runner.invoke(click.command()(lambda: output({"key": "value"}, fmt="json")))
             assert result.exit_code == 0
             assert '"key": "value"' in result.output
 
@@ -159,6 +204,12 @@ class TestOutput:
             assert "id: 1" in result.output
             assert "id: 2" in result.output
 
+    def test_plain_format_list_single_write(self) -> None:
+        """Plain list output is written at once, each record followed by a blank line."""
+        with patch("click.echo") as mock_echo:
+            output([{"id": "1", "tags": ["a"]}, {"id": "2"}], fmt="plain")
+        mock_echo.assert_called_once_with('id: 1\ntags: ["a"]\n\nid: 2\n\n', nl=False)
+
     def test_table_format_list(self) -> None:
         """Table format for list."""
         data = [{"id": "1", "name": "First"}]
@@ -169,9 +220,7 @@ class TestOutput:
         """Table format for single item falls back to plain."""
         runner = CliRunner()
         with runner.isolated_filesystem():
-            result = runner.invoke(
-                click.command()(lambda: output({"id": "1"}, fmt="table"))
-            )
+            result = runner.invoke(click.command()(lambda: output({"id": "1"}, fmt="table")))
             assert result.exit_code == 0
             assert "id: 1" in result.output
 
@@ -179,12 +228,11 @@ class TestOutput:
         """Unknown format defaults to JSON."""
         runner = CliRunner()
         with runner.isolated_filesystem():
-            result = runner.invoke(
-                click.command()(lambda: output({"key": "val"}, fmt="unknown"))
-            )
+            result = runner.invoke(click.command()(lambda: output({"key": "val"}, fmt="unknown")))
             assert result.exit_code == 0
             assert '"key": "val"' in result.output
 
+    @pytest.mark.usefixtures("tty")
     def test_passes_columns_to_table(self) -> None:
         """Columns parameter is passed to table formatter."""
         data = [{"id": "1", "name": "Test", "extra": "ignored"}]
@@ -193,9 +241,80 @@ class TestOutput:
             mock_table.assert_called_once_with(data, ["id", "name"])
 
 
+class TestOutputStream:
+    """Tests for output_stream."""
+
+    @pytest.mark.parametrize(
+        "data",
+        [[], [{"id": "1"}], [{"id": "1", "tags": ["a", "b"]}, {"id": "2", "meta": {"x": None}}]],
+    )
+    def test_json_matches_format_json(self, data: list) -> None:
+        """Streamed JSON is byte-identical to format_json of the whole list."""
+        with patch("click.echo") as mock_echo:
+            output_stream(iter(data), fmt="json")
+        streamed = "".join(
+            call.args[0] + ("" if call.kwargs.get("nl") is False else "\n")
+            for call in mock_echo.call_args_list
+        )
+        assert streamed == format_json(data) + "\n"
+
+    def test_plain_outputs_each_item(self) -> None:
+        """Plain format writes each item followed by a blank line."""
+        with patch("click.echo") as mock_echo:
+            output_stream(iter([{"id": "1"}, {"id": "2"}]), fmt="plain")
+        assert mock_echo.call_count == 4
+
+    @pytest.mark.usefixtures("tty")
+    def test_table_materializes_rows(self) -> None:
+        """Table format renders all rows through format_table."""
+        with patch("docmost.output.format_table") as mock_table:
+            output_stream(iter([{"id": "1"}]), fmt="table", columns=["id"])
+        mock_table.assert_called_once_with([{"id": "1"}], ["id"])
+
+
+class TestUnwrapList:
+    """Tests for unwrap_list."""
+
+    def test_list_is_returned_as_is(self) -> None:
+        """A list response is returned unchanged."""
+        data = [{"id": "1"}]
+        assert unwrap_list(data, "items", "pages") is data
+
+    def test_first_present_key_wins(self) -> None:
+        """Keys are tried in order."""
+        assert unwrap_list({"items": [1], "pages": [2]}, "items", "pages") == [1]
+        assert unwrap_list({"pages": [2]}, "items", "pages") == [2]
+
+    def test_falls_back_to_response(self) -> None:
+        """A dict without any key is returned unchanged."""
+        data = {"id": "1"}
+        assert unwrap_list(data, "items", "pages") is data
+
+
+class TestLazyConsoles:
+    """Tests for the lazily created rich consoles."""
+
+    def test_console_is_a_shared_singleton(self) -> None:
+        """Module attributes resolve to the same consoles the helpers use."""
+        import docmost.output as output_module
+
+        assert output_module.console is console
+        assert output_module.error_console is error_console
+        assert console is not error_console
+        assert error_console.stderr
+
+    def test_unknown_attribute_raises(self) -> None:
+        """Other missing attributes still raise AttributeError."""
+        import docmost.output as output_module
+
+        with pytest.raises(AttributeError):
+            _ = output_module.no_such_console
+
+
 class TestMessageHelpers:
     """Tests for success, error, warning, info helpers."""
 
+    @pytest.mark.usefixtures("tty")
     def test_success_prints_green_checkmark(self) -> None:
         """Success message has green checkmark."""
         with patch.object(console, "print") as mock_print:
@@ -205,6 +324,7 @@ class TestMessageHelpers:
             assert "[green]" in call_str
             assert "Done" in call_str
 
+    @pytest.mark.usefixtures("tty")
     def test_error_prints_red_x(self) -> None:
         """Error message has red X."""
         with patch.object(error_console, "print") as mock_print:
@@ -214,6 +334,7 @@ class TestMessageHelpers:
             assert "[red]" in call_str
             assert "Failed" in call_str
 
+    @pytest.mark.usefixtures("tty")
     def test_warning_prints_yellow_exclamation(self) -> None:
         """Warning message has yellow exclamation."""
         with patch.object(console, "print") as mock_print:
@@ -223,6 +344,7 @@ class TestMessageHelpers:
             assert "[yellow]" in call_str
             assert "Caution" in call_str
 
+    @pytest.mark.usefixtures("tty")
     def test_info_prints_blue_i(self) -> None:
         """Info message has blue info icon."""
         with patch.object(console, "print") as mock_print:
@@ -231,3 +353,65 @@ class TestMessageHelpers:
             call_str = str(mock_print.call_args)
             assert "[blue]" in call_str
             assert "Note" in call_str
+
+
+class TestNonTty:
+    """Output when stdout/stderr are pipes or files."""
+
+    def test_messages_are_plain_text(self) -> None:
+        """Helpers skip rich and echo unstyled text."""
+        with patch.object(console, "print") as mock_print, patch("click.echo") as mock_echo:
+            success("Done")
+            warning("Caution [x]")
+            info("Note")
+        mock_print.assert_not_called()
+        assert [c.args[0] for c in mock_echo.call_args_list] == [
+            "✓ Done",
+            "! Caution [x]",
+            "ℹ Note",
+        ]
+
+    def test_error_goes_to_stderr(self) -> None:
+        """Errors are echoed to stderr without markup."""
+        with patch.object(error_console, "print") as mock_print, patch("click.echo") as mock_echo:
+            error("Failed")
+        mock_print.assert_not_called()
+        mock_echo.assert_called_once_with("✗ Failed", err=True)
+
+    def test_table_falls_back_to_plain(self) -> None:
+        """Table format prints plain records instead of a rich table."""
+        data = [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}]
+        with patch("docmost.output.format_table") as mock_table, patch("click.echo") as mock_echo:
+            output(data, fmt="table")
+            output_stream(iter(data), fmt="table")
+        mock_table.assert_not_called()
+        echoed = "".join(c.args[0] for c in mock_echo.call_args_list if c.args)
+        assert echoed.count("id: 1\nname: A") == 2
+
+
+class TestHandleDocmostErrors:
+    """Tests for the handle_docmost_errors decorator."""
+
+    def test_returns_result(self) -> None:
+        """The wrapped function's result passes through."""
+
+        @handle_docmost_errors
+        def ok(value: int) -> int:
+            return value * 2
+
+        assert ok(3) == 6
+        assert ok.__name__ == "ok"
+
+    @pytest.mark.usefixtures("tty")
+    def test_reports_error_and_exits(self) -> None:
+        """A DocmostError is printed and turned into exit status 1."""
+
+        @handle_docmost_errors
+        def fail() -> None:
+            raise DocmostError("Page not found")
+
+        with patch.object(error_console, "print") as mock_print:
+            with pytest.raises(SystemExit) as exc_info:
+                fail()
+        assert exc_info.value.code == 1
+        assert "Page not found" in str(mock_print.call_args)